@@ -0,0 +1,799 @@
+"""
+Rule-based strike mission assessment engine
+
+project.py runs the interactive program on top of this package; installed,
+the same menu is the strike-assessment command.
+"""
+
+import functools
+import hashlib
+import itertools
+import os
+from array import array
+from types import MappingProxyType
+
+
+def main():
+    """Main program interface"""
+    print("=" * 60)
+    print("STRIKE MISSION ASSESSMENT SYSTEM")
+    print("=" * 60)
+    print()
+
+    while True:
+        print("Select an option:")
+        print("1. Assess Mission with Specific Aircraft")
+        print("2. Compare Aircraft Options")
+        print("3. Exit")
+
+        choice = input("\nEnter choice (1-3): ").strip()
+
+        if choice == "1":
+            assess_specific_mission()
+        elif choice == "2":
+            compare_aircraft_options()
+        elif choice == "3":
+            print("Mission planning complete. Stay safe out there.")
+            break
+        else:
+            print("Invalid choice. Please enter 1-3.")
+
+        print("\n" + "-" * 60 + "\n")
+
+
+def assess_specific_mission():
+    """Assess a mission with user-selected aircraft"""
+    print("\n=== MISSION ASSESSMENT ===")
+
+    # Get user selections
+    aircraft = select_aircraft()
+    target = select_target()
+    weather = select_weather()
+    time_of_day = select_time()
+
+    # Look up mission scores and rating
+    destruction_prob, civilian_risk, rating = get_mission_table().lookup(aircraft, target, weather, time_of_day)
+
+    # Generate and display report
+    generate_mission_report(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating)
+
+
+def compare_aircraft_options():
+    """Compare all aircraft for a specific mission"""
+    print("\n=== AIRCRAFT COMPARISON ===")
+
+    target = select_target()
+    weather = select_weather()
+    time_of_day = select_time()
+
+    print(render_aircraft_comparison(target, weather, time_of_day), end="")
+
+
+def select_aircraft():
+    """Display aircraft options and get user selection"""
+    aircraft_data = get_aircraft_data()
+
+    print("\nAvailable Aircraft:")
+    for i, (name, specs) in enumerate(aircraft_data.items(), 1):
+        stealth_str = "Stealth" if specs["stealth"] else "Non-stealth"
+        print(f"{i}. {name} - Precision: {specs['precision']}%, Payload: {specs['payload']}, {stealth_str}")
+
+    while True:
+        try:
+            choice = int(input("\nSelect aircraft (number): "))
+            aircraft_list = list(aircraft_data.keys())
+            if 1 <= choice <= len(aircraft_list):
+                return aircraft_list[choice - 1]
+            else:
+                print("Invalid choice. Please try again.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+
+def select_target():
+    """Display target options and get user selection"""
+    target_data = get_target_data()
+
+    print("\nAvailable Targets:")
+    for i, (name, specs) in enumerate(target_data.items(), 1):
+        print(f"{i}. {name.replace('_', ' ').title()} - Difficulty: {specs['difficulty']}/10, Civilian Risk: {specs['civilian_risk']}")
+
+    while True:
+        try:
+            choice = int(input("\nSelect target (number): "))
+            target_list = list(target_data.keys())
+            if 1 <= choice <= len(target_list):
+                return target_list[choice - 1]
+            else:
+                print("Invalid choice. Please try again.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+
+def select_weather():
+    """Display weather options and get user selection"""
+    weather_data = get_weather_data()
+
+    print("\nWeather Conditions:")
+    for i, (condition, specs) in enumerate(weather_data.items(), 1):
+        impact = "No impact" if specs["precision_modifier"] == 1.0 else f"{int((1-specs['precision_modifier'])*100)}% precision reduction"
+        print(f"{i}. {condition.replace('_', ' ').title()} - {impact}")
+
+    while True:
+        try:
+            choice = int(input("\nSelect weather (number): "))
+            weather_list = list(weather_data.keys())
+            if 1 <= choice <= len(weather_list):
+                return weather_list[choice - 1]
+            else:
+                print("Invalid choice. Please try again.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+
+def select_time():
+    """Display time options and get user selection"""
+    time_options = {
+        "early_morning": {"civilian_modifier": 0.2, "description": "02:00-06:00 (Minimal civilian activity)"},
+        "morning": {"civilian_modifier": 0.7, "description": "06:00-12:00 (Moderate civilian activity)"},
+        "afternoon": {"civilian_modifier": 1.0, "description": "12:00-18:00 (High civilian activity)"},
+        "evening": {"civilian_modifier": 0.8, "description": "18:00-22:00 (Moderate civilian activity)"},
+        "night": {"civilian_modifier": 0.4, "description": "22:00-02:00 (Low civilian activity)"}
+    }
+
+    print("\nTime of Day:")
+    for i, (time_key, specs) in enumerate(time_options.items(), 1):
+        print(f"{i}. {specs['description']}")
+
+    while True:
+        try:
+            choice = int(input("\nSelect time (number): "))
+            time_list = list(time_options.keys())
+            if 1 <= choice <= len(time_list):
+                return time_list[choice - 1]
+            else:
+                print("Invalid choice. Please try again.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+
+def calculate_mission_score(aircraft, target, weather, time_of_day):
+    """
+    Calculate target destruction probability and civilian risk percentage
+
+    Args:
+        aircraft (str): Selected aircraft type
+        target (str): Target type
+        weather (str): Weather conditions
+        time_of_day (str): Time of operation
+
+    Returns:
+        tuple: (destruction_probability, civilian_risk_percentage)
+    """
+    aircraft_specs = AIRCRAFT[AIRCRAFT_IDS[aircraft]]
+    target_specs = TARGETS[TARGET_IDS[target]]
+
+    # Base aircraft precision
+    base_precision = aircraft_specs.precision
+
+    # Weather impact on precision
+    weather_modifier = WEATHER[WEATHER_IDS[weather]].precision_modifier
+
+    # Target difficulty impact (precomputed in the registry)
+    difficulty_modifier = target_specs.difficulty_modifier
+
+    # Calculate destruction probability
+    destruction_prob = min(99.9, base_precision * weather_modifier * difficulty_modifier)
+
+    # Calculate civilian risk
+    base_civilian_risk = target_specs.civilian_risk_score
+    time_modifier = TIMES[TIME_IDS[time_of_day]].civilian_modifier
+    stealth_modifier = aircraft_specs.stealth_modifier
+
+    civilian_risk = min(95.0, base_civilian_risk * time_modifier * stealth_modifier)
+
+    return round(destruction_prob, 1), round(civilian_risk, 1)
+
+
+def assign_mission_rating(destruction_prob, civilian_risk):
+    """
+    Assign mission rating based on destruction probability and civilian risk
+
+    Args:
+        destruction_prob (float): Target destruction probability percentage
+        civilian_risk (float): Civilian risk percentage
+
+    Returns:
+        str: Mission rating (S, A, B, C, D, F)
+    """
+    # The first rule the mission breaks decides the rating
+    for rating, max_civilian_risk, min_destruction_prob in RATING_THRESHOLDS:
+        if civilian_risk > max_civilian_risk or destruction_prob < min_destruction_prob:
+            return rating
+
+    # S-Rank: Minimal risk, near-perfect success
+    return RATINGS[-1]
+
+
+def generate_mission_report(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating, file=None):
+    """
+    Generate detailed mission assessment report
+
+    Args:
+        file: Text stream to write to (default: sys.stdout); the report is written in one call
+    """
+    print(render_mission_report(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating), end="", file=file)
+
+
+# Report rendering
+# Everything in a report except the two scores depends only on the scenario,
+# the rating and the spec registry, so those fragments are rendered once and
+# kept in LRU caches keyed by the registry's content hash. Reports are returned
+# as whole strings, identical to the original line-by-line output.
+REPORT_CACHE_SIZE = 4096
+COMPARISON_CACHE_SIZE = 256
+
+RATING_EXPLANATIONS = {
+    "S-RANK": "EXCELLENT - Mission approved. Minimal risk, maximum effectiveness.",
+    "A-RANK": "VERY GOOD - Mission approved. Low risk, high effectiveness.",
+    "B-RANK": "GOOD - Mission approved. Acceptable risk levels.",
+    "C-RANK": "ACCEPTABLE - Requires senior approval. Moderate risk.",
+    "D-RANK": "POOR - Mission not recommended. High risk or low effectiveness.",
+    "F-RANK": "ABORT - Mission rejected. Unacceptable risk or failure probability."
+}
+
+# Ratings that get improvement recommendations
+POOR_RATINGS = ("C-RANK", "D-RANK", "F-RANK")
+
+
+@functools.lru_cache(maxsize=None)
+def display_name(name):
+    """Registry name as shown in reports ('nuclear_facility' -> 'Nuclear Facility')"""
+    return name.replace('_', ' ').title()
+
+
+def render_mission_report(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating):
+    """
+    Render the text generate_mission_report prints
+
+    Returns:
+        str: The full report, ending with a newline
+    """
+    poor = rating in POOR_RATINGS
+    head, tail = _report_fragments(
+        get_mission_table().spec_hash, aircraft, target, weather, time_of_day, rating,
+        poor and civilian_risk > 40, poor and destruction_prob < 80
+    )
+    return (f"{head}Target Destruction Probability: {destruction_prob}%\n"
+            f"Civilian Risk Assessment: {civilian_risk}%\n{tail}")
+
+
+@functools.lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _report_fragments(spec_hash, aircraft, target, weather, time_of_day, rating, high_civilian_risk, low_destruction):
+    """Report text before and after the score lines"""
+    head = (
+        f"\n{'=' * 60}\nMISSION ASSESSMENT REPORT\n{'=' * 60}\n"
+        f"Aircraft: {aircraft}\n"
+        f"Target: {display_name(target)}\n"
+        f"Weather: {display_name(weather)}\n"
+        f"Time: {display_name(time_of_day)}\n"
+        f"{'-' * 60}\n"
+    )
+
+    lines = [f"OVERALL MISSION RATING: {rating}", "-" * 60, f"Assessment: {RATING_EXPLANATIONS[rating]}"]
+
+    # Add recommendations if rating is poor
+    if rating in POOR_RATINGS:
+        lines.append("\nRECOMMENDATIONS FOR IMPROVEMENT:")
+        lines.extend(_recommendations(aircraft, target, weather, high_civilian_risk, low_destruction))
+
+    return head, "\n".join(lines) + "\n"
+
+
+def get_mission_recommendations(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating):
+    """
+    Improvement recommendations listed in the mission report
+
+    Returns:
+        tuple of str: One entry per '- ' line of the report (empty unless the rating is poor)
+    """
+    if rating not in POOR_RATINGS:
+        return ()
+    return _recommendations(aircraft, target, weather, civilian_risk > 40, destruction_prob < 80)
+
+
+def _recommendations(aircraft, target, weather, high_civilian_risk, low_destruction):
+    recommendations = []
+    if high_civilian_risk:
+        recommendations.append("- Consider operating during early morning hours (02:00-06:00)")
+        recommendations.append("- Use stealth aircraft to reduce civilian panic")
+    if low_destruction:
+        # Only suggest better weather if current weather isn't already clear
+        if weather != "clear":
+            recommendations.append("- Wait for better weather conditions")
+
+        aircraft_specs = AIRCRAFT[AIRCRAFT_IDS[aircraft]]
+
+        # Only suggest higher precision if not already using the most precise
+        if aircraft_specs.precision < 98:  # B-2 and NGAD-X are highest precision
+            recommendations.append("- Consider using higher-precision aircraft")
+
+        # For hardened targets, suggest heavy payload if not already using one
+        if target in ["nuclear_facility", "concrete_bunker"]:
+            if aircraft_specs.payload not in ["heavy", "very_heavy"]:
+                recommendations.append("- Consider using heavier payload aircraft or specialized bunker-buster munitions")
+            else:
+                recommendations.append("- Target is extremely hardened - even heavy munitions have limited effectiveness")
+                recommendations.append("- Consider multiple coordinated strikes or alternative objectives")
+    return tuple(recommendations)
+
+
+def render_aircraft_comparison(target, weather, time_of_day):
+    """
+    Render the mission parameters and aircraft comparison table compare_aircraft_options prints
+
+    Returns:
+        str: The table text, ending with a newline
+    """
+    return _comparison_text(get_mission_table().spec_hash, target, weather, time_of_day)
+
+
+@functools.lru_cache(maxsize=COMPARISON_CACHE_SIZE)
+def _comparison_text(spec_hash, target, weather, time_of_day):
+    target_specs = TARGETS[TARGET_IDS[target]]
+    lines = [
+        "\nMission Parameters:",
+        f"Target: {display_name(target)}",
+        f"Weather: {display_name(weather)}",
+        f"Time: {display_name(time_of_day)}",
+        # Add mission difficulty assessment
+        f"Target Difficulty: {target_specs.difficulty}/10",
+        f"Civilian Risk Level: {display_name(target_specs.civilian_risk)}",
+        "\nAircraft Comparison:",
+        "-" * 90,
+        f"{'Aircraft':<12} {'Rating':<8} {'Target %':<10} {'Civ Risk %':<12} {'Best For':<25}",
+        "-" * 90
+    ]
+
+    table = get_mission_table()
+    for aircraft_specs in AIRCRAFT:
+        dest_prob, civ_risk, rating = table.lookup(aircraft_specs.name, target, weather, time_of_day)
+        context = get_comparison_note(aircraft_specs, target_specs, rating)
+        lines.append(f"{aircraft_specs.name:<12} {rating:<8} {dest_prob:<10.1f} {civ_risk:<12.1f} {context:<25}")
+
+    return "\n".join(lines) + "\n"
+
+
+def get_comparison_note(aircraft_specs, target_specs, rating):
+    """'Best For' note of an aircraft in the comparison table"""
+    # Smart contextual notes
+    if aircraft_specs.stealth and target_specs.civilian_risk in ["high", "very_high"]:
+        return "Stealth advantage"
+    elif target_specs.difficulty >= 7 and aircraft_specs.payload in ["heavy", "very_heavy"]:
+        return "Heavy payload suitable"
+    elif aircraft_specs.precision >= 95:
+        return "High precision"
+    elif aircraft_specs.name == "A-10" and target_specs.difficulty <= 3:
+        return "Good for soft targets"
+    elif aircraft_specs.name == "AC-130" and target_specs.civilian_risk == "low":
+        return "Extended loiter time"
+    return get_aircraft_notes(aircraft_specs.name, rating)
+
+
+def find_optimal_aircraft(target, weather, time_of_day):
+    """
+    Find the best aircraft for given mission parameters
+
+    Returns:
+        tuple: (best_aircraft_name, best_rating, all_results_dict)
+    """
+    target_specs = TARGETS[TARGET_IDS[target]]
+    table = get_mission_table()
+    stride = len(TARGETS) * len(WEATHER) * len(TIMES)
+    scenario = pack_scenario(0, target_specs.id, WEATHER_IDS[weather], TIME_IDS[time_of_day])
+    results = {}
+    best_score = -1
+    best_aircraft = None
+    best_rating = None
+
+    for aircraft_specs in AIRCRAFT:
+        aircraft_name = aircraft_specs.name
+        index = scenario + aircraft_specs.id * stride
+        dest_prob, civ_risk, rating = table.destruction[index], table.civilian[index], RATINGS[table.ratings[index]]
+        results[aircraft_name] = (rating, dest_prob, civ_risk)
+
+        # Smart scoring: consider both rating and aircraft suitability
+        base_score = get_suitability_score(aircraft_specs, target_specs, rating)
+
+        if base_score > best_score:
+            best_score = base_score
+            best_aircraft = aircraft_name
+            best_rating = rating
+
+    return best_aircraft, best_rating, results
+
+
+def get_suitability_score(aircraft_specs, target_specs, rating):
+    """
+    Score an aircraft for a target: mission rating plus practical suitability
+
+    Args:
+        aircraft_specs (AircraftSpec): Registry record of the aircraft
+        target_specs (TargetSpec): Registry record of the target
+        rating (str): Mission rating for the scenario
+
+    Returns:
+        float: Score used by find_optimal_aircraft (higher is better)
+    """
+    rating_scores = {"S-RANK": 6, "A-RANK": 5, "B-RANK": 4, "C-RANK": 3, "D-RANK": 2, "F-RANK": 1}
+
+    aircraft_name = aircraft_specs.name
+    base_score = rating_scores[rating]
+
+    # Realistic limitations for B-2
+    if aircraft_name == "B-2":
+        # B-2 is expensive and rare - penalize for routine targets
+        if target_specs.name in ["wooden_house", "warehouse"]:
+            base_score -= 2  # Overkill for simple targets
+        # B-2 has limited availability
+        base_score -= 0.5  # Always slightly penalize due to scarcity
+
+    # NGAD-X is experimental - penalize for reliability
+    if aircraft_name == "NGAD-X":
+        base_score -= 1  # Experimental platform risk
+
+    # Bonus for appropriate aircraft-target matching
+
+    # A-10 excels at soft targets
+    if aircraft_name == "A-10" and target_specs.difficulty <= 3:
+        base_score += 1
+
+    # AC-130 excels at extended operations
+    if aircraft_name == "AC-130" and target_specs.civilian_risk == "low":
+        base_score += 0.8
+
+    # F-15E and F-35A are reliable workhorses
+    if aircraft_name in ["F-15E", "F-35A"] and target_specs.difficulty in [4, 5, 6]:
+        base_score += 0.5
+
+    # Stealth bonus for high civilian risk targets
+    if target_specs.civilian_risk in ["high", "very_high"] and aircraft_specs.stealth:
+        base_score += 0.5
+
+    # Payload bonus for difficult targets
+    if target_specs.difficulty >= 7:
+        if aircraft_specs.payload in ["heavy", "very_heavy"]:
+            base_score += 0.3
+
+    # Precision bonus for hardened targets
+    if target_specs.difficulty >= 8 and aircraft_specs.precision >= 95:
+        base_score += 0.2
+
+    return base_score
+
+
+# Data functions
+def get_aircraft_data():
+    """Return aircraft specifications"""
+    return _AIRCRAFT_VIEW
+
+
+def get_target_data():
+    """Return target specifications"""
+    return _TARGET_VIEW
+
+
+def get_weather_data():
+    """Return weather impact data"""
+    return _WEATHER_VIEW
+
+
+def get_time_data():
+    """Return time of day impact data"""
+    return _TIME_VIEW
+
+
+def get_civilian_risk_score(risk_level):
+    """Convert risk level to numerical score"""
+    risk_mapping = {
+        "very_low": 5,
+        "low": 15,
+        "medium": 35,
+        "high": 55,
+        "very_high": 75
+    }
+    return risk_mapping.get(risk_level, 50)
+
+
+def get_aircraft_notes(aircraft, rating):
+    """Get brief notes about aircraft performance"""
+    specs = AIRCRAFT[AIRCRAFT_IDS[aircraft]]
+
+    if rating in ["S-RANK", "A-RANK"]:
+        if specs.stealth:
+            return "Excellent/stealth"
+        else:
+            return "Excellent choice"
+    elif rating == "B-RANK":
+        if specs.precision >= 90:
+            return "Good/high precision"
+        else:
+            return "Good option"
+    elif rating == "C-RANK":
+        if specs.stealth:
+            return "Consider alternatives"
+        else:
+            return "Risky/non-stealth"
+    else:
+        if specs.precision < 80:
+            return "Low precision"
+        else:
+            return "Not recommended"
+
+
+# Spec registry
+# Built once at import. Hot functions read these records directly instead of
+# rebuilding the spec dicts, and get_*_data() return read-only views of them.
+class _Spec:
+    """Immutable spec record; subclasses list their fields in __slots__"""
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            object.__setattr__(self, field, fields[field])
+
+    def __setattr__(self, field, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, field):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class AircraftSpec(_Spec):
+    """Aircraft record; stealth_modifier is the civilian risk multiplier"""
+    __slots__ = ("id", "name", "precision", "payload", "stealth", "stealth_modifier")
+
+
+class TargetSpec(_Spec):
+    """Target record; civilian_risk_score and difficulty_modifier are precomputed"""
+    __slots__ = ("id", "name", "difficulty", "civilian_risk", "civilian_risk_score", "difficulty_modifier")
+
+
+class WeatherSpec(_Spec):
+    """Weather record"""
+    __slots__ = ("id", "name", "precision_modifier")
+
+
+class TimeSpec(_Spec):
+    """Time of day record"""
+    __slots__ = ("id", "name", "civilian_modifier")
+
+
+_AIRCRAFT_TABLE = {
+    "B-2": {"precision": 98, "payload": "very_heavy", "stealth": True},
+    "A-10": {"precision": 75, "payload": "heavy", "stealth": False},
+    "AC-130": {"precision": 88, "payload": "very_heavy", "stealth": False},
+    "Su-57": {"precision": 90, "payload": "medium", "stealth": True},
+    "Eurofighter": {"precision": 85, "payload": "medium", "stealth": False},
+    "F-22": {"precision": 95, "payload": "light", "stealth": True},
+    "F-15E": {"precision": 85, "payload": "heavy", "stealth": False},
+    "F-35A": {"precision": 95, "payload": "medium", "stealth": True},
+    "NGAD-X": {"precision": 99, "payload": "medium", "stealth": True}
+}
+
+_TARGET_TABLE = {
+    "wooden_house": {"difficulty": 1, "civilian_risk": "very_high"},
+    "concrete_bunker": {"difficulty": 8, "civilian_risk": "low"},
+    "nuclear_facility": {"difficulty": 9, "civilian_risk": "very_high"},
+    "military_base": {"difficulty": 6, "civilian_risk": "medium"},
+    "bridge": {"difficulty": 4, "civilian_risk": "low"},
+    "command_center": {"difficulty": 7, "civilian_risk": "medium"},
+    "warehouse": {"difficulty": 3, "civilian_risk": "high"}
+}
+
+_WEATHER_TABLE = {
+    "clear": {"precision_modifier": 1.0},
+    "light_rain": {"precision_modifier": 0.9},
+    "heavy_rain": {"precision_modifier": 0.7},
+    "windy": {"precision_modifier": 0.85},
+    "storm": {"precision_modifier": 0.5},
+    "fog": {"precision_modifier": 0.6}
+}
+
+_TIME_TABLE = {
+    "early_morning": {"civilian_modifier": 0.2},
+    "morning": {"civilian_modifier": 0.7},
+    "afternoon": {"civilian_modifier": 1.0},
+    "evening": {"civilian_modifier": 0.8},
+    "night": {"civilian_modifier": 0.4}
+}
+
+AIRCRAFT = tuple(
+    AircraftSpec(id=i, name=name, precision=specs["precision"], payload=specs["payload"], stealth=specs["stealth"],
+                 stealth_modifier=0.7 if specs["stealth"] else 1.0)  # Stealth reduces detection/civilian panic
+    for i, (name, specs) in enumerate(_AIRCRAFT_TABLE.items())
+)
+TARGETS = tuple(
+    TargetSpec(id=i, name=name, difficulty=specs["difficulty"], civilian_risk=specs["civilian_risk"],
+               civilian_risk_score=get_civilian_risk_score(specs["civilian_risk"]),
+               difficulty_modifier=max(0.3, 1.0 - (specs["difficulty"] * 0.08)))  # Harder targets reduce success
+    for i, (name, specs) in enumerate(_TARGET_TABLE.items())
+)
+WEATHER = tuple(
+    WeatherSpec(id=i, name=name, precision_modifier=specs["precision_modifier"])
+    for i, (name, specs) in enumerate(_WEATHER_TABLE.items())
+)
+TIMES = tuple(
+    TimeSpec(id=i, name=name, civilian_modifier=specs["civilian_modifier"])
+    for i, (name, specs) in enumerate(_TIME_TABLE.items())
+)
+
+# Name -> ID indexes
+AIRCRAFT_IDS = {spec.name: spec.id for spec in AIRCRAFT}
+TARGET_IDS = {spec.name: spec.id for spec in TARGETS}
+WEATHER_IDS = {spec.name: spec.id for spec in WEATHER}
+TIME_IDS = {spec.name: spec.id for spec in TIMES}
+
+AIRCRAFT_NAMES = tuple(AIRCRAFT_IDS)
+TARGET_NAMES = tuple(TARGET_IDS)
+WEATHER_NAMES = tuple(WEATHER_IDS)
+TIME_NAMES = tuple(TIME_IDS)
+
+
+def _read_only_view(table):
+    """Wrap a nested spec table in read-only mappings"""
+    return MappingProxyType({name: MappingProxyType(dict(specs)) for name, specs in table.items()})
+
+
+_AIRCRAFT_VIEW = _read_only_view(_AIRCRAFT_TABLE)
+_TARGET_VIEW = _read_only_view(_TARGET_TABLE)
+_WEATHER_VIEW = _read_only_view(_WEATHER_TABLE)
+_TIME_VIEW = _read_only_view(_TIME_TABLE)
+
+
+# Mission table
+# The scenario space is small (aircraft x targets x weather x times), so every
+# score and rating is computed once and served by index. The table records a
+# content hash of the spec registry and is rebuilt whenever the specs change.
+RATINGS = ("F-RANK", "D-RANK", "C-RANK", "B-RANK", "A-RANK", "S-RANK")
+RATING_CODES = {rating: code for code, rating in enumerate(RATINGS)}
+
+# Rating rules, worst first: (rating, highest civilian risk, lowest destruction
+# probability) a mission must stay within to rate above it. Missions within every
+# rule are S-RANK. The risk limits fall and the success limits rise from row to row.
+RATING_THRESHOLDS = (
+    ("F-RANK", 80, 40),  # Unacceptable civilian risk or very low success
+    ("D-RANK", 60, 60),  # High civilian risk or low success
+    ("C-RANK", 40, 75),  # Moderate risk, acceptable success
+    ("B-RANK", 20, 85),  # Low risk, good success
+    ("A-RANK", 5, 95),   # Very low risk, high success
+)
+
+_MISSION_TABLE_MAGIC = b"MISSION-TABLE 1\n"
+
+
+def get_spec_hash():
+    """Return a SHA-256 content hash of the spec registry"""
+    digest = hashlib.sha256()
+    for records in (AIRCRAFT, TARGETS, WEATHER, TIMES):
+        digest.update(repr(records).encode())
+    return digest.hexdigest()
+
+
+def pack_scenario(aircraft_id, target_id, weather_id, time_id):
+    """Pack registry IDs into a single scenario index (itertools.product order)"""
+    return ((aircraft_id * len(TARGETS) + target_id) * len(WEATHER) + weather_id) * len(TIMES) + time_id
+
+
+class MissionTable:
+    """Destruction probability, civilian risk and rating for every scenario"""
+    __slots__ = ("spec_hash", "destruction", "civilian", "ratings")
+
+    def __init__(self, spec_hash, destruction, civilian, ratings):
+        self.spec_hash = spec_hash
+        self.destruction = destruction  # array("d") indexed by pack_scenario()
+        self.civilian = civilian  # array("d") indexed by pack_scenario()
+        self.ratings = ratings  # bytes of RATINGS codes indexed by pack_scenario()
+
+    def __len__(self):
+        return len(self.ratings)
+
+    def lookup(self, aircraft, target, weather, time_of_day):
+        """
+        Return (destruction_probability, civilian_risk, rating) for a scenario
+
+        Same values as calculate_mission_score() plus assign_mission_rating().
+        """
+        index = pack_scenario(AIRCRAFT_IDS[aircraft], TARGET_IDS[target], WEATHER_IDS[weather], TIME_IDS[time_of_day])
+        return self.destruction[index], self.civilian[index], RATINGS[self.ratings[index]]
+
+    def save(self, path):
+        """Write the table to a binary cache file"""
+        with open(path, "wb") as file:
+            file.write(_MISSION_TABLE_MAGIC)
+            file.write(self.spec_hash.encode() + b"\n")
+            self.destruction.tofile(file)
+            self.civilian.tofile(file)
+            file.write(self.ratings)
+
+    @classmethod
+    def load(cls, path, spec_hash):
+        """Read a cached table, or return None if it is missing or was built from other specs"""
+        size = len(AIRCRAFT) * len(TARGETS) * len(WEATHER) * len(TIMES)
+        try:
+            with open(path, "rb") as file:
+                if file.readline() != _MISSION_TABLE_MAGIC:
+                    return None
+                if file.readline().strip().decode() != spec_hash:
+                    return None
+                destruction = array("d")
+                destruction.fromfile(file, size)
+                civilian = array("d")
+                civilian.fromfile(file, size)
+                ratings = file.read(size)
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+        if len(ratings) != size:
+            return None
+        return cls(spec_hash, destruction, civilian, ratings)
+
+
+def build_mission_table():
+    """Score every scenario with the rule-based formula"""
+    destruction = array("d")
+    civilian = array("d")
+    ratings = bytearray()
+
+    for aircraft, target, weather, time_of_day in itertools.product(AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES):
+        dest_prob, civ_risk = calculate_mission_score(aircraft, target, weather, time_of_day)
+        destruction.append(dest_prob)
+        civilian.append(civ_risk)
+        ratings.append(RATING_CODES[assign_mission_rating(dest_prob, civ_risk)])
+
+    return MissionTable(get_spec_hash(), destruction, civilian, bytes(ratings))
+
+
+_mission_table = None
+_mission_table_registry = None
+
+
+def get_mission_table(cache_path=None):
+    """
+    Return the shared mission table, building it on first use
+
+    Args:
+        cache_path (str): Optional file used to reuse the table across processes
+
+    Returns:
+        MissionTable matching the current spec registry
+    """
+    global _mission_table, _mission_table_registry
+
+    # Registry records are immutable, so the same objects mean the same content
+    registry = (AIRCRAFT, TARGETS, WEATHER, TIMES)
+    if _mission_table is not None and all(a is b for a, b in zip(registry, _mission_table_registry)):
+        return _mission_table
+
+    spec_hash = get_spec_hash()
+    table = _mission_table if _mission_table is not None and _mission_table.spec_hash == spec_hash else None
+
+    if table is None and cache_path and os.path.exists(cache_path):
+        table = MissionTable.load(cache_path, spec_hash)
+
+    if table is None:
+        table = build_mission_table()
+        if cache_path:
+            try:
+                os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+                table.save(cache_path)
+            except OSError:
+                pass  # Cache is optional
+
+    _mission_table = table
+    _mission_table_registry = registry
+    return table
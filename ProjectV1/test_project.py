@@ -3,7 +3,10 @@ Test file for Strike Mission Assessment System
 CS50P Final Project Tests
 """
 
+import io
+import itertools
 import pytest
+import fighter_jet_rules
 from project import (
     calculate_mission_score,
     assign_mission_rating,
@@ -11,7 +14,19 @@ from project import (
     get_aircraft_data,
     get_target_data,
     get_weather_data,
-    get_civilian_risk_score
+    get_civilian_risk_score,
+    AIRCRAFT,
+    AIRCRAFT_IDS,
+    TARGETS,
+    TARGET_IDS,
+    AircraftSpec,
+    MissionTable,
+    get_mission_table,
+    get_spec_hash,
+    generate_mission_report,
+    render_mission_report,
+    get_mission_recommendations,
+    render_aircraft_comparison
 )
 
 
@@ -206,6 +221,124 @@ def test_realistic_aircraft_selection():
     assert recommended_specs["precision"] >= 80 or recommended_specs["payload"] in ["heavy", "very_heavy"]
 
 
+def test_spec_registry():
+    """Test the interned spec registry and the read-only data views"""
+    # IDs follow the data table order and the indexes point back at the records
+    assert [spec.name for spec in AIRCRAFT] == list(get_aircraft_data().keys())
+    for spec in AIRCRAFT:
+        assert AIRCRAFT_IDS[spec.name] == spec.id
+        assert spec.precision == get_aircraft_data()[spec.name]["precision"]
+
+    # Precomputed columns match the functions they replace
+    for spec in TARGETS:
+        assert spec.civilian_risk_score == get_civilian_risk_score(spec.civilian_risk)
+    assert TARGETS[TARGET_IDS["nuclear_facility"]].difficulty_modifier == max(0.3, 1.0 - 9 * 0.08)
+
+    # Records and views are immutable and shared between calls
+    with pytest.raises(AttributeError):
+        AIRCRAFT[0].precision = 50
+    with pytest.raises(TypeError):
+        get_aircraft_data()["B-2"]["precision"] = 50
+    assert get_target_data() is get_target_data()
+
+
+def test_mission_table_matches_formula():
+    """Test that the precomputed table agrees with the formula on every scenario"""
+    table = get_mission_table()
+    assert len(table) == 9 * 7 * 6 * 5
+
+    for scenario in itertools.product(get_aircraft_data(), get_target_data(), get_weather_data(), fighter_jet_rules.get_time_data()):
+        dest_prob, civ_risk = calculate_mission_score(*scenario)
+        assert table.lookup(*scenario) == (dest_prob, civ_risk, assign_mission_rating(dest_prob, civ_risk))
+
+
+def test_mission_table_rebuilds_on_spec_change(monkeypatch, tmp_path):
+    """Test that the table and its cache file follow the spec content hash"""
+    cache_path = tmp_path / "mission_table.bin"
+    original = get_mission_table()
+    original.save(cache_path)
+    assert MissionTable.load(cache_path, get_spec_hash()).ratings == original.ratings
+
+    # Same content in new objects reuses the table
+    monkeypatch.setattr(fighter_jet_rules, "TIMES", tuple(fighter_jet_rules.TIMES))
+    assert get_mission_table(cache_path) is original
+
+    # Changed content rebuilds, and the stale cache is ignored
+    upgraded = tuple(
+        AircraftSpec(id=spec.id, name=spec.name, precision=99 if spec.name == "A-10" else spec.precision,
+                     payload=spec.payload, stealth=spec.stealth, stealth_modifier=spec.stealth_modifier)
+        for spec in AIRCRAFT
+    )
+    monkeypatch.setattr(fighter_jet_rules, "AIRCRAFT", upgraded)
+    assert MissionTable.load(cache_path, get_spec_hash()) is None
+
+    rebuilt = get_mission_table(cache_path)
+    assert rebuilt.spec_hash != original.spec_hash
+    assert rebuilt.lookup("A-10", "bridge", "clear", "night") == (67.3, 6.0, "C-RANK")
+    assert MissionTable.load(cache_path, rebuilt.spec_hash).ratings == rebuilt.ratings
+    monkeypatch.undo()
+    assert get_mission_table().spec_hash == original.spec_hash
+
+
+def test_mission_report_text(capsys):
+    """Test the rendered report text, printed and written to a stream"""
+    expected = (
+        "\n" + "=" * 60 + "\n"
+        "MISSION ASSESSMENT REPORT\n" + "=" * 60 + "\n"
+        "Aircraft: F-15E\n"
+        "Target: Concrete Bunker\n"
+        "Weather: Heavy Rain\n"
+        "Time: Afternoon\n" + "-" * 60 + "\n"
+        "Target Destruction Probability: 21.4%\n"
+        "Civilian Risk Assessment: 15.0%\n"
+        "OVERALL MISSION RATING: F-RANK\n" + "-" * 60 + "\n"
+        "Assessment: ABORT - Mission rejected. Unacceptable risk or failure probability.\n"
+        "\n"
+        "RECOMMENDATIONS FOR IMPROVEMENT:\n"
+        "- Wait for better weather conditions\n"
+        "- Consider using higher-precision aircraft\n"
+        "- Target is extremely hardened - even heavy munitions have limited effectiveness\n"
+        "- Consider multiple coordinated strikes or alternative objectives\n"
+    )
+    scenario = ("F-15E", "concrete_bunker", "heavy_rain", "afternoon")
+    assert render_mission_report(*scenario, 21.4, 15.0, "F-RANK") == expected
+
+    generate_mission_report(*scenario, 21.4, 15.0, "F-RANK")
+    assert capsys.readouterr().out == expected
+
+    stream = io.StringIO()
+    generate_mission_report(*scenario, 21.4, 15.0, "F-RANK", file=stream)
+    assert stream.getvalue() == expected
+
+    # Good ratings get no recommendations
+    assert "RECOMMENDATIONS" not in render_mission_report("B-2", "warehouse", "clear", "night", 99.0, 1.0, "S-RANK")
+    assert get_mission_recommendations("B-2", "warehouse", "clear", "night", 99.0, 1.0, "S-RANK") == ()
+
+    # The structured recommendations are the report's '- ' lines
+    recommendations = get_mission_recommendations(*scenario, 21.4, 15.0, "F-RANK")
+    assert list(recommendations) == [line for line in expected.splitlines() if line.startswith("- ")]
+
+
+def test_aircraft_comparison_table(monkeypatch):
+    """Test the comparison table rows and that cached tables follow spec changes"""
+    lines = render_aircraft_comparison("bridge", "clear", "night").splitlines()
+    assert lines[1:7] == ["Mission Parameters:", "Target: Bridge", "Weather: Clear", "Time: Night",
+                          "Target Difficulty: 4/10", "Civilian Risk Level: Low"]
+    rows = {line.split()[0]: line.split()[1:] for line in lines[-len(AIRCRAFT):]}
+    assert rows["B-2"] == ["C-RANK", "66.6", "4.2", "High", "precision"]
+    assert rows["AC-130"] == ["D-RANK", "59.8", "6.0", "Extended", "loiter", "time"]
+    assert rows["A-10"] == ["D-RANK", "51.0", "6.0", "Low", "precision"]
+
+    upgraded = tuple(
+        AircraftSpec(id=spec.id, name=spec.name, precision=99 if spec.name == "A-10" else spec.precision,
+                     payload=spec.payload, stealth=spec.stealth, stealth_modifier=spec.stealth_modifier)
+        for spec in AIRCRAFT
+    )
+    monkeypatch.setattr(fighter_jet_rules, "AIRCRAFT", upgraded)
+    lines = render_aircraft_comparison("bridge", "clear", "night").splitlines()
+    assert lines[-len(AIRCRAFT):][1].split() == ["A-10", "C-RANK", "67.3", "6.0", "High", "precision"]
+
+
 if __name__ == "__main__":
     # Run tests if script is executed directly
     pytest.main([__file__])
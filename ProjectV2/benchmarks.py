@@ -0,0 +1,397 @@
+"""
+Performance benchmarks for scoring, data generation, feature preparation,
+training and inference
+
+Run from the ProjectV2 directory with ProjectV1 and ProjectV2 installed (pip install -e):
+    python benchmarks.py                          # every case, JSON to benchmark_results.json
+    python benchmarks.py --filter generate --max-rows 1000000
+    python benchmarks.py --save-baseline          # store the results as the baseline
+    python benchmarks.py --baseline benchmark_baseline.json --threshold 0.15
+
+Results are compared by median time against the baseline (when the file
+exists); any case slower by more than the threshold is reported as a
+regression and the exit status is 1.
+"""
+
+import argparse
+import fnmatch
+import functools
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+import numpy as np
+from fighter_jet.scoring import AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES
+
+# Every scenario, and every (target, weather, time) optimal-aircraft query
+GRID_ROWS = len(AIRCRAFT_NAMES) * len(TARGET_NAMES) * len(WEATHER_NAMES) * len(TIME_NAMES)
+QUERY_ROWS = len(TARGET_NAMES) * len(WEATHER_NAMES) * len(TIME_NAMES)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS = os.path.join(HERE, "benchmark_results.json")
+DEFAULT_BASELINE = os.path.join(HERE, "benchmark_baseline.json")
+
+# Fractional slowdown of the median time that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Case name -> Benchmark, in registration order
+BENCHMARKS = {}
+
+
+class Benchmark:
+    """
+    One tracked case: setup() builds the inputs and returns the callable that is timed
+
+    Args:
+        name: Unique case name, e.g. 'generate_training_data[1000000]'
+        group: What is measured (scoring, optimal, generate, features, train, inference, startup)
+        rows: Rows processed per call (for rows/s)
+        setup: Zero-argument function returning the zero-argument callable to time
+        max_runs: Upper bound on timed calls (keeps the slow cases affordable)
+        warmup: Make one untimed call first
+    """
+
+    def __init__(self, name, group, rows, setup, max_runs=100, warmup=True):
+        self.name = name
+        self.group = group
+        self.rows = rows
+        self.setup = setup
+        self.max_runs = max_runs
+        self.warmup = warmup
+
+
+def benchmark(group, sizes, max_runs=100, warmup=True):
+    """
+    Register a setup function as one case per size, named '<function>[<size>]'
+
+    The decorated function takes the number of rows and returns the callable to time.
+    """
+    def register(setup):
+        for size in sizes:
+            name = f"{setup.__name__}[{size}]"
+            BENCHMARKS[name] = Benchmark(name, group, size, functools.partial(setup, size), max_runs, warmup)
+        return setup
+    return register
+
+
+def time_call(function, min_runs=3, max_runs=100, min_time=1.0, warmup=True):
+    """
+    Time repeated calls
+
+    Calls are repeated until at least min_runs calls and min_time seconds, or max_runs calls.
+
+    Returns:
+        list of per-call seconds
+    """
+    if warmup:
+        function()
+    times = []
+    while len(times) < max_runs and (len(times) < min_runs or sum(times) < min_time):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _grid_codes(rows):
+    """Registry codes of `rows` scenarios, cycling through the grid"""
+    from fighter_jet.compiled_forest import grid_codes
+
+    return tuple(np.resize(codes, rows) for codes in grid_codes())
+
+
+def _query_codes(rows):
+    """(target, weather, time) codes of `rows` optimal-aircraft queries, cycling through every query"""
+    shape = (len(TARGET_NAMES), len(WEATHER_NAMES), len(TIME_NAMES))
+    return tuple(np.resize(codes.ravel(), rows) for codes in np.indices(shape, dtype=np.intp))
+
+
+@functools.lru_cache(maxsize=None)
+def _training_data(rows):
+    """Feature matrix and targets for `rows` generated rows"""
+    from fighter_jet.data_generator import generate_training_data
+    from fighter_jet.ml_models import prepare_features
+
+    df = generate_training_data(rows, replicates=math.ceil(rows / GRID_ROWS))
+    return df, prepare_features(df)
+
+
+@functools.lru_cache(maxsize=None)
+def _trained_forests():
+    """Random forests fitted on the full grid, as ml_models trains them"""
+    from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+
+    _, (X, y_dest, y_civ, y_rating) = _training_data(GRID_ROWS)
+    regressor = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1)
+    regressor.fit(X, np.column_stack([y_dest, y_civ]))
+    classifier = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=1)
+    classifier.fit(X, y_rating)
+    return regressor, classifier
+
+
+@benchmark("scoring", sizes=(GRID_ROWS,))
+def score_scalar(rows):
+    from fighter_jet.utils import calculate_mission_score
+
+    names = (AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES)
+    scenarios = list(zip(*(np.asarray(column_names)[codes].tolist() for column_names, codes in zip(names, _grid_codes(rows)))))
+    return lambda: [calculate_mission_score(*scenario) for scenario in scenarios]
+
+
+@benchmark("scoring", sizes=(GRID_ROWS, 1000000))
+def score_batch(rows):
+    from fighter_jet.scoring import calculate_mission_scores
+
+    codes = _grid_codes(rows)
+    return lambda: calculate_mission_scores(*codes)
+
+
+@benchmark("scoring", sizes=(1000000,))
+def rate_batch(rows):
+    from fighter_jet.scoring import calculate_mission_scores, assign_mission_ratings
+
+    destruction, civilian = calculate_mission_scores(*_grid_codes(rows))
+    return lambda: assign_mission_ratings(destruction, civilian)
+
+
+@benchmark("optimal", sizes=(QUERY_ROWS,))
+def optimal_scalar(rows):
+    from fighter_jet.utils import find_optimal_aircraft
+
+    names = (TARGET_NAMES, WEATHER_NAMES, TIME_NAMES)
+    queries = list(zip(*(np.asarray(column_names)[codes].tolist() for column_names, codes in zip(names, _query_codes(rows)))))
+    return lambda: [find_optimal_aircraft(*query) for query in queries]
+
+
+@benchmark("optimal", sizes=(QUERY_ROWS, 1000000))
+def optimal_batch(rows):
+    from fighter_jet.scoring import find_optimal_aircraft_batch
+
+    codes = _query_codes(rows)
+    return lambda: find_optimal_aircraft_batch(*codes)
+
+
+@benchmark("generate", sizes=(1000, 1000000, 10000000), max_runs=5, warmup=False)
+def generate_training_data(rows):
+    from fighter_jet.data_generator import generate_training_data
+
+    replicates = math.ceil(rows / GRID_ROWS)
+
+    def run():
+        generate_training_data(rows, replicates=replicates)
+    return run
+
+
+@benchmark("features", sizes=(GRID_ROWS, 1000000), max_runs=20)
+def prepare_features(rows):
+    from fighter_jet.ml_models import prepare_features
+
+    df, _ = _training_data(rows)
+
+    def run():
+        prepare_features(df)
+    return run
+
+
+@benchmark("train", sizes=(GRID_ROWS,), max_runs=5, warmup=False)
+def train_forest_regression(rows):
+    from sklearn.ensemble import RandomForestRegressor
+
+    _, (X, y_dest, y_civ, _) = _training_data(rows)
+    Y = np.column_stack([y_dest, y_civ])
+    return lambda: RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1).fit(X, Y)
+
+
+@benchmark("train", sizes=(GRID_ROWS,), max_runs=5, warmup=False)
+def train_forest_rating(rows):
+    from sklearn.ensemble import RandomForestClassifier
+
+    _, (X, _, _, y_rating) = _training_data(rows)
+    return lambda: RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=1).fit(X, y_rating)
+
+
+def _predictor_call(backend, rows):
+    from fighter_jet.predictor import Predictor
+
+    predictor = Predictor(*_trained_forests(), backend=backend)
+    codes = _grid_codes(rows)
+    return lambda: predictor.predict(*codes)
+
+
+@benchmark("inference", sizes=(1, 10000), max_runs=200)
+def predict_sklearn(rows):
+    return _predictor_call('sklearn', rows)
+
+
+@benchmark("inference", sizes=(1, 10000), max_runs=200)
+def predict_compiled(rows):
+    return _predictor_call('compiled', rows)
+
+
+@benchmark("inference", sizes=(1, 10000), max_runs=200)
+def predict_grid(rows):
+    return _predictor_call('grid', rows)
+
+
+@benchmark("startup", sizes=(1,), max_runs=20)
+def rule_based_startup(rows):
+    """A fresh interpreter importing the rule-based CLI path and assessing one mission"""
+    code = ("from fighter_jet import mission_planner; "
+            "mission_planner.assess_mission(*mission_planner.validate_inputs('F-35A', 'military_base', 'clear', 'night'))")
+    env = {**os.environ, "PYTHONPATH": HERE}
+
+    def run():
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, env=env, stdout=subprocess.DEVNULL, check=True)
+    return run
+
+
+def select_benchmarks(patterns=None, max_rows=None):
+    """Cases whose name contains or glob-matches one of the patterns, with at most max_rows rows"""
+    selected = []
+    for name, case in BENCHMARKS.items():
+        if patterns and not any(pattern in name or fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+            continue
+        if max_rows is not None and case.rows > max_rows:
+            continue
+        selected.append(case)
+    return selected
+
+
+def run_benchmarks(cases, min_runs=3, min_time=1.0, log=print):
+    """
+    Time each case
+
+    Returns:
+        dict: case name -> result record (group, rows, runs, min_s, median_s, mean_s, rows_per_s)
+    """
+    results = {}
+    for case in cases:
+        times = time_call(case.setup(), min_runs, case.max_runs, min_time, case.warmup)
+        median = statistics.median(times)
+        results[case.name] = {
+            'group': case.group,
+            'rows': case.rows,
+            'runs': len(times),
+            'min_s': min(times),
+            'median_s': median,
+            'mean_s': statistics.fmean(times),
+            'rows_per_s': case.rows / median if median > 0 else None
+        }
+        if log:
+            log(f"{case.name:36} median {median * 1000:11.3f} ms  ({len(times)} runs)")
+    return results
+
+
+def environment():
+    """Machine and library versions recorded with every run"""
+    import sklearn
+    import pandas
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pandas.__version__,
+        'scikit-learn': sklearn.__version__
+    }
+
+
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare median times against a baseline
+
+    Args:
+        results: Case name -> result record (from run_benchmarks)
+        baseline: Case name -> result record of the stored baseline
+        threshold: Fractional slowdown that counts as a regression (0.10 = 10%)
+
+    Returns:
+        list of dicts (name, baseline_s, current_s, ratio, status) where status is
+        'regression', 'improvement', 'ok', 'new' (no baseline) or 'missing' (not run)
+    """
+    comparison = []
+    for name, result in results.items():
+        if name not in baseline:
+            comparison.append({'name': name, 'baseline_s': None, 'current_s': result['median_s'], 'ratio': None, 'status': 'new'})
+            continue
+        ratio = result['median_s'] / baseline[name]['median_s']
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        comparison.append({'name': name, 'baseline_s': baseline[name]['median_s'], 'current_s': result['median_s'], 'ratio': ratio, 'status': status})
+
+    for name, record in baseline.items():
+        if name not in results:
+            comparison.append({'name': name, 'baseline_s': record['median_s'], 'current_s': None, 'ratio': None, 'status': 'missing'})
+    return comparison
+
+
+def load_results(path):
+    """Case results of a saved run"""
+    with open(path) as file:
+        return json.load(file)['results']
+
+
+def save_results(path, results):
+    with open(path, 'w') as file:
+        json.dump({
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'environment': environment(),
+            'results': results
+        }, file, indent=2)
+        file.write('\n')
+
+
+def main(argv=None):
+    """Command line entry point; returns the exit status (1 when a case regressed)"""
+    parser = argparse.ArgumentParser(description="Run the performance benchmarks")
+    parser.add_argument("--filter", action="append", help="Only run cases matching this name or glob (repeatable)")
+    parser.add_argument("--max-rows", type=int, help="Skip cases with more rows than this")
+    parser.add_argument("--min-runs", type=int, default=3, help="Timed calls per case at least")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds of timed calls per case at least")
+    parser.add_argument("--output", default=DEFAULT_RESULTS, help="Where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Slowdown that counts as a regression (0.10 = 10%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Also store these results as the baseline")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    args = parser.parse_args(argv)
+
+    cases = select_benchmarks(args.filter, args.max_rows)
+    if args.list:
+        for case in cases:
+            print(f"{case.name:36} {case.group}")
+        return 0
+
+    results = run_benchmarks(cases, min_runs=args.min_runs, min_time=args.min_time)
+    save_results(args.output, results)
+    print(f"\nResults written to {args.output}")
+
+    status = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        comparison = compare_results(results, load_results(args.baseline), args.threshold)
+        print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+        for row in comparison:
+            if row['ratio'] is None:
+                print(f"{row['name']:36} {row['status']}")
+            else:
+                print(f"{row['name']:36} {row['ratio']:6.2f}x  {row['status']}")
+        if any(row['status'] == 'regression' for row in comparison):
+            status = 1
+
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Public API of the fighter jet mission assessment engine
+
+Everything is imported on first use, so `import fighter_jet` is cheap and
+only the parts a caller touches load NumPy, pandas or scikit-learn. The
+command line entry points live in the submodules (fighter_jet.mission_planner,
+fighter_jet.service, ...) and run with python -m as well as through the
+installed console scripts.
+
+    import fighter_jet
+    fighter_jet.calculate_mission_score("F-35A", "bridge", "clear", "night")
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # Scoring
+    'calculate_mission_score': 'utils',
+    'calculate_mission_scores': 'scoring',
+    'encode_scenarios': 'scoring',
+    'get_mission_table': 'utils',
+    'AIRCRAFT_NAMES': 'utils',
+    'TARGET_NAMES': 'utils',
+    'WEATHER_NAMES': 'utils',
+    'TIME_NAMES': 'utils',
+    # Rating
+    'assign_mission_rating': 'utils',
+    'assign_mission_ratings': 'scoring',
+    'RATINGS': 'utils',
+    # Optimizer
+    'find_optimal_aircraft': 'utils',
+    'find_optimal_aircraft_batch': 'scoring',
+    # Input validation and batch assessment
+    'NameResolver': 'mission_planner',
+    'match_inputs': 'mission_planner',
+    'run_batch': 'batch_assessment',
+    'export_reports': 'report_export',
+    # Data generation
+    'NoiseModel': 'data_generator',
+    'generate_training_data': 'data_generator',
+    'stream_training_data': 'data_generator',
+    'generate_sharded': 'data_generator',
+    'load_dataset': 'dataset_io',
+    'save_dataset': 'dataset_io',
+    # Training
+    'prepare_features': 'ml_models',
+    'build_feature_matrix': 'ml_models',
+    'train_all_models': 'ml_models',
+    'ModelRegistry': 'model_registry',
+    # Inference
+    'Predictor': 'predictor',
+    'compile_forest': 'compiled_forest',
+    'distill_models': 'distill',
+    'AssessmentService': 'service',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'fighter_jet' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,351 @@
+import csv
+import itertools
+import json
+import os
+import sys
+import numpy as np
+from .instrumentation import stage
+from .progress import Progress, get_logger
+from .utils import (
+    AIRCRAFT_IDS, TARGET_IDS, WEATHER_IDS, TIME_IDS,
+    AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES,
+    RATINGS, get_mission_table, pack_scenario
+)
+from .mission_planner import (
+    AIRCRAFT_RESOLVER, TARGET_RESOLVER, WEATHER_RESOLVER, TIME_RESOLVER, MISSION_TABLE_CACHE
+)
+
+logger = get_logger(__name__)
+
+# Rows validated and scored together
+DEFAULT_CHUNK_SIZE = 65536
+
+# Request fields, with the resolver and registry IDs used for each
+REQUEST_FIELDS = ('aircraft', 'target', 'weather', 'time_of_day')
+FIELD_RESOLVERS = (
+    (AIRCRAFT_RESOLVER, AIRCRAFT_IDS),
+    (TARGET_RESOLVER, TARGET_IDS),
+    (WEATHER_RESOLVER, WEATHER_IDS),
+    (TIME_RESOLVER, TIME_IDS)
+)
+
+# Accepted alternative column names
+FIELD_ALIASES = {'time': 'time_of_day'}
+
+RESULT_COLUMNS = ['aircraft', 'target', 'weather', 'time_of_day', 'destruction_probability', 'civilian_risk', 'mission_rating']
+
+INPUT_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.json': 'jsonl'}
+OUTPUT_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.json': 'jsonl', '.parquet': 'parquet'}
+
+
+def file_format(filename, formats, default):
+    """Format of a file by extension ('-' means stdin/stdout and uses default)"""
+    if filename in (None, '-'):
+        return default
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in formats:
+        raise ValueError(f"Unsupported extension '{ext}'. Available: {list(formats)}")
+    return formats[ext]
+
+
+def _code_index(resolver, ids):
+    """Map every accepted spelling straight to a registry ID (empty input is not accepted)"""
+    index = {key: ids[option] for key, option in resolver.index.items()}
+    index.pop('', None)
+    return index
+
+
+class RequestChunk:
+    """One chunk of mission requests: four columns of raw strings plus parse errors"""
+
+    def __init__(self, first_row, columns, parse_errors=None):
+        self.first_row = first_row
+        self.columns = columns
+        self.parse_errors = parse_errors or {}
+
+    def __len__(self):
+        return len(self.columns[0])
+
+
+def _field_positions(header):
+    """Positions of the request fields in a CSV header"""
+    names = [FIELD_ALIASES.get(name.strip().lower(), name.strip().lower()) for name in header]
+    missing = [field for field in REQUEST_FIELDS if field not in names]
+    if missing:
+        raise ValueError(f"CSV header is missing columns: {missing}")
+    return [names.index(field) for field in REQUEST_FIELDS]
+
+
+def read_csv_chunks(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield RequestChunks from a CSV stream with a header row"""
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = _field_positions(header)
+    width = max(positions) + 1
+    first_row = 1
+
+    while True:
+        rows = list(itertools.islice(reader, chunk_size))
+        if not rows:
+            return
+        # Short rows are padded so their missing fields are reported as errors
+        rows = [row if len(row) >= width else row + [''] * (width - len(row)) for row in rows]
+        yield RequestChunk(first_row, [[row[position] for row in rows] for position in positions])
+        first_row += len(rows)
+
+
+def read_jsonl_chunks(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield RequestChunks from a JSON Lines stream (blank lines are skipped)"""
+    lines = (line for line in file if line.strip())
+    first_row = 1
+
+    while True:
+        lines_chunk = list(itertools.islice(lines, chunk_size))
+        if not lines_chunk:
+            return
+
+        columns = [[] for _ in REQUEST_FIELDS]
+        parse_errors = {}
+        for i, line in enumerate(lines_chunk):
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("not a JSON object")
+            except ValueError as error:
+                parse_errors[i] = f"Invalid JSON: {error}"
+                record = {}
+            for field, column in zip(REQUEST_FIELDS, columns):
+                value = record.get(field, record.get('time') if field == 'time_of_day' else None)
+                column.append('' if value is None else str(value))
+
+        yield RequestChunk(first_row, columns, parse_errors)
+        first_row += len(lines_chunk)
+
+
+class BatchAssessor:
+    """Validate and score request chunks against the mission table"""
+
+    def __init__(self):
+        table = get_mission_table(MISSION_TABLE_CACHE)
+        self.destruction = np.frombuffer(table.destruction, dtype=np.float64)
+        self.civilian = np.frombuffer(table.civilian, dtype=np.float64)
+        self.ratings = np.frombuffer(table.ratings, dtype=np.uint8)
+        self.indexes = [_code_index(resolver, ids) for resolver, ids in FIELD_RESOLVERS]
+
+    def encode(self, chunk):
+        """
+        Resolve a chunk's names to registry codes
+
+        Returns:
+            int array of shape (4, n) with -1 where a name did not resolve
+        """
+        codes = np.empty((len(REQUEST_FIELDS), len(chunk)), dtype=np.intp)
+        with stage('encode', rows=len(chunk)):
+            for row, (index, column) in enumerate(zip(self.indexes, chunk.columns)):
+                # Repeated spellings are lowered and looked up once
+                memo = {}
+                for value in set(column):
+                    memo[value] = index.get(value.lower(), -1)
+                codes[row] = [memo[value] for value in column]
+        return codes
+
+    def assess(self, chunk):
+        """
+        Score the valid rows of a chunk
+
+        Returns:
+            tuple: (result chunk dict keyed by RESULT_COLUMNS with codes for the
+            name columns, list of error records for the rejected rows)
+        """
+        codes = self.encode(chunk)
+        bad = (codes < 0).any(axis=0)
+        for i in chunk.parse_errors:
+            bad[i] = True
+
+        errors = [self._error_record(chunk, codes, i) for i in np.flatnonzero(bad)]
+
+        good = codes[:, ~bad] if bad.any() else codes
+        with stage('score', rows=good.shape[1]):
+            packed = pack_scenario(*good)
+            result = dict(zip(REQUEST_FIELDS, good))
+            result['destruction_probability'] = self.destruction[packed]
+            result['civilian_risk'] = self.civilian[packed]
+            result['mission_rating'] = self.ratings[packed]
+        return result, errors
+
+    @staticmethod
+    def _error_record(chunk, codes, i):
+        record = {'row': chunk.first_row + int(i)}
+        record['input'] = {field: column[i] for field, column in zip(REQUEST_FIELDS, chunk.columns)}
+
+        if i in chunk.parse_errors:
+            record['errors'] = [chunk.parse_errors[i]]
+            return record
+
+        record['errors'] = []
+        for field, column, field_codes in zip(REQUEST_FIELDS, chunk.columns, codes):
+            if field_codes[i] < 0:
+                if column[i] == '':
+                    record['errors'].append(f"Missing {field}")
+                else:
+                    record['errors'].append(f"{field.replace('_', ' ').capitalize()} '{column[i]}' not found")
+        return record
+
+
+class CsvResultWriter:
+    def __init__(self, file):
+        self.writer = csv.writer(file, lineterminator='\n')
+        self.writer.writerow(RESULT_COLUMNS)
+
+    def write(self, result):
+        self.writer.writerows(zip(
+            *(np.asarray(names, dtype=object)[result[field]].tolist()
+              for field, names in zip(REQUEST_FIELDS, (AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES))),
+            result['destruction_probability'].tolist(),
+            result['civilian_risk'].tolist(),
+            np.asarray(RATINGS, dtype=object)[result['mission_rating']].tolist()
+        ))
+
+    def close(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+class JsonlResultWriter:
+    # Names are a small fixed set, so their JSON encodings are computed once
+    QUOTED = [np.array([json.dumps(name) for name in names], dtype=object)
+              for names in (AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES)]
+    QUOTED_RATINGS = np.array([json.dumps(rating) for rating in RATINGS], dtype=object)
+
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, result):
+        rows = zip(
+            *(quoted[result[field]].tolist() for field, quoted in zip(REQUEST_FIELDS, self.QUOTED)),
+            result['destruction_probability'].tolist(),
+            result['civilian_risk'].tolist(),
+            self.QUOTED_RATINGS[result['mission_rating']].tolist()
+        )
+        # repr of a finite float is its JSON encoding
+        self.file.writelines(
+            f'{{"aircraft": {a}, "target": {t}, "weather": {w}, "time_of_day": {ti}, '
+            f'"destruction_probability": {d!r}, "civilian_risk": {c!r}, "mission_rating": {r}}}\n'
+            for a, t, w, ti, d, c, r in rows
+        )
+
+    def close(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+class ParquetResultWriter:
+    """
+    Parquet output through the dataset writer (names as dictionary-coded columns)
+
+    Scores stay float64 so the file holds the same values as CSV and JSONL output.
+    """
+
+    def __init__(self, filename):
+        from .dataset_io import DatasetWriter
+        self.writer = DatasetWriter(filename, score_dtype=np.float64)
+
+    def write(self, result):
+        chunk = {field: result[field].astype(np.uint8) for field in REQUEST_FIELDS}
+        chunk['destruction_probability'] = result['destruction_probability']
+        chunk['civilian_risk'] = result['civilian_risk']
+        chunk['mission_rating'] = result['mission_rating']
+        self.writer.write(chunk)
+
+    def close(self):
+        self.writer.close()
+
+    def abort(self):
+        self.writer.abort()
+
+
+def default_error_path(input_path, output_path):
+    """Errors go next to the output file, or next to the input when writing to stdout"""
+    base = output_path if output_path not in (None, '-') else input_path
+    if base in (None, '-'):
+        return 'batch.errors.jsonl'
+    return os.path.splitext(base)[0] + '.errors.jsonl'
+
+
+def run_batch(input_path, output_path=None, error_path=None, output_format=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Assess every mission request in a CSV or JSONL file
+
+    Requests are read, validated and scored one chunk at a time, so memory
+    use does not depend on the input size. Rows that fail validation are
+    written to the error file (JSON Lines with the row number, input and
+    messages) and the rest of the run continues.
+
+    Args:
+        input_path: CSV or JSONL file, or '-' for CSV on stdin
+        output_path: .csv, .jsonl or .parquet file, or None/'-' for stdout
+        error_path: Error file (default: next to the output, or the input for stdout)
+        output_format: Format for stdout ('csv' or 'jsonl'); files use their extension
+        chunk_size: Rows per chunk
+
+    Returns:
+        tuple: (rows assessed, rows rejected)
+    """
+    input_format = file_format(input_path, INPUT_FORMATS, 'csv')
+    if output_path in (None, '-'):
+        output_format = output_format or 'csv'
+        if output_format not in ('csv', 'jsonl'):
+            raise ValueError("Only csv and jsonl output can be written to stdout")
+    else:
+        output_format = file_format(output_path, OUTPUT_FORMATS, None)
+    error_path = error_path or default_error_path(input_path, output_path)
+
+    assessor = BatchAssessor()
+    assessed = rejected = 0
+    error_file = None
+
+    input_file = sys.stdin if input_path in (None, '-') else open(input_path, newline='' if input_format == 'csv' else None)
+    output_file = None
+    try:
+        if output_format == 'parquet':
+            writer = ParquetResultWriter(output_path)
+        else:
+            output_file = sys.stdout if output_path in (None, '-') else open(output_path, 'w', newline='')
+            writer = CsvResultWriter(output_file) if output_format == 'csv' else JsonlResultWriter(output_file)
+
+        try:
+            chunks = read_csv_chunks(input_file, chunk_size) if input_format == 'csv' else read_jsonl_chunks(input_file, chunk_size)
+            progress = Progress(logger, "Assessing missions")
+            for chunk in chunks:
+                result, errors = assessor.assess(chunk)
+                writer.write(result)
+                assessed += len(result['mission_rating'])
+                progress.update(len(chunk))
+
+                if errors:
+                    if error_file is None:
+                        error_file = open(error_path, 'w')
+                    error_file.writelines(json.dumps(error) + '\n' for error in errors)
+                    rejected += len(errors)
+            progress.close()
+        except BaseException:
+            # A failed run must not leave a Parquet file that looks complete
+            writer.abort()
+            raise
+
+        writer.close()
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not None and output_file is not sys.stdout:
+            output_file.close()
+        if error_file is not None:
+            error_file.close()
+
+    return assessed, rejected
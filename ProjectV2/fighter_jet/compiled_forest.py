@@ -0,0 +1,310 @@
+from collections import deque
+import numpy as np
+from .instrumentation import cli_entry_point
+from .progress import get_logger
+
+logger = get_logger(__name__)
+
+# sklearn casts features to float32 before comparing them with the float64 thresholds
+FEATURE_DTYPE = np.float32
+
+# Rows evaluated together; bounds the (rows, trees) node index matrix
+EVALUATION_CHUNK = 16384
+
+
+class CompiledForest:
+    """
+    A fitted RandomForestRegressor/Classifier flattened into NumPy node arrays
+
+    All trees share one set of contiguous arrays (feature, threshold, left,
+    right, value). Nodes are laid out breadth-first so that right == left + 1,
+    and leaves point to themselves with an infinite threshold. A batch is
+    evaluated by advancing every (row, tree) pair one level at a time for
+    max_depth steps, with no per-row or per-tree Python work.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, classes=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes = classes
+
+    @property
+    def is_classifier(self):
+        return self.classes is not None
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def apply(self, X):
+        """
+        Leaf node reached by every row in every tree
+
+        Returns:
+            int array of shape (n_rows, n_trees) indexing the node arrays
+        """
+        X = np.ascontiguousarray(X, dtype=FEATURE_DTYPE)
+        flat = X.ravel()
+        row_offsets = (np.arange(len(X)) * X.shape[1])[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), self.n_trees))
+
+        for _ in range(self.max_depth):
+            # Children are adjacent, so going right is left + 1
+            go_right = flat[row_offsets + self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.left[nodes] + go_right
+
+        return nodes
+
+    def _mean_leaf_value(self, X):
+        """Average the leaf values over the trees, one chunk of rows at a time"""
+        X = np.asarray(X, dtype=FEATURE_DTYPE)
+
+        # Scenario features repeat a lot; evaluate each distinct row once
+        unique, inverse = np.unique(X, axis=0, return_inverse=True)
+        if len(unique) < len(X):
+            return self._mean_leaf_value(unique)[inverse.ravel()]
+
+        out = np.empty((len(X),) + self.value.shape[1:])
+        for start in range(0, len(X), EVALUATION_CHUNK):
+            leaves = self.apply(X[start:start + EVALUATION_CHUNK])
+            out[start:start + EVALUATION_CHUNK] = self.value[leaves].sum(axis=1) / self.n_trees
+        return out
+
+    def predict(self, X):
+        """
+        Same output as the sklearn forest's predict (within float tolerance)
+
+        Regressors return (n_rows,) or (n_rows, n_outputs); classifiers return class labels.
+        """
+        if self.is_classifier:
+            return self.classes[np.argmax(self._mean_leaf_value(X), axis=1)]
+
+        prediction = self._mean_leaf_value(X)
+        return prediction[:, 0] if prediction.shape[1] == 1 else prediction
+
+    def predict_proba(self, X):
+        """Class probabilities (classifiers only)"""
+        if not self.is_classifier:
+            raise AttributeError("predict_proba is only available for classifiers")
+        return self._mean_leaf_value(X)
+
+    def save(self, path):
+        """Save the node arrays to an .npz file"""
+        arrays = dict(feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+                      value=self.value, roots=self.roots, max_depth=np.array(self.max_depth))
+        if self.is_classifier:
+            # Stored as fixed-width strings so the file loads without pickle
+            arrays['classes'] = self.classes.astype(str) if self.classes.dtype == object else self.classes
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            classes = None
+            if 'classes' in data:
+                classes = data['classes']
+                if classes.dtype.kind == 'U':
+                    classes = classes.astype(object)
+            return cls(data['feature'], data['threshold'], data['left'], data['right'], data['value'],
+                       data['roots'], int(data['max_depth']), classes)
+
+
+def compile_forest(model):
+    """
+    Flatten a fitted RandomForestRegressor or RandomForestClassifier
+
+    Only single-output classifiers are supported (multi-output regressors are).
+
+    Returns:
+        CompiledForest
+    """
+    classes = getattr(model, 'classes_', None)
+    if classes is not None and np.ndim(classes) != 1:
+        raise ValueError("Multi-output classifiers are not supported")
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        order, position = _breadth_first_order(tree.children_left, tree.children_right)
+        leaf = tree.children_left[order] == -1
+        nodes = np.arange(tree.node_count)
+
+        # Leaves loop back to themselves and always take the left branch
+        left = np.where(leaf, nodes, position[tree.children_left[order]])
+        features.append(np.where(leaf, 0, tree.feature[order]).astype(np.intp))
+        thresholds.append(np.where(leaf, np.inf, tree.threshold[order]))
+        lefts.append(left + offset)
+        rights.append(np.where(leaf, nodes, left + 1) + offset)
+
+        if classes is not None:
+            # Per-leaf class probabilities, normalized like DecisionTreeClassifier.predict_proba
+            value = tree.value[order, 0, :]
+            totals = value.sum(axis=1, keepdims=True)
+            totals[totals == 0] = 1
+            values.append(value / totals)
+        else:
+            values.append(tree.value[order, :, 0])
+
+        roots.append(offset)
+        offset += tree.node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    return CompiledForest(
+        np.concatenate(features), np.concatenate(thresholds),
+        np.concatenate(lefts), np.concatenate(rights),
+        np.concatenate(values), np.array(roots, dtype=np.intp), max_depth, classes
+    )
+
+
+def _breadth_first_order(children_left, children_right):
+    """
+    Breadth-first node order of one sklearn tree
+
+    Returns:
+        tuple: (order, position) where order lists the original node ids and
+        position maps an original id to its new index
+    """
+    order = [0]
+    queue = deque([0])
+    while queue:
+        node = queue.popleft()
+        if children_left[node] != -1:
+            order += [children_left[node], children_right[node]]
+            queue += [children_left[node], children_right[node]]
+
+    order = np.array(order, dtype=np.intp)
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+    return order, position
+
+
+class GridModel:
+    """
+    A model's outputs precomputed for every (aircraft, target, weather, time) cell
+
+    With five low-cardinality features the whole input space is the 1,890-cell
+    scenario grid, so predictions become a gather by packed scenario index.
+    Class labels are stored as uint8 codes into classes.
+    """
+
+    def __init__(self, outputs, classes=None):
+        """
+        Args:
+            outputs: Array with one row per packed scenario index (codes for classifiers)
+            classes: Class labels, for classifiers
+        """
+        self.outputs = outputs
+        self.classes = classes
+
+    @classmethod
+    def from_model(cls, model):
+        """Evaluate any model with a predict method over the full grid"""
+        from .ml_models import build_feature_matrix
+
+        codes = grid_codes()
+        outputs = np.asarray(model.predict(build_feature_matrix(*codes)))
+
+        classes = getattr(model, 'classes', getattr(model, 'classes_', None))
+        if classes is None:
+            return cls(outputs)
+        classes = np.asarray(classes)
+        return cls(np.searchsorted(classes, outputs).astype(np.uint8), classes)
+
+    def predict_codes(self, aircraft_ids, target_ids, weather_ids, time_ids):
+        """Predictions for integer-coded scenarios"""
+        from .utils import pack_scenario
+
+        outputs = self.outputs[pack_scenario(
+            np.asarray(aircraft_ids, dtype=np.intp), np.asarray(target_ids, dtype=np.intp),
+            np.asarray(weather_ids, dtype=np.intp), np.asarray(time_ids, dtype=np.intp)
+        )]
+        return outputs if self.classes is None else self.classes[outputs]
+
+    def save(self, path, spec_hash=None, source=None):
+        """
+        Save the table to an .npz file
+
+        Args:
+            spec_hash: Spec registry hash the grid was built from (see get_spec_hash)
+            source: Fingerprint of the model the grid was built from (see model_fingerprint)
+        """
+        arrays = {'outputs': self.outputs}
+        if self.classes is not None:
+            arrays['classes'] = self.classes.astype(str) if self.classes.dtype == object else self.classes
+        if spec_hash is not None:
+            arrays['spec_hash'] = np.array(spec_hash)
+        if source is not None:
+            arrays['source'] = np.array(source)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path, spec_hash=None, source=None):
+        """
+        Load a saved table
+
+        Returns:
+            GridModel, or None if spec_hash or source is given and the table
+            was built from other specs or another version of the model
+        """
+        with np.load(path) as data:
+            for key, expected in (('spec_hash', spec_hash), ('source', source)):
+                if expected is not None and (key not in data or str(data[key]) != expected):
+                    return None
+            classes = None
+            if 'classes' in data:
+                classes = data['classes']
+                if classes.dtype.kind == 'U':
+                    classes = classes.astype(object)
+            return cls(data['outputs'], classes)
+
+
+def grid_codes():
+    """
+    Codes of every scenario, in packed scenario index order
+
+    Returns:
+        tuple of four int arrays (aircraft, target, weather, time)
+    """
+    from .scoring import AIRCRAFT, TARGETS, WEATHER, TIMES
+
+    shape = (len(AIRCRAFT), len(TARGETS), len(WEATHER), len(TIMES))
+    return tuple(codes.ravel() for codes in np.indices(shape, dtype=np.intp))
+
+
+def export_models(registry_dir=None, names=('Random Forest_regression', 'Random Forest_rating')):
+    """
+    Compile the registry's random forests and save them next to the models
+
+    Each model is written to <name>.forest.npz in the registry directory.
+
+    Returns:
+        dict: model name -> path written
+    """
+    from .model_registry import ModelRegistry, DEFAULT_REGISTRY_DIR
+
+    registry = ModelRegistry(registry_dir or DEFAULT_REGISTRY_DIR)
+    paths = {}
+    for name in names:
+        path = registry.artifact_path(name, '.forest.npz')
+        compile_forest(registry.load(name, mmap=False)).save(path)
+        paths[name] = path
+        logger.info("Compiled '%s' -> %s", name, path)
+    return paths
+
+
+@cli_entry_point
+def main():
+    """Command line entry point"""
+    export_models()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+import numpy as np
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .instrumentation import stage, cli_entry_point
+from .progress import Progress, get_logger
+from .utils import (
+    get_aircraft_data,
+    get_target_data,
+    get_weather_data,
+    get_time_data
+)
+from .dataset_io import DATASET_COLUMNS, CATEGORY_NAMES, DatasetWriter, chunk_to_dataframe
+from .dataset_io import save_dataset as write_dataset
+from .scoring import (
+    get_grid_arrays, score_components, assign_mission_ratings,
+    AIRCRAFT_PRECISION, AIRCRAFT_STEALTH_MODIFIER,
+    TARGET_DIFFICULTY_MODIFIER, TARGET_CIVILIAN_BASE,
+    WEATHER_PRECISION_MODIFIER, TIME_CIVILIAN_MODIFIER
+)
+
+logger = get_logger(__name__)
+
+# Rows per chunk when streaming; peak memory is proportional to this, not to the dataset size
+DEFAULT_CHUNK_SIZE = 65536
+
+def generate_all_combinations():
+    """
+    Generate every possible combination of mission parameters
+    
+    Returns:
+        list of tuples: (aircraft, target, weather, time_of_day)
+    """
+    
+    # Get all possible options
+    aircraft_list = list(get_aircraft_data().keys())
+    target_list = list(get_target_data().keys())
+    weather_list = list(get_weather_data().keys())
+    time_list = list(get_time_data().keys())
+    
+    logger.debug("Aircraft: %d, targets: %d, weather: %d, time periods: %d",
+                 len(aircraft_list), len(target_list), len(weather_list), len(time_list))
+    
+    # Calculate total combinations
+    total = len(aircraft_list) * len(target_list) * len(weather_list) * len(time_list)
+    logger.debug("Total possible combinations: %d", total)
+    
+    # Generate all combinations
+    combinations = list(itertools.product(aircraft_list, target_list, weather_list, time_list))
+    
+    return combinations
+
+class NoiseModel:
+    """
+    Random variation applied to the weather precision and time civilian modifiers
+    
+    Each modifier is multiplied by a random factor around 1:
+        gaussian:  1 + scale * N(0, 1)
+        uniform:   1 + U(-scale, scale)
+        lognormal: exp(scale * N(0, 1))
+    Perturbed precision modifiers are clipped to [0, 1] and civilian
+    modifiers to >= 0; the usual score caps still apply.
+    """
+    
+    DISTRIBUTIONS = ("gaussian", "uniform", "lognormal")
+    
+    def __init__(self, distribution="gaussian", precision_scale=0.05, civilian_scale=0.1):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown noise distribution '{distribution}'. Available: {list(self.DISTRIBUTIONS)}")
+        self.distribution = distribution
+        self.precision_scale = precision_scale
+        self.civilian_scale = civilian_scale
+    
+    def __repr__(self):
+        return f"NoiseModel({self.distribution!r}, precision_scale={self.precision_scale}, civilian_scale={self.civilian_scale})"
+    
+    def factors(self, rng, size, scale):
+        """Draw size multiplicative factors from rng"""
+        if self.distribution == "gaussian":
+            return 1.0 + scale * rng.standard_normal(size)
+        if self.distribution == "uniform":
+            return 1.0 + rng.uniform(-scale, scale, size)
+        return np.exp(scale * rng.standard_normal(size))
+    
+    def draw(self, rng, size):
+        """Return (precision_factors, civilian_factors) for size rows"""
+        return self.factors(rng, size, self.precision_scale), self.factors(rng, size, self.civilian_scale)
+
+
+def replicate_noise(noise_model, seed, replicate, grid_size):
+    """
+    Noise factors for one pass (replicate) over the grid
+    
+    Every replicate has its own generator stream derived from (seed, replicate),
+    so a row's noise depends only on its position in the dataset, never on
+    how the rows are chunked or split between workers.
+    """
+    rng = np.random.Generator(np.random.Philox(np.random.SeedSequence(seed, spawn_key=(replicate,))))
+    return noise_model.draw(rng, grid_size)
+
+
+def iter_training_chunks(num_rows=None, chunk_size=DEFAULT_CHUNK_SIZE, noise_model=None, seed=None, first_row=0):
+    """
+    Generate the training dataset as a stream of fixed-size columnar chunks
+    
+    Rows follow generate_all_combinations order. Asking for more rows than
+    there are combinations cycles through the grid again, so row r is
+    combination r % grid_size.
+    
+    Args:
+        num_rows: Total rows to generate (None = one pass over all combinations)
+        chunk_size: Rows per chunk (the last chunk may be shorter)
+        noise_model: NoiseModel used to perturb the scores (None = exact rule output)
+        seed: Seed for the noise streams (None = fresh entropy)
+        first_row: Start generating at this row (rows are identical to a full run)
+        
+    Yields:
+        dict of numpy arrays keyed by DATASET_COLUMNS. Categorical columns hold
+        uint8 codes into CATEGORY_NAMES, scores are float64.
+    """
+    destruction_grid, civilian_grid, rating_grid = get_grid_arrays()
+    grid_shape = destruction_grid.shape
+    grid_size = destruction_grid.size
+    destruction_flat = destruction_grid.reshape(-1)
+    civilian_flat = civilian_grid.reshape(-1)
+    rating_flat = rating_grid.reshape(-1)
+    
+    if num_rows is None:
+        num_rows = grid_size
+    
+    if noise_model is not None and seed is None:
+        seed = np.random.SeedSequence().entropy
+    
+    for start in range(first_row, num_rows, chunk_size):
+        stop = min(start + chunk_size, num_rows)
+        
+        # Packed scenario index of every row in the chunk
+        scenario = np.arange(start, stop, dtype=np.int64) % grid_size
+        aircraft, target, weather, time_of_day = np.unravel_index(scenario, grid_shape)
+        
+        if noise_model is None:
+            with stage('score', rows=stop - start):
+                destruction = destruction_flat[scenario]
+                civilian = civilian_flat[scenario]
+                rating = rating_flat[scenario]
+        else:
+            # Noise factors of every replicate the chunk touches
+            precision_factor = np.empty(stop - start)
+            civilian_factor = np.empty(stop - start)
+            for replicate in range(start // grid_size, (stop - 1) // grid_size + 1):
+                low = max(start, replicate * grid_size)
+                high = min(stop, (replicate + 1) * grid_size)
+                replicate_precision, replicate_civilian = replicate_noise(noise_model, seed, replicate, grid_size)
+                cells = slice(low - replicate * grid_size, high - replicate * grid_size)
+                precision_factor[low - start:high - start] = replicate_precision[cells]
+                civilian_factor[low - start:high - start] = replicate_civilian[cells]
+            
+            destruction, civilian = score_components(
+                AIRCRAFT_PRECISION[aircraft],
+                np.clip(WEATHER_PRECISION_MODIFIER[weather] * precision_factor, 0.0, 1.0),
+                TARGET_DIFFICULTY_MODIFIER[target],
+                TARGET_CIVILIAN_BASE[target],
+                np.maximum(TIME_CIVILIAN_MODIFIER[time_of_day] * civilian_factor, 0.0),
+                AIRCRAFT_STEALTH_MODIFIER[aircraft]
+            )
+            rating = assign_mission_ratings(destruction, civilian)
+        
+        yield {
+            'aircraft': aircraft.astype(np.uint8),
+            'target': target.astype(np.uint8),
+            'weather': weather.astype(np.uint8),
+            'time_of_day': time_of_day.astype(np.uint8),
+            'destruction_probability': destruction,
+            'civilian_risk': civilian,
+            'mission_rating': rating
+        }
+
+def generate_training_data(num_samples=None, add_noise=False, replicates=1, seed=None):
+    """
+    Generate training dataset from rule-based system
+    
+    Args:
+        num_samples: Number of samples to generate (None = all combinations)
+        add_noise: Whether to add realistic variation to outputs
+                   (True for the default NoiseModel, or a NoiseModel)
+        replicates: Passes over the grid (each pass gets its own noise)
+        seed: Seed for reproducible noise
+        
+    Returns:
+        pandas DataFrame with features and targets
+    """
+    
+    # Size of the scenario grid, without building the combinations
+    total = get_grid_arrays()[0].size * replicates
+    noise_model = NoiseModel() if add_noise is True else (add_noise or None)
+    
+    # Limit samples if requested
+    if num_samples and num_samples < total:
+        total = num_samples
+        logger.info("Using first %d combinations", num_samples)
+    
+    # Scores come from the precomputed mission table, one chunk at a time
+    chunks = []
+    with Progress(logger, "Generating training data", total) as progress:
+        for chunk in iter_training_chunks(total, noise_model=noise_model, seed=seed):
+            with stage('encode', rows=len(chunk['aircraft'])):
+                chunks.append(chunk_to_dataframe(chunk))
+            progress.update(len(chunk['aircraft']))
+    
+    # Convert to DataFrame
+    import pandas as pd
+    df = pd.concat(chunks, ignore_index=True)
+    logger.info("Generated dataset with %d rows and %d columns", len(df), len(df.columns))
+    
+    return df
+
+def stream_training_data(filename, num_rows=None, chunk_size=DEFAULT_CHUNK_SIZE, noise_model=None, seed=None, first_row=0):
+    """
+    Generate a dataset straight to a file, one chunk at a time
+    
+    Only one chunk is held in memory, so peak memory stays flat however
+    many rows are written.
+    
+    Args:
+        filename: Output path (.csv, .npz, .feather or .parquet by extension)
+        num_rows: Total rows (None = one pass over all combinations)
+        chunk_size: Rows generated and written per step
+        noise_model: Optional NoiseModel for augmented rows
+        seed: Seed for the noise streams
+        first_row: Write rows first_row..num_rows only (used for shards)
+        
+    Returns:
+        Number of rows written
+    """
+    if num_rows is None:
+        num_rows = get_grid_arrays()[0].size
+    
+    with DatasetWriter(filename, num_rows - first_row) as writer, \
+            Progress(logger, f"Writing {filename}", num_rows - first_row) as progress:
+        for chunk in iter_training_chunks(num_rows, chunk_size, noise_model, seed, first_row):
+            writer.write(chunk)
+            progress.update(len(chunk['aircraft']))
+    
+    return writer.rows_written
+
+def plan_shards(num_rows, num_shards):
+    """
+    Split rows 0..num_rows into contiguous (first_row, stop_row) ranges
+    
+    Row r is replicate r // grid_size of combination r % grid_size, so the
+    ranges split both the scenario space and the replicate indices.
+    """
+    num_shards = max(1, min(num_shards, num_rows))
+    bounds = [num_rows * i // num_shards for i in range(num_shards + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _write_shard(args):
+    """Process pool task: write one shard and return its row count"""
+    filename, first_row, stop_row, chunk_size, noise_model, seed = args
+    return stream_training_data(filename, stop_row, chunk_size, noise_model, seed, first_row)
+
+def generate_sharded(filename, num_rows, workers, chunk_size=DEFAULT_CHUNK_SIZE, noise_model=None, seed=None):
+    """
+    Generate a dataset in parallel, one shard file per worker
+    
+    Shard files are named <stem>.part-00000<ext>, ... and a manifest
+    <stem>.manifest.json lists them in row order. Noise depends only on
+    (seed, row), so merging the shards with merge_shards() reproduces a
+    single-worker run byte for byte.
+    
+    Args:
+        filename: Output path the shard and manifest names are derived from
+        num_rows: Total rows
+        workers: Number of processes (and shards)
+        chunk_size: Rows per chunk within each shard
+        noise_model: Optional NoiseModel
+        seed: Seed for the noise streams (None = fresh entropy, recorded in the manifest)
+        
+    Returns:
+        Path of the manifest file
+    """
+    if noise_model is not None and seed is None:
+        seed = np.random.SeedSequence().entropy  # Every shard must share one seed
+    
+    stem, ext = os.path.splitext(filename)
+    shards = [
+        (f"{stem}.part-{i:05d}{ext}", first_row, stop_row)
+        for i, (first_row, stop_row) in enumerate(plan_shards(num_rows, workers))
+    ]
+    tasks = [(shard_file, first_row, stop_row, chunk_size, noise_model, seed) for shard_file, first_row, stop_row in shards]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        row_counts = list(pool.map(_write_shard, tasks))
+    
+    manifest = {
+        'rows': num_rows,
+        'columns': DATASET_COLUMNS,
+        'noise': repr(noise_model) if noise_model is not None else None,
+        'seed': seed,
+        'shards': [
+            {'file': os.path.basename(shard_file), 'first_row': first_row, 'rows': rows}
+            for (shard_file, first_row, _), rows in zip(shards, row_counts)
+        ]
+    }
+    manifest_file = f"{stem}.manifest.json"
+    with open(manifest_file, "w") as file:
+        json.dump(manifest, file, indent=2)
+    
+    logger.info("Wrote %d shards and manifest %s", len(shards), manifest_file)
+    return manifest_file
+
+def merge_shards(manifest_file, filename):
+    """Concatenate the CSV shards listed in a manifest into one file (single header)"""
+    with open(manifest_file) as file:
+        manifest = json.load(file)
+    
+    if any(not shard['file'].endswith(".csv") for shard in manifest['shards']):
+        raise ValueError("merge_shards concatenates CSV shards; load binary shards with dataset_io.load_dataset(manifest_file)")
+    
+    directory = os.path.dirname(manifest_file)
+    with open(filename, "wb") as output:
+        for i, shard in enumerate(manifest['shards']):
+            with open(os.path.join(directory, shard['file']), "rb") as shard_file:
+                header = shard_file.readline()
+                if i == 0:
+                    output.write(header)
+                while block := shard_file.read(1 << 20):
+                    output.write(block)
+    
+    return filename
+
+def save_dataset(df, filename="training_data.csv"):
+    """Save the dataset (CSV, or a columnar binary format chosen by extension)"""
+    write_dataset(df, filename)
+    logger.info("Dataset saved to %s", filename)
+    return filename
+
+
+@cli_entry_point
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Generate training data from the rule-based system")
+    parser.add_argument("--rows", type=int, help="Stream this many rows (cycling through the grid) instead of building the dataset in memory")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per streamed chunk")
+    parser.add_argument("--replicates", type=int, help="Stream this many passes over the grid (sets --rows)")
+    parser.add_argument("--noise", choices=NoiseModel.DISTRIBUTIONS, help="Perturb the precision/civilian modifiers with this noise model")
+    parser.add_argument("--precision-scale", type=float, default=0.05, help="Noise scale for the weather precision modifier")
+    parser.add_argument("--civilian-scale", type=float, default=0.1, help="Noise scale for the time civilian modifier")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible noise")
+    parser.add_argument("--workers", type=int, default=1, help="Generate in this many processes, one shard file each, plus a manifest")
+    parser.add_argument("--output", default="complete_training_data.csv", help="Output file")
+    args = parser.parse_args(argv)
+    
+    if args.replicates is not None:
+        args.rows = args.replicates * len(generate_all_combinations())
+    if args.workers > 1 and args.rows is None:
+        parser.error("--workers needs --rows or --replicates (the in-memory dataset is built in one process)")
+    noise_model = NoiseModel(args.noise, args.precision_scale, args.civilian_scale) if args.noise else None
+    
+    if args.rows is not None and args.workers > 1:
+        print(f"Generating {args.rows} rows with {args.workers} workers...")
+        generate_sharded(args.output, args.rows, args.workers, args.chunk_size, noise_model, args.seed)
+    elif args.rows is not None:
+        print(f"Streaming {args.rows} rows to {args.output}...")
+        stream_training_data(args.output, args.rows, args.chunk_size, noise_model, args.seed)
+    else:
+        # Generate full dataset instead of just 50 samples
+        print("Generating COMPLETE training dataset...")
+        df = generate_training_data()  # No num_samples limit = all 1,890 combinations
+        
+        print("\nDataset preview:")
+        print(df.head())
+        
+        print("\nDataset summary:")
+        print(f"Total samples: {len(df)}")
+        print("\nMission rating distribution:")
+        print(df['mission_rating'].value_counts().sort_index())
+        
+        # Save the complete dataset
+        save_dataset(df, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+import json
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+import numpy as np
+from .utils import AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES, RATINGS
+
+# Column order of the dataset (and the code tables for the categorical columns)
+DATASET_COLUMNS = ['aircraft', 'target', 'weather', 'time_of_day', 'destruction_probability', 'civilian_risk', 'mission_rating']
+CATEGORY_NAMES = {
+    'aircraft': AIRCRAFT_NAMES,
+    'target': TARGET_NAMES,
+    'weather': WEATHER_NAMES,
+    'time_of_day': TIME_NAMES,
+    'mission_rating': RATINGS
+}
+
+# File extension -> format
+FORMATS = {
+    '.csv': 'csv',
+    '.npz': 'npz',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.parquet': 'parquet'
+}
+
+
+def dataset_format(filename):
+    """Return the dataset format for a file name, chosen by extension"""
+    ext = os.path.splitext(str(filename))[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unsupported dataset extension '{ext}'. Available: {list(FORMATS)}")
+    return FORMATS[ext]
+
+
+def _require_pyarrow(fmt):
+    """Import pyarrow for the formats that need it"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(f"The {fmt} format needs pyarrow (pip install pyarrow); use .npz or .csv instead") from None
+    return pyarrow
+
+
+def chunk_to_dataframe(chunk, categorical=False):
+    """
+    Convert a columnar chunk to a DataFrame with text values
+
+    Args:
+        chunk: dict of arrays keyed by DATASET_COLUMNS, categorical columns as codes
+        categorical: Use pandas categoricals instead of string columns
+    """
+    import pandas as pd
+
+    columns = {}
+    for column in DATASET_COLUMNS:
+        values = chunk[column]
+        if column in CATEGORY_NAMES:
+            if categorical:
+                values = pd.Categorical.from_codes(values, categories=CATEGORY_NAMES[column])
+            else:
+                values = np.asarray(CATEGORY_NAMES[column], dtype=object)[values]
+        columns[column] = values
+
+    return pd.DataFrame(columns)
+
+
+def encode_column(values, names):
+    """
+    Convert a column of names to registry codes (positions in names)
+
+    Categorical columns are encoded through their categories, so only the
+    distinct values are looked up.
+
+    Raises:
+        KeyError: for the first value that is not in names
+    """
+    import pandas as pd
+
+    index = pd.Index(names)
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        category_codes = index.get_indexer(values.cat.categories)
+        codes = np.where(values.cat.codes.to_numpy() >= 0, category_codes[values.cat.codes.to_numpy()], -1)
+    else:
+        codes = index.get_indexer(values)
+
+    unknown = codes < 0
+    if unknown.any():
+        raise KeyError(np.asarray(values)[unknown][0])
+
+    return codes
+
+
+def dataframe_to_chunk(df):
+    """Convert a dataset DataFrame to a columnar chunk (uint8 codes for categoricals)"""
+    chunk = {}
+    for column in DATASET_COLUMNS:
+        if column in CATEGORY_NAMES:
+            chunk[column] = encode_column(df[column], CATEGORY_NAMES[column]).astype(np.uint8)
+        else:
+            chunk[column] = df[column].to_numpy()
+    return chunk
+
+
+class DatasetWriter:
+    """
+    Write a dataset incrementally, one columnar chunk at a time
+
+    CSV rows are appended as text. NPZ columns are written into temporary
+    .npy files and zipped uncompressed on close, so they can be memory-mapped
+    when loaded. Feather and Parquet are written as Arrow record batches.
+    Categorical columns are stored as uint8 dictionary codes and scores as
+    float32 in the binary formats (score_dtype=np.float64 keeps them exact).
+
+    An .npz file holds exactly num_rows rows: writing more raises at once and
+    closing after fewer raises. Leaving a `with` block on an exception
+    removes the partial output instead of finishing it.
+    """
+
+    def __init__(self, filename, num_rows=None, score_dtype=np.float32):
+        """
+        Args:
+            filename: Output path; the extension selects the format
+            num_rows: Total rows that will be written (required for .npz)
+            score_dtype: Storage type of the score columns in the binary formats
+        """
+        self.filename = str(filename)
+        self.format = dataset_format(filename)
+        self.num_rows = num_rows
+        self.score_dtype = score_dtype
+        self.rows_written = 0
+        self._closed = False
+
+        if self.format == 'csv':
+            self._file = open(self.filename, "w", newline="")
+        elif self.format == 'npz':
+            if num_rows is None:
+                raise ValueError("num_rows is required to stream an .npz dataset")
+            self._tmpdir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(self.filename)))
+            self._columns = {
+                column: np.lib.format.open_memmap(
+                    os.path.join(self._tmpdir, f"{column}.npy"), mode="w+",
+                    dtype=np.uint8 if column in CATEGORY_NAMES else score_dtype, shape=(num_rows,)
+                )
+                for column in DATASET_COLUMNS
+            }
+        else:
+            _require_pyarrow(self.format)
+            self._writer = None
+
+    def write(self, chunk):
+        """Append a chunk (dict of arrays as produced by iter_training_chunks)"""
+        size = len(chunk[DATASET_COLUMNS[0]])
+
+        if self.format == 'npz' and self.rows_written + size > self.num_rows:
+            raise ValueError(f"{self.filename}: writing {size} rows after {self.rows_written} "
+                             f"exceeds num_rows={self.num_rows}")
+
+        if self.format == 'csv':
+            chunk_to_dataframe(chunk).to_csv(self._file, index=False, header=self.rows_written == 0)
+        elif self.format == 'npz':
+            for column, array in self._columns.items():
+                array[self.rows_written:self.rows_written + size] = chunk[column]
+        else:
+            self._write_arrow(chunk)
+
+        self.rows_written += size
+
+    def _write_arrow(self, chunk):
+        import pyarrow as pa
+
+        arrays = []
+        for column in DATASET_COLUMNS:
+            if column in CATEGORY_NAMES:
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(chunk[column], type=pa.uint8()), pa.array(CATEGORY_NAMES[column], type=pa.string())
+                ))
+            else:
+                arrays.append(pa.array(np.asarray(chunk[column], dtype=self.score_dtype)))
+        batch = pa.RecordBatch.from_arrays(arrays, names=DATASET_COLUMNS)
+
+        if self._writer is None:
+            if self.format == 'feather':
+                # Uncompressed Arrow IPC so the file can be memory-mapped
+                self._writer = pa.ipc.new_file(self.filename, batch.schema)
+            else:
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.filename, batch.schema)
+        if self.format == 'feather':
+            self._writer.write(batch)
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self):
+        """Finish the file"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self.format == 'csv':
+            self._file.close()
+        elif self.format == 'npz':
+            if self.rows_written != self.num_rows:
+                self._discard()
+                raise ValueError(f"{self.filename}: {self.rows_written} rows written, "
+                                 f"expected num_rows={self.num_rows}")
+            try:
+                with zipfile.ZipFile(self.filename, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+                    for column, array in self._columns.items():
+                        array.flush()
+                        archive.write(array.filename, arcname=f"{column}.npy")
+                    for column, names in CATEGORY_NAMES.items():
+                        with archive.open(f"{column}_categories.npy", "w", force_zip64=True) as member:
+                            np.lib.format.write_array(member, np.array(names))
+                self._columns = {}
+            finally:
+                shutil.rmtree(self._tmpdir, ignore_errors=True)
+        else:
+            if self._writer is None:
+                self._write_arrow({column: np.empty(0, dtype=np.uint8) for column in DATASET_COLUMNS})
+            self._writer.close()
+
+    def abort(self):
+        """Stop writing and remove the partial output"""
+        if self._closed:
+            return
+        self._closed = True
+        self._discard()
+
+    def _discard(self):
+        # Only files this writer has started are removed
+        if self.format == 'csv':
+            self._file.close()
+            os.remove(self.filename)
+        elif self.format == 'npz':
+            self._columns = {}
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+        elif self._writer is not None:
+            self._writer.close()
+            os.remove(self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def save_dataset(df, filename):
+    """Save a dataset DataFrame in the format given by the file extension"""
+    if dataset_format(filename) == 'csv':
+        df.to_csv(filename, index=False)
+    else:
+        with DatasetWriter(filename, num_rows=len(df)) as writer:
+            writer.write(dataframe_to_chunk(df))
+    return filename
+
+
+def _mmap_npz(filename):
+    """
+    Memory-map every uncompressed array in an .npz file
+
+    Members that are compressed (np.savez_compressed) are read normally.
+    """
+    arrays = {}
+    with zipfile.ZipFile(filename) as archive, open(filename, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")]
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+
+            # Skip the zip local header, then parse the .npy header
+            file.seek(info.header_offset)
+            local_header = file.read(30)
+            name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+
+            if dtype.hasobject:
+                raise ValueError(f"{filename}: object arrays are not supported")
+            if np.prod(shape) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(filename, dtype=dtype, mode="r", offset=file.tell(), shape=shape,
+                                         order="F" if fortran_order else "C")
+    return arrays
+
+
+def load_columns(filename, mmap=True):
+    """
+    Load a binary dataset as raw columns without decoding
+
+    Feather files written in one record batch come back as views of the
+    mapped file. A file with several batches (anything DatasetWriter wrote in
+    more than one chunk) is mapped too, but each column is then concatenated
+    into one new array, which copies it.
+
+    Args:
+        filename: .npz or .feather/.arrow file
+        mmap: Memory-map the file instead of reading it
+
+    Returns:
+        (columns, categories): dict of column arrays (codes for categorical
+        columns) and dict of category name arrays
+    """
+    fmt = dataset_format(filename)
+
+    if fmt == 'npz':
+        arrays = _mmap_npz(filename) if mmap else dict(np.load(filename))
+        columns = {column: arrays[column] for column in DATASET_COLUMNS}
+        categories = {column: arrays[f"{column}_categories"] for column in CATEGORY_NAMES}
+        return columns, categories
+
+    if fmt == 'feather':
+        pa = _require_pyarrow(fmt)
+        source = pa.memory_map(str(filename), "r") if mmap else pa.OSFile(str(filename), "rb")
+        table = pa.ipc.open_file(source).read_all()
+        columns, categories = {}, {}
+        for column in DATASET_COLUMNS:
+            chunks = table.column(column).chunks or [table.column(column).combine_chunks()]
+            if column in CATEGORY_NAMES:
+                # Every batch carries the same dictionary (the registry names)
+                categories[column] = chunks[0].dictionary.to_numpy(zero_copy_only=False)
+                chunks = [chunk.indices for chunk in chunks]
+            arrays = [chunk.to_numpy(zero_copy_only=True) for chunk in chunks]
+            columns[column] = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+        return columns, categories
+
+    raise ValueError(f"load_columns supports .npz and .feather files, not {fmt}")
+
+
+def load_dataset(filename, mmap=True):
+    """
+    Load a dataset in the format given by the file extension
+
+    CSV files are parsed as before (string columns). Binary formats come
+    back with categorical columns decoded from their dictionaries and float32
+    scores; .npz and .feather are memory-mapped when mmap is True (see
+    load_columns for when a .feather column is copied). A shard
+    manifest (*.manifest.json) loads and concatenates its shards.
+
+    Returns:
+        pandas DataFrame
+    """
+    import pandas as pd
+
+    filename = str(filename)
+
+    if filename.endswith(".manifest.json"):
+        with open(filename) as file:
+            manifest = json.load(file)
+        directory = os.path.dirname(filename)
+        shards = [load_dataset(os.path.join(directory, shard['file']), mmap) for shard in manifest['shards']]
+        return pd.concat(shards, ignore_index=True)
+
+    fmt = dataset_format(filename)
+
+    if fmt == 'csv':
+        return pd.read_csv(filename)
+    if fmt == 'parquet':
+        _require_pyarrow(fmt)
+        return pd.read_parquet(filename, memory_map=mmap)
+
+    columns, categories = load_columns(filename, mmap)
+    data = {}
+    for column in DATASET_COLUMNS:
+        if column in CATEGORY_NAMES:
+            data[column] = pd.Categorical.from_codes(columns[column], categories=categories[column].tolist())
+        else:
+            data[column] = columns[column]
+    return pd.DataFrame(data, copy=False)
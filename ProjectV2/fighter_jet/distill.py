@@ -0,0 +1,138 @@
+import itertools
+import json
+import os
+import sys
+import numpy as np
+from .compiled_forest import GridModel
+from .model_registry import ModelRegistry, DEFAULT_REGISTRY_DIR, model_fingerprint
+from .utils import (
+    AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES,
+    AIRCRAFT_IDS, TARGET_IDS, WEATHER_IDS, TIME_IDS,
+    get_aircraft_data, get_target_data, get_weather_data, get_time_data,
+    get_spec_hash
+)
+from .instrumentation import stage, count, cli_entry_point
+from .progress import get_logger
+
+logger = get_logger(__name__)
+
+# Suffix of the distilled table saved next to each model
+GRID_SUFFIX = '.grid.npz'
+
+
+def verify_grid(model, grid):
+    """
+    Compare a distilled table with the model it came from on every scenario
+
+    The expected outputs are model.predict on features built row by row from
+    the rule engine's spec records, and the table is queried with codes looked
+    up by name, so neither side goes through the grid_codes /
+    build_feature_matrix path the table was built with.
+
+    Returns:
+        dict: cells, mismatches (cells where the outputs differ at all) and,
+        for regressors, max_abs_error
+    """
+    aircraft_data = get_aircraft_data()
+    target_data = get_target_data()
+    weather_data = get_weather_data()
+    time_data = get_time_data()
+
+    scenarios = list(itertools.product(AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES))
+    features = np.array([
+        [
+            aircraft_data[aircraft]['precision'],
+            1 if aircraft_data[aircraft]['stealth'] else 0,
+            target_data[target]['difficulty'],
+            weather_data[weather]['precision_modifier'],
+            time_data[time_of_day]['civilian_modifier']
+        ]
+        for aircraft, target, weather, time_of_day in scenarios
+    ], dtype=np.float64)
+    codes = [[ids[name] for name in names]
+             for ids, names in zip((AIRCRAFT_IDS, TARGET_IDS, WEATHER_IDS, TIME_IDS), zip(*scenarios))]
+
+    expected = np.asarray(model.predict(features))
+    actual = grid.predict_codes(*codes)
+
+    different = (expected != actual).reshape(len(expected), -1).any(axis=1)
+    report = {'cells': len(expected), 'mismatches': int(different.sum())}
+    if grid.classes is None:
+        report['max_abs_error'] = float(np.abs(expected - actual).max())
+    return report
+
+
+def distill_models(registry_dir=DEFAULT_REGISTRY_DIR, names=None):
+    """
+    Evaluate every trained model over the full scenario grid and save the tables
+
+    Each table is written to <name>.grid.npz in the registry directory, with
+    the spec hash and the fingerprint of the model version it came from, read
+    back and verified against the model; the verification report is written
+    to distill_report.json.
+
+    Args:
+        registry_dir: Model registry directory
+        names: Models to distill (all saved models by default)
+
+    Returns:
+        dict: model name -> verification report
+    """
+    registry = ModelRegistry(registry_dir)
+    spec_hash = get_spec_hash()
+    reports = {}
+
+    for name in names or registry.names():
+        source = model_fingerprint(registry.metadata(name))
+        model = registry.load(name, mmap=False)
+        path = registry.artifact_path(name, GRID_SUFFIX)
+        GridModel.from_model(model).save(path, spec_hash, source)
+
+        report = verify_grid(model, GridModel.load(path, spec_hash, source))
+        report['file'] = os.path.basename(path)
+        report['bytes'] = os.path.getsize(path)
+        reports[name] = report
+
+        status = "OK" if report['mismatches'] == 0 else "MISMATCH"
+        logger.info("%-30s %d cells, %d mismatches, %d bytes - %s",
+                    name, report['cells'], report['mismatches'], report['bytes'], status, extra={'metrics': {'model': name, **report}})
+
+    os.makedirs(registry_dir, exist_ok=True)
+    with open(os.path.join(registry_dir, 'distill_report.json'), 'w') as file:
+        json.dump({'spec_hash': spec_hash, 'models': reports}, file, indent=2)
+
+    return reports
+
+
+def load_distilled(name, registry_dir=DEFAULT_REGISTRY_DIR):
+    """
+    Load a distilled table for the current specs and model version
+
+    Returns:
+        GridModel, or None if the model was not distilled, or the specs or the
+        model changed since (retrain, then run distill-models again)
+    """
+    registry = ModelRegistry(registry_dir)
+    path = registry.artifact_path(name, GRID_SUFFIX)
+    metadata = registry.metadata(name)
+    if metadata is None or not os.path.exists(path):
+        count('distilled.miss')
+        return None
+    with stage('load'):
+        grid = GridModel.load(path, get_spec_hash(), model_fingerprint(metadata))
+    if grid is None:
+        logger.warning("Distilled table %s is out of date; run distill-models to rebuild it", os.path.basename(path))
+    count('distilled.miss' if grid is None else 'distilled.hit')
+    return grid
+
+
+@cli_entry_point
+def main():
+    """Command line entry point (exits non-zero if any table disagrees with its model)"""
+    reports = distill_models()
+    if any(report['mismatches'] for report in reports.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,40 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.metrics import mean_absolute_error, classification_report, confusion_matrix
-from utils import calculate_mission_score, assign_mission_rating
+from .utils import calculate_mission_score, assign_mission_rating
+from .dataset_io import load_dataset
+from .model_registry import ModelRegistry, DEFAULT_REGISTRY_DIR
+from .instrumentation import stage, cli_entry_point
+from .progress import get_logger
 
-def load_models_and_data():
+logger = get_logger(__name__)
+
+def load_models_and_data(filename="complete_training_data.csv"):
     """
     Load the trained models and test data for evaluation
     
     Returns:
         Dictionary with models, test data, and predictions
     """
-    # For now, we'll regenerate predictions
-    # Later we can save/load actual trained models
+    # Trained models are opened separately with load_trained_models()
     
-    print("Loading complete training dataset...")
-    df = pd.read_csv("complete_training_data.csv")
-    print(f"Loaded {len(df)} examples")
+    logger.info("Loading complete training dataset...")
+    df = load_dataset(filename)
+    logger.info("Loaded %d examples", len(df))
     
     return df
 
+def load_trained_models(registry_dir=DEFAULT_REGISTRY_DIR):
+    """
+    Open the models saved by train-models (fighter_jet.ml_models)
+    
+    Models are loaded lazily on first use, so this only reads their metadata.
+    
+    Returns:
+        Dictionary of model name -> LazyModel (empty if nothing has been trained yet)
+    """
+    registry = ModelRegistry(registry_dir)
+    models = {name: registry.lazy(name) for name in registry.names()}
+    logger.info("Found %d trained models in %s", len(models), registry_dir)
+    return models
+
 def compare_ml_vs_rule_based(df, num_test_samples=200):
     """
     Generate fresh test cases and compare ML predictions vs rule-based ground truth
@@ -32,12 +47,12 @@ def compare_ml_vs_rule_based(df, num_test_samples=200):
         Comparison results
     """
     
-    print(f"\nGenerating {num_test_samples} fresh test scenarios...")
+    logger.info("Generating %d fresh test scenarios...", num_test_samples)
     
     # We'll implement this step by step
     # For now, just show the framework
     
-    print("Comparison framework ready")
+    logger.info("Comparison framework ready")
     
     return {}
 
@@ -52,28 +67,29 @@ def analyze_model_performance(df):
         Performance analysis
     """
     
-    print("\nAnalyzing model performance patterns...")
+    logger.info("Analyzing model performance patterns...")
     
     # Show rating distribution analysis
     rating_dist = df['mission_rating'].value_counts().sort_index()
-    print("\nMission rating distribution:")
+    rating_dist = rating_dist[rating_dist > 0]  # Categorical columns also count absent ratings
+    logger.info("Mission rating distribution:")
     for rating, count in rating_dist.items():
         percentage = (count / len(df)) * 100
-        print(f"{rating}: {count:4d} ({percentage:5.1f}%)")
+        logger.info("%s: %4d (%5.1f%%)", rating, count, percentage)
     
     # Identify class imbalance issues
     min_class = rating_dist.min()
     max_class = rating_dist.max()
     imbalance_ratio = max_class / min_class
     
-    print(f"\nClass imbalance analysis:")
-    print(f"Most common class: {max_class} examples")
-    print(f"Least common class: {min_class} examples") 
-    print(f"Imbalance ratio: {imbalance_ratio:.1f}:1")
+    logger.info("Class imbalance analysis:")
+    logger.info("Most common class: %d examples", max_class)
+    logger.info("Least common class: %d examples", min_class)
+    logger.info("Imbalance ratio: %.1f:1", imbalance_ratio)
     
     if imbalance_ratio > 10:
-        print("WARNING: Severe class imbalance detected")
-        print("   This explains why models struggle with rare classes (A-RANK, B-RANK)")
+        logger.warning("Severe class imbalance detected (%.1f:1); "
+                       "this explains why models struggle with rare classes (A-RANK, B-RANK)", imbalance_ratio)
     
     return {'imbalance_ratio': imbalance_ratio, 'rating_dist': rating_dist}
 
@@ -82,7 +98,7 @@ def generate_fresh_test_scenarios(num_samples=100):
     """
     Generate fresh test scenarios not in the training data
     """
-    from utils import get_aircraft_data, get_target_data, get_weather_data, get_time_data
+    from .utils import get_aircraft_data, get_target_data, get_weather_data, get_time_data
     import random
     
     # Get all options
@@ -104,22 +120,42 @@ def generate_fresh_test_scenarios(num_samples=100):
     
     return test_scenarios
 
-def evaluate_on_fresh_data(num_test=50):
+def evaluate_on_fresh_data(num_test=50, models=None):
     """
     Test ML models on fresh scenarios and compare with rule-based ground truth
+    
+    Args:
+        num_test: Number of fresh scenarios
+        models: Trained models from load_trained_models() (optional)
     """
-    print(f"\nTesting on {num_test} fresh scenarios...")
+    logger.info("Testing on %d fresh scenarios...", num_test)
     
     # Generate test scenarios
     test_scenarios = generate_fresh_test_scenarios(num_test)
     
-    print("Sample test scenarios:")
+    logger.info("Sample test scenarios:")
     for i, (aircraft, target, weather, time) in enumerate(test_scenarios[:3]):
         dest_prob, civ_risk = calculate_mission_score(aircraft, target, weather, time)
         rating = assign_mission_rating(dest_prob, civ_risk)
-        print(f"  {aircraft} vs {target} ({weather}, {time}): {dest_prob}% success, {rating}")
+        logger.info("  %s vs %s (%s, %s): %s%% success, %s", aircraft, target, weather, time, dest_prob, rating)
+    
+    # ML predictions for the same scenarios
+    if models and 'Random Forest_regression' in models:
+        from sklearn.metrics import mean_absolute_error
+        from .scoring import encode_scenarios
+        from .ml_models import build_feature_matrix
+        
+        X = build_feature_matrix(*encode_scenarios(*zip(*test_scenarios)))
+        with stage('predict', rows=len(X)):
+            ml_dest = models['Random Forest_regression'].predict(X)[:, 0]
+        actual_dest = [calculate_mission_score(*scenario)[0] for scenario in test_scenarios]
+        
+        logger.info("Random Forest on the same scenarios:")
+        for (aircraft, target, weather, time), prediction in zip(test_scenarios[:3], ml_dest):
+            logger.info("  %s vs %s (%s, %s): %.1f%% predicted success", aircraft, target, weather, time, prediction)
+        logger.info("Mean absolute error over %d scenarios: %.2f%%", num_test, mean_absolute_error(actual_dest, ml_dest))
     
-    print("\nFresh data evaluation framework ready")
+    logger.info("Fresh data evaluation framework ready")
     return test_scenarios
 
 
@@ -157,15 +193,22 @@ def create_summary_report():
     
     return True
 
-if __name__ == "__main__":
+@cli_entry_point
+def main():
+    """Command line entry point"""
     # Load data and models
     df = load_models_and_data()
+    models = load_trained_models()
     
     # Analyze performance patterns  
     performance_analysis = analyze_model_performance(df)
     
     # Test on fresh scenarios
-    test_scenarios = evaluate_on_fresh_data()
+    test_scenarios = evaluate_on_fresh_data(models=models)
     
     # Generate completion report
-    create_summary_report()
\ No newline at end of file
+    create_summary_report()
+
+
+if __name__ == "__main__":
+    main()
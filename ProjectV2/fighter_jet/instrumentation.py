@@ -0,0 +1,234 @@
+"""
+Opt-in timing and profiling for the hot paths
+
+Stages (load, encode, score, rate, fit, predict) are timed with stage() or
+@timed, and named events are counted with count(). Everything is off by
+default: a disabled stage() returns a shared no-op object, so instrumented
+code pays one global check per call.
+
+Environment variables, read by every command line entry point:
+    FIGHTER_JET_TIMINGS=1          time the stages and print the breakdown to stderr
+    FIGHTER_JET_PROFILE=<dir>      run the command under cProfile and write
+                                   <dir>/<command>-<pid>.prof (pstats format, which
+                                   snakeviz, flameprof and gprof2dot read)
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from .progress import configure_logging
+
+TIMINGS_ENV = "FIGHTER_JET_TIMINGS"
+PROFILE_ENV = "FIGHTER_JET_PROFILE"
+
+# Stages reported first, in pipeline order (others follow alphabetically)
+STAGES = ('load', 'encode', 'score', 'rate', 'fit', 'predict')
+
+_enabled = os.environ.get(TIMINGS_ENV, "") not in ("", "0")
+_lock = threading.Lock()
+_local = threading.local()
+_stages = {}
+_counters = Counter()
+_started = time.perf_counter()
+
+
+class StageStats:
+    """Calls, seconds and rows recorded for one stage"""
+    __slots__ = ("calls", "seconds", "rows")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.rows = 0
+
+
+class _StageTimer:
+    """Times one entry into a stage; a stage entered again inside itself is counted once"""
+    __slots__ = ("name", "rows", "start", "outer")
+
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows or 0
+
+    def add_rows(self, rows):
+        self.rows += rows
+
+    def __enter__(self):
+        active = getattr(_local, 'active', None)
+        if active is None:
+            active = _local.active = set()
+        self.outer = self.name not in active
+        active.add(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        if not self.outer:
+            return
+        _local.active.discard(self.name)
+        with _lock:
+            stats = _stages.get(self.name)
+            if stats is None:
+                stats = _stages[self.name] = StageStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.rows += self.rows
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def add_rows(self, rows):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def enable():
+    """Start recording (also enabled by FIGHTER_JET_TIMINGS=1)"""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Forget every recorded stage and counter"""
+    global _started
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _started = time.perf_counter()
+
+
+def stage(name, rows=None):
+    """
+    Context manager timing one stage
+
+    Args:
+        name: Stage name (see STAGES)
+        rows: Rows processed, if known up front; otherwise call add_rows() on the timer
+
+    Usage:
+        with stage('encode', rows=len(df)):
+            ...
+    """
+    if not _enabled:
+        return _NULL_TIMER
+    return _StageTimer(name, rows)
+
+
+def timed(name):
+    """Decorator timing every call of a function as one stage"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _StageTimer(name, None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, n=1):
+    """Add n to a named counter (e.g. 'registry.hit')"""
+    if _enabled:
+        with _lock:
+            _counters[name] += n
+
+
+def snapshot():
+    """
+    Returns:
+        dict: {'elapsed': seconds since reset, 'stages': {name: {'calls', 'seconds', 'rows'}},
+        'counters': {name: value}}
+    """
+    with _lock:
+        return {
+            'elapsed': time.perf_counter() - _started,
+            'stages': {name: {'calls': stats.calls, 'seconds': stats.seconds, 'rows': stats.rows}
+                       for name, stats in _stages.items()},
+            'counters': dict(_counters)
+        }
+
+
+def format_report(data=None):
+    """Per-stage breakdown as a text table (stages may nest, so shares can add up past 100%)"""
+    data = data or snapshot()
+    stages = data['stages']
+    names = [name for name in STAGES if name in stages] + sorted(set(stages) - set(STAGES))
+    elapsed = data['elapsed'] or 1e-12
+
+    lines = [f"{'Stage':10} {'Calls':>8} {'Total s':>10} {'Mean ms':>10} {'Share':>7} {'Rows':>12} {'Rows/s':>12}"]
+    for name in names:
+        stats = stages[name]
+        mean_ms = stats['seconds'] / stats['calls'] * 1000
+        rate = f"{stats['rows'] / stats['seconds']:12,.0f}" if stats['rows'] and stats['seconds'] > 0 else f"{'-':>12}"
+        lines.append(f"{name:10} {stats['calls']:8} {stats['seconds']:10.3f} {mean_ms:10.3f} "
+                     f"{stats['seconds'] / elapsed:7.1%} {stats['rows']:12,} {rate}")
+    lines.append(f"{'elapsed':10} {'':8} {data['elapsed']:10.3f}")
+
+    if data['counters']:
+        lines.append("")
+        lines.extend(f"{name:24} {value:12,}" for name, value in sorted(data['counters'].items()))
+    return "\n".join(lines)
+
+
+def profile_path(directory, command):
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{command}-{os.getpid()}.prof")
+
+
+def cli_entry_point(main):
+    """
+    Wrap a command line main() with the FIGHTER_JET_TIMINGS / FIGHTER_JET_PROFILE switches
+
+    Library logging is sent to stderr as well (see progress.configure_logging),
+    together with the stage report and the profile location, so none of it
+    mixes with command output on stdout.
+    """
+    @functools.wraps(main)
+    def run(*args, **kwargs):
+        configure_logging()
+        if os.environ.get(TIMINGS_ENV, "") not in ("", "0"):
+            enable()
+            reset()
+
+        profiler = None
+        profile_dir = os.environ.get(PROFILE_ENV)
+        if profile_dir:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        try:
+            return main(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                command = main.__module__.rpartition('.')[2] if main.__module__ != "__main__" else os.path.splitext(os.path.basename(sys.argv[0]))[0]
+                path = profile_path(profile_dir, command)
+                profiler.dump_stats(path)
+                print(f"Profile written to {path}", file=sys.stderr)
+            if _enabled:
+                print(f"\n{format_report()}", file=sys.stderr)
+    return run
@@ -0,0 +1,237 @@
+from .utils import (
+    calculate_mission_score, assign_mission_rating, 
+    get_aircraft_data, get_target_data, get_weather_data, get_time_data,
+    AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES,
+    get_mission_table, user_cache_dir
+)
+import os
+import sys
+from .instrumentation import stage, cli_entry_point
+
+# Precomputed mission table cached between CLI runs (rebuilt when the specs change)
+MISSION_TABLE_CACHE = os.environ.get(
+    "MISSION_TABLE_CACHE",
+    os.path.join(user_cache_dir(), "mission_table.bin")
+)
+
+# Extra spellings accepted for aircraft, used only when a name matches nothing else
+AIRCRAFT_ALIASES = {
+    'b2': 'B-2',
+    'a10': 'A-10',
+    'ac130': 'AC-130',
+    'su57': 'Su-57',
+    'typhoon': 'Eurofighter',
+    'f22': 'F-22',
+    'f15': 'F-15E',
+    'f15e': 'F-15E',
+    'f35': 'F-35A',
+    'f35a': 'F-35A',
+    'ngad': 'NGAD-X'
+}
+
+class NameResolver:
+    """
+    Prebuilt case-insensitive index for one field's valid names
+    
+    Every lowercase name and every prefix of one maps to its option in a
+    single dict, so a lookup is one hash probe. Exact matches are entered
+    first and prefixes keep the first option that has them, which gives the
+    same result as scanning for an exact match and then for a prefix.
+    Aliases are only consulted for inputs that match nothing else.
+    """
+    
+    def __init__(self, valid_options, aliases=None):
+        self.options = tuple(valid_options)
+        self.index = {}
+        
+        for option in self.options:
+            self.index.setdefault(option.lower(), option)
+        for option in self.options:
+            lower = option.lower()
+            for length in range(len(lower) + 1):
+                self.index.setdefault(lower[:length], option)
+        for alias, option in (aliases or {}).items():
+            if option not in self.options:
+                raise ValueError(f"Alias '{alias}' points to unknown option '{option}'")
+            self.index.setdefault(alias.lower(), option)
+    
+    def resolve(self, user_input):
+        """Matching option, or None"""
+        return self.index.get(user_input.lower())
+    
+    def resolve_many(self, user_inputs):
+        """Resolve a whole column of inputs (None where nothing matches)"""
+        index = self.index
+        memo = {}
+        resolved = []
+        for user_input in user_inputs:
+            if user_input not in memo:
+                memo[user_input] = index.get(user_input.lower())
+            resolved.append(memo[user_input])
+        return resolved
+
+# One resolver per mission field
+AIRCRAFT_RESOLVER = NameResolver(AIRCRAFT_NAMES, AIRCRAFT_ALIASES)
+TARGET_RESOLVER = NameResolver(TARGET_NAMES)
+WEATHER_RESOLVER = NameResolver(WEATHER_NAMES)
+TIME_RESOLVER = NameResolver(TIME_NAMES)
+
+_resolvers = {}
+
+def find_match(user_input, valid_options):
+    """Find case-insensitive match in valid options"""
+    # Resolvers are built once per set of options
+    key = tuple(valid_options)
+    if key not in _resolvers:
+        _resolvers[key] = NameResolver(key)
+    
+    return _resolvers[key].resolve(user_input)
+
+def match_inputs(aircraft, target, weather, time_of_day):
+    """
+    Match user inputs to the registry names
+    
+    Returns:
+        tuple: (matched names or None, list of error messages)
+    """
+    # Find correct matches
+    with stage('encode', rows=1):
+        correct_aircraft = AIRCRAFT_RESOLVER.resolve(aircraft)
+        correct_target = TARGET_RESOLVER.resolve(target)
+        correct_weather = WEATHER_RESOLVER.resolve(weather)
+        correct_time = TIME_RESOLVER.resolve(time_of_day)
+    
+    errors = []
+    if not correct_aircraft:
+        errors.append(f"Aircraft '{aircraft}' not found. Available: {list(AIRCRAFT_NAMES)}")
+    if not correct_target:
+        errors.append(f"Target '{target}' not found. Available: {list(TARGET_NAMES)}")
+    if not correct_weather:
+        errors.append(f"Weather '{weather}' not found. Available: {list(WEATHER_NAMES)}")
+    if not correct_time:
+        errors.append(f"Time '{time_of_day}' not found. Available: {list(TIME_NAMES)}")
+    
+    if errors:
+        return None, errors
+    
+    return (correct_aircraft, correct_target, correct_weather, correct_time), errors
+
+def match_columns(aircraft, target, weather, time_of_day):
+    """
+    Resolve whole columns of user inputs at once
+    
+    Returns:
+        tuple of four lists of matched names (None where an input matches nothing)
+    """
+    return (
+        AIRCRAFT_RESOLVER.resolve_many(aircraft),
+        TARGET_RESOLVER.resolve_many(target),
+        WEATHER_RESOLVER.resolve_many(weather),
+        TIME_RESOLVER.resolve_many(time_of_day)
+    )
+
+def validate_inputs(aircraft, target, weather, time_of_day):
+    """Validate and correct user inputs"""
+    validated, errors = match_inputs(aircraft, target, weather, time_of_day)
+    
+    if errors:
+        print("VALIDATION ERRORS:")
+        for error in errors:
+            print(f"- {error}")
+        return None
+    
+    return validated
+
+def show_options():
+    """Show all available options for command line usage"""
+    aircraft_data = get_aircraft_data()
+    target_data = get_target_data()
+    weather_data = get_weather_data()
+    time_data = get_time_data()
+    
+    print("AVAILABLE OPTIONS:")
+    print("="*50)
+    
+    print("Aircraft:", ", ".join(aircraft_data.keys()))
+    print("Targets:", ", ".join(target_data.keys()))  
+    print("Weather:", ", ".join(weather_data.keys()))
+    print("Time:", ", ".join(time_data.keys()))
+    
+    print("\nUSAGE (case-insensitive):")
+    print("mission-planner <aircraft> <target> <weather> <time>")
+    print("\nEXAMPLES:")
+    print("mission-planner F-35A military_base clear night")
+    print("mission-planner b-2 nuclear_facility storm afternoon")
+    print("mission-planner a-10 wooden_house clear early_morning")
+    print("\nBATCH MODE (CSV or JSONL in; CSV, JSONL or Parquet out):")
+    print("mission-planner --batch missions.csv --output results.csv")
+
+def assess_mission(aircraft, target, weather, time_of_day):
+    """Assess a specific mission"""
+    with stage('load'):
+        table = get_mission_table(MISSION_TABLE_CACHE)
+    with stage('score', rows=1):
+        dest_prob, civ_risk, rating = table.lookup(aircraft, target, weather, time_of_day)
+    
+    print(f"\nMISSION ASSESSMENT:")
+    print("="*40)
+    print(f"Aircraft: {aircraft}")
+    print(f"Target: {target.replace('_', ' ').title()}")
+    print(f"Weather: {weather.replace('_', ' ').title()}")
+    print(f"Time: {time_of_day.replace('_', ' ').title()}")
+    print("-"*40)
+    print(f"Success Probability: {dest_prob}%")
+    print(f"Civilian Risk: {civ_risk}%")
+    print(f"Mission Rating: {rating}")
+    print("="*40)
+
+def run_batch_cli(argv):
+    """Handle 'mission-planner --batch FILE [options]'"""
+    import argparse
+    from .batch_assessment import DEFAULT_CHUNK_SIZE, default_error_path, run_batch
+    
+    parser = argparse.ArgumentParser(prog="mission-planner", description="Assess a file of missions")
+    parser.add_argument("--batch", required=True, metavar="FILE", help="CSV or JSONL mission requests ('-' for CSV on stdin)")
+    parser.add_argument("--output", default="-", metavar="FILE", help="Output .csv, .jsonl or .parquet (default: stdout)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Output format when writing to stdout (default: csv)")
+    parser.add_argument("--errors", metavar="FILE", help="Where rejected rows are written (JSON Lines)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows processed together")
+    args = parser.parse_args(argv)
+    
+    try:
+        assessed, rejected = run_batch(args.batch, args.output, args.errors, args.format, args.chunk_size)
+    except (OSError, ValueError, ImportError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        sys.exit(1)
+    
+    summary = f"Assessed {assessed} missions"
+    if rejected:
+        summary += f", rejected {rejected} (see {args.errors or default_error_path(args.batch, args.output)})"
+    print(summary, file=sys.stderr)
+
+@cli_entry_point
+def main(argv=None):
+    """Command line entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    if any(arg == "--batch" or arg.startswith("--batch=") for arg in argv):
+        run_batch_cli(argv)
+    elif len(argv) == 0:
+        show_options()
+    elif len(argv) == 4:
+        user_aircraft, user_target, user_weather, user_time = argv
+        
+        # Validate and correct inputs
+        validated = validate_inputs(user_aircraft, user_target, user_weather, user_time)
+        
+        if validated:
+            aircraft, target, weather, time_of_day = validated
+            assess_mission(aircraft, target, weather, time_of_day)
+        else:
+            print("\nUse 'mission-planner' to see all available options")
+    else:
+        print("Error: Need exactly 4 parameters")
+        show_options()
+
+if __name__ == "__main__":
+    main()
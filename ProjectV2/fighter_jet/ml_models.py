@@ -0,0 +1,475 @@
+import logging
+import sys
+import time
+import numpy as np
+from .instrumentation import stage, cli_entry_point
+from .progress import get_logger
+
+logger = get_logger(__name__)
+
+# pandas, sklearn and joblib are imported inside the functions that use them,
+# so importing this module for build_feature_matrix stays cheap
+
+def load_training_data(filename="complete_training_data.csv"):  # Changed filename
+    """
+    Load the training dataset we generated
+    
+    The format is chosen by extension (.csv, .npz, .feather, .parquet or a
+    shard manifest); binary formats are memory-mapped.
+    
+    Returns:
+        pandas DataFrame
+    """
+    from .dataset_io import load_dataset
+    
+    logger.info("Loading training data from %s...", filename)
+    with stage('load') as timer:
+        df = load_dataset(filename)
+        timer.add_rows(len(df))
+    logger.info("Loaded %d training examples", len(df))
+    logger.debug("Columns: %s", list(df.columns))
+    
+    # Show rating distribution
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Mission rating distribution:\n%s", df['mission_rating'].value_counts().sort_index())
+    
+    return df
+
+# Feature matrix columns built by prepare_features
+FEATURE_NAMES = ['aircraft_precision', 'aircraft_stealth', 'target_difficulty', 'weather_modifier', 'time_modifier']
+
+
+def build_feature_matrix(aircraft_ids, target_ids, weather_ids, time_ids, dtype=np.float64, out=None):
+    """
+    Gather the feature matrix for integer-coded scenarios
+    
+    Args:
+        aircraft_ids, target_ids, weather_ids, time_ids: Registry codes (equal length)
+        dtype: Feature matrix dtype (e.g. np.float32 or np.float64)
+        out: Optional preallocated (n, 5) array to write the features into
+        
+    Returns:
+        X: Feature matrix with columns FEATURE_NAMES
+    """
+    from .scoring import (
+        AIRCRAFT_PRECISION, AIRCRAFT_STEALTH, TARGET_DIFFICULTY,
+        WEATHER_PRECISION_MODIFIER, TIME_CIVILIAN_MODIFIER
+    )
+    
+    num_rows = len(aircraft_ids)
+    if out is None:
+        X = np.empty((num_rows, len(FEATURE_NAMES)), dtype=dtype)
+    else:
+        X = out
+        if X.shape != (num_rows, len(FEATURE_NAMES)):
+            raise ValueError(f"out has shape {X.shape}, expected {(num_rows, len(FEATURE_NAMES))}")
+    
+    # Spec column and codes for each feature, in FEATURE_NAMES order
+    feature_sources = [
+        (AIRCRAFT_PRECISION, aircraft_ids),
+        (AIRCRAFT_STEALTH, aircraft_ids),
+        (TARGET_DIFFICULTY, target_ids),
+        (WEATHER_PRECISION_MODIFIER, weather_ids),
+        (TIME_CIVILIAN_MODIFIER, time_ids)
+    ]
+    
+    # Gather spec values straight into each output column
+    for i, (spec_column, codes) in enumerate(feature_sources):
+        np.take(spec_column.astype(X.dtype, copy=False), codes, out=X[:, i])
+    
+    return X
+
+
+def prepare_features(df, dtype=np.float64, out=None):
+    """
+    Convert text data to numerical features for machine learning
+    
+    Each text column is converted to registry codes in one pass and the codes
+    are used to gather from the precomputed spec columns, so there is no
+    per-row Python work.
+    
+    Args:
+        df: Raw training data with text values
+        dtype: Feature matrix dtype (e.g. np.float32 or np.float64)
+        out: Optional preallocated (len(df), 5) array to write the features into
+        
+    Returns:
+        X: Feature matrix (numbers only)
+        y_dest: Destruction probability targets
+        y_civ: Civilian risk targets  
+        y_rating: Mission rating targets
+    """
+    
+    logger.debug("Converting text data to numerical features...")
+    
+    # Import the name indexes
+    from .scoring import AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES
+    from .dataset_io import encode_column
+    
+    # Categorical codes for each text column
+    with stage('encode', rows=len(df)):
+        X = build_feature_matrix(
+            encode_column(df['aircraft'], AIRCRAFT_NAMES),
+            encode_column(df['target'], TARGET_NAMES),
+            encode_column(df['weather'], WEATHER_NAMES),
+            encode_column(df['time_of_day'], TIME_NAMES),
+            dtype=dtype,
+            out=out
+        )
+    
+    y_dest = df['destruction_probability'].to_numpy()
+    y_civ = df['civilian_risk'].to_numpy()
+    y_rating = df['mission_rating'].to_numpy()
+    
+    logger.info("Created feature matrix: %s", X.shape)
+    logger.debug("Feature names: %s", FEATURE_NAMES)
+    
+    return X, y_dest, y_civ, y_rating
+
+
+def fit_model(model, name, X_train, y_train, registry=None):
+    """
+    Fit a model, or reuse the registry copy trained on the same data
+    
+    Args:
+        model: Unfitted estimator
+        name: Registry name for the model
+        X_train, y_train: Training data
+        registry: Optional ModelRegistry; without one the model is always fitted
+        
+    Returns:
+        tuple: (fitted model, trained) where trained is False if a saved model was reused
+    """
+    with stage('fit', rows=len(X_train)):
+        if registry is None:
+            model.fit(X_train, y_train)
+            return model, True
+        
+        model, _, trained = registry.get_or_train(name, model, X_train, y_train, FEATURE_NAMES)
+    if not trained:
+        logger.info("Reusing saved model '%s'", name)
+    return model, trained
+
+
+def train_regression_models(X, y_dest, y_civ, registry=None):
+    """
+    Train regression models to predict destruction probability and civilian risk
+    
+    Args:
+        X: Feature matrix
+        y_dest: Destruction probability targets
+        y_civ: Civilian risk targets
+        registry: Optional ModelRegistry to save models in and skip retraining
+        
+    Returns:
+        Dictionary of trained models and their performance
+    """
+    
+    from sklearn.model_selection import train_test_split
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_squared_error
+    
+    logger.info("Training regression models...")
+    
+    # Split data into training and testing sets
+    X_train, X_test, y_dest_train, y_dest_test, y_civ_train, y_civ_test = train_test_split(
+        X, y_dest, y_civ, test_size=0.2, random_state=42
+    )
+    
+    # Models to train
+    models = {
+        'Linear Regression': LinearRegression(),
+        'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42)
+    }
+    
+    results = {}
+    
+    # Train models for destruction probability
+    logger.info("Destruction Probability Prediction:")
+    for name, model in models.items():
+        model, trained = fit_model(model, f'{name}_destruction', X_train, y_dest_train, registry)
+        with stage('predict', rows=2 * len(X_test)):
+            y_pred = model.predict(X_test)
+            rmse = np.sqrt(mean_squared_error(y_dest_test, y_pred))
+            score = model.score(X_test, y_dest_test)
+        if registry is not None and trained:
+            registry.update_metrics(f'{name}_destruction', {'rmse': float(rmse), 'r2_score': float(score)})
+        
+        results[f'{name}_destruction'] = {
+            'model': model,
+            'rmse': rmse,
+            'r2_score': score
+        }
+        
+        logger.info("%-15s - RMSE: %.2f%%, R² Score: %.3f", name, rmse, score)
+    
+    # Train models for civilian risk
+    logger.info("Civilian Risk Prediction:")
+    for name, base_model in models.items():
+        model = type(base_model)(**base_model.get_params()) if hasattr(base_model, 'get_params') else type(base_model)()
+        model, trained = fit_model(model, f'{name}_civilian', X_train, y_civ_train, registry)
+        with stage('predict', rows=2 * len(X_test)):
+            y_pred = model.predict(X_test)
+            rmse = np.sqrt(mean_squared_error(y_civ_test, y_pred))
+            score = model.score(X_test, y_civ_test)
+        if registry is not None and trained:
+            registry.update_metrics(f'{name}_civilian', {'rmse': float(rmse), 'r2_score': float(score)})
+        
+        results[f'{name}_civilian'] = {
+            'model': model,
+            'rmse': rmse,
+            'r2_score': score
+        }
+        
+        logger.info("%-15s - RMSE: %.2f%%, R² Score: %.3f", name, rmse, score)
+    
+    return results
+
+
+
+def train_classification_models(X, y_rating, registry=None):
+    """
+    Train classification models to predict mission ratings
+    
+    Args:
+        X: Feature matrix
+        y_rating: Mission rating targets (S-RANK, A-RANK, etc.)
+        registry: Optional ModelRegistry to save models in and skip retraining
+        
+    Returns:
+        Dictionary of trained models and their performance
+    """
+    
+    from sklearn.model_selection import train_test_split
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, classification_report
+    
+    logger.info("Training classification models...")
+    
+    # Split data into training and testing sets
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y_rating, test_size=0.2, random_state=42
+    )
+    
+    # Models to train
+    models = {
+        'Logistic Regression': LogisticRegression(random_state=42, max_iter=1000),
+        'Random Forest': RandomForestClassifier(n_estimators=100, random_state=42)
+    }
+    
+    results = {}
+    
+    logger.info("Mission Rating Classification:")
+    for name, model in models.items():
+        model, trained = fit_model(model, f'{name}_rating', X_train, y_train, registry)
+        with stage('predict', rows=len(X_test)):
+            y_pred = model.predict(X_test)
+        accuracy = accuracy_score(y_test, y_pred)
+        if registry is not None and trained:
+            registry.update_metrics(f'{name}_rating', {'accuracy': float(accuracy)})
+        
+        results[name] = {
+            'model': model,
+            'accuracy': accuracy,
+            'predictions': y_pred,
+            'actual': y_test
+        }
+        
+        logger.info("%-18s - Accuracy: %.3f", name, accuracy)
+        
+        # Detailed classification report (only built when it will be shown)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s Classification Report:\n%s", name, classification_report(y_test, y_pred))
+    
+    return results
+
+
+def split_dataset(X, y_dest, y_civ, y_rating, test_size=0.2, random_state=42):
+    """
+    Split the features and all three targets once
+    
+    Uses the same split as the per-target training functions.
+    
+    Returns:
+        tuple: (X_train, X_test, Y_train, Y_test, rating_train, rating_test) where
+        Y columns are [destruction_probability, civilian_risk]
+    """
+    from sklearn.model_selection import train_test_split
+    
+    Y = np.column_stack([y_dest, y_civ])
+    return train_test_split(X, Y, y_rating, test_size=test_size, random_state=random_state)
+
+
+class OutputColumn:
+    """
+    One target of a multi-output regressor, used like a single-target model
+    
+    predict() returns the column for this target, so results from
+    train_all_models can be used like those of train_regression_models.
+    The shared multi-output model is `estimator`.
+    """
+    
+    def __init__(self, estimator, column):
+        self.estimator = estimator
+        self.column = column
+    
+    def predict(self, X):
+        return self.estimator.predict(X)[:, self.column]
+
+
+def train_all_models(X, y_dest, y_civ, y_rating, registry=None, n_jobs=-1):
+    """
+    Train the regression and classification models in one pass
+    
+    The data is split once. Each regressor is a single multi-output model
+    predicting destruction probability and civilian risk together. The
+    independent fits run concurrently on a thread pool (the NumPy/SciPy
+    solvers release the GIL), and the n_jobs cores are split between that
+    pool and the trees of each random forest, so no more than n_jobs
+    threads are busy at once.
+    
+    Args:
+        X: Feature matrix
+        y_dest, y_civ, y_rating: Targets
+        registry: Optional ModelRegistry to save models in and skip retraining
+        n_jobs: Parallel jobs (-1 uses every core)
+        
+    Returns:
+        tuple: (regression_results, classification_results) shaped like the
+        results of train_regression_models and train_classification_models;
+        each regression 'model' is an OutputColumn predicting its own target
+    """
+    
+    from joblib import Parallel, delayed, effective_n_jobs
+    from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+    from sklearn.linear_model import LinearRegression, LogisticRegression
+    from sklearn.metrics import mean_squared_error, accuracy_score, r2_score
+    
+    logger.info("Training all models...")
+    
+    X_train, X_test, Y_train, Y_test, rating_train, rating_test = split_dataset(X, y_dest, y_civ, y_rating)
+    
+    # (registry name, estimator, targets)
+    fits = [
+        ('Linear Regression_regression', LinearRegression(), Y_train),
+        ('Random Forest_regression', RandomForestRegressor(n_estimators=100, random_state=42), Y_train),
+        ('Logistic Regression_rating', LogisticRegression(random_state=42, max_iter=1000), rating_train),
+        ('Random Forest_rating', RandomForestClassifier(n_estimators=100, random_state=42), rating_train)
+    ]
+    
+    # Cores for the concurrent fits, and the rest for the trees within each forest
+    cores = effective_n_jobs(n_jobs)
+    outer_jobs = min(len(fits), cores)
+    for _, model, _ in fits:
+        if isinstance(model, (RandomForestRegressor, RandomForestClassifier)):
+            model.set_params(n_jobs=max(1, cores // outer_jobs))
+    
+    fitted = Parallel(n_jobs=outer_jobs, prefer="threads")(
+        delayed(fit_model)(model, name, X_train, y_train, registry) for name, model, y_train in fits
+    )
+    
+    regression_results = {}
+    classification_results = {}
+    
+    logger.info("Destruction Probability / Civilian Risk Prediction:")
+    for (name, _, _), (model, trained) in zip(fits[:2], fitted[:2]):
+        base_name = name[:-len('_regression')]
+        with stage('predict', rows=len(X_test)):
+            Y_pred = model.predict(X_test)
+        metrics = {}
+        
+        for column, target in enumerate(['destruction', 'civilian']):
+            rmse = np.sqrt(mean_squared_error(Y_test[:, column], Y_pred[:, column]))
+            score = r2_score(Y_test[:, column], Y_pred[:, column])
+            metrics[f'{target}_rmse'] = float(rmse)
+            metrics[f'{target}_r2_score'] = float(score)
+            
+            regression_results[f'{base_name}_{target}'] = {
+                'model': OutputColumn(model, column),
+                'rmse': rmse,
+                'r2_score': score
+            }
+        
+        if registry is not None and trained:
+            registry.update_metrics(name, metrics)
+        
+        logger.info("%-15s - destruction RMSE: %.2f%%, R²: %.3f | civilian RMSE: %.2f%%, R²: %.3f",
+                    base_name, metrics['destruction_rmse'], metrics['destruction_r2_score'],
+                    metrics['civilian_rmse'], metrics['civilian_r2_score'],
+                    extra={'metrics': {'model': name, **metrics}})
+    
+    logger.info("Mission Rating Classification:")
+    for (name, _, _), (model, trained) in zip(fits[2:], fitted[2:]):
+        base_name = name[:-len('_rating')]
+        with stage('predict', rows=len(X_test)):
+            y_pred = model.predict(X_test)
+        accuracy = accuracy_score(rating_test, y_pred)
+        if registry is not None and trained:
+            registry.update_metrics(name, {'accuracy': float(accuracy)})
+        
+        classification_results[base_name] = {
+            'model': model,
+            'accuracy': accuracy,
+            'predictions': y_pred,
+            'actual': rating_test
+        }
+        
+        logger.info("%-18s - Accuracy: %.3f", base_name, accuracy, extra={'metrics': {'model': name, 'accuracy': float(accuracy)}})
+    
+    return regression_results, classification_results
+
+
+def compare_training_paths(X, y_dest, y_civ, y_rating, n_jobs=-1):
+    """
+    Time the sequential per-target training against train_all_models
+    
+    Neither path uses the registry, so both really train.
+    
+    Returns:
+        tuple: (sequential_seconds, parallel_seconds)
+    """
+    start = time.perf_counter()
+    train_regression_models(X, y_dest, y_civ)
+    train_classification_models(X, y_rating)
+    sequential = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    train_all_models(X, y_dest, y_civ, y_rating, n_jobs=n_jobs)
+    parallel = time.perf_counter() - start
+    
+    logger.info("Sequential training: %.2fs", sequential)
+    logger.info("One-pass parallel training: %.2fs (%.2fx speedup)", parallel, sequential / parallel)
+    
+    return sequential, parallel
+
+
+@cli_entry_point
+def main(argv=None):
+    """Command line entry point ('--compare' times the sequential path against train_all_models)"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Load the data
+    df = load_training_data()
+    print("\nFirst few rows:")
+    print(df.head())
+    
+    # Convert to numerical features
+    X, y_dest, y_civ, y_rating = prepare_features(df)
+    print(f"\nFeature matrix shape: {X.shape}")
+    
+    # Saved models are reused while the data and hyperparameters are unchanged
+    from .model_registry import ModelRegistry
+    registry = ModelRegistry()
+    
+    if '--compare' in argv:
+        # Report the speedup of the one-pass pipeline over the per-target functions
+        compare_training_paths(X, y_dest, y_civ, y_rating)
+    else:
+        # Train regression and classification models in one pass
+        train_all_models(X, y_dest, y_civ, y_rating, registry)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from .instrumentation import stage, count
+from .utils import user_data_dir
+
+# Default location of saved models (the user data directory unless MODEL_REGISTRY_DIR is set)
+DEFAULT_REGISTRY_DIR = os.environ.get(
+    "MODEL_REGISTRY_DIR",
+    os.path.join(user_data_dir(), "models")
+)
+
+
+def dataset_hash(*arrays):
+    """
+    Content hash of training arrays (features and targets)
+
+    Returns:
+        str: SHA-256 hex digest covering dtype, shape and bytes of every array
+    """
+    import numpy as np
+
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        if array.dtype == object:
+            array = array.astype(str)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def model_fingerprint(metadata):
+    """
+    Identify one saved version of a model from its registry metadata
+
+    Changes whenever the model is retrained (new dataset hash, hyperparameters
+    or save time), so artifacts derived from a model can tell they are stale.
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    source = {key: metadata[key] for key in ("dataset_hash", "params", "saved_at")}
+    return hashlib.sha256(json.dumps(source, sort_keys=True).encode()).hexdigest()
+
+
+# Parameters that change how a model is fitted or used, not the model itself
+RUNTIME_PARAMS = ("n_jobs", "verbose")
+
+
+def _json_params(estimator):
+    """Estimator hyperparameters in a JSON-comparable form"""
+    params = {key: value for key, value in estimator.get_params().items() if key not in RUNTIME_PARAMS}
+    return json.loads(json.dumps(params, sort_keys=True, default=repr))
+
+
+def _write_atomic(path, write):
+    """
+    Write a file under a temporary name in the same directory, then move it into place
+
+    Readers see either the previous file or the complete new one, never a
+    partly written file, even with concurrent writers or a crash mid-write.
+
+    Args:
+        path: Final path
+        write: Function that writes the content to the path it is given
+    """
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_json(path, data):
+    def write(tmp_path):
+        with open(tmp_path, "w") as file:
+            json.dump(data, file, indent=2)
+    _write_atomic(path, write)
+
+
+class LazyModel:
+    """
+    Handle to a saved model that is only loaded on first use
+
+    Attribute access (predict, predict_proba, classes_, ...) loads the model
+    and forwards to it.
+    """
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+        self._model = None
+
+    @property
+    def metadata(self):
+        return self.registry.metadata(self.name)
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = self.registry.load(self.name)
+        return self._model
+
+    @property
+    def loaded(self):
+        return self._model is not None
+
+    def __getattr__(self, attribute):
+        if attribute.startswith("_"):
+            raise AttributeError(attribute)
+        return getattr(self.model, attribute)
+
+    def __repr__(self):
+        return f"LazyModel({self.name!r}, loaded={self.loaded})"
+
+
+class ModelRegistry:
+    """
+    Trained models saved with their metadata
+
+    Each model is stored as <name>.joblib (uncompressed, so NumPy arrays can be
+    memory-mapped on load) next to <name>.json with the estimator class,
+    hyperparameters, feature schema, dataset hash, metrics and training time.
+    """
+
+    def __init__(self, directory=DEFAULT_REGISTRY_DIR):
+        self.directory = directory
+
+    def _path(self, name, ext):
+        safe_name = name.replace(" ", "_").replace("/", "_")
+        return os.path.join(self.directory, f"{safe_name}{ext}")
+
+    def artifact_path(self, name, suffix):
+        """Path for a file derived from a saved model (e.g. a compiled export)"""
+        return self._path(name, suffix)
+
+    def names(self):
+        """Names of all saved models"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = []
+        for filename in sorted(os.listdir(self.directory)):
+            # Metadata files sit next to their .joblib; other JSON (e.g. distill_report.json) is skipped
+            stem, ext = os.path.splitext(filename)
+            if ext == ".json" and os.path.exists(os.path.join(self.directory, stem + ".joblib")):
+                with open(os.path.join(self.directory, filename)) as file:
+                    names.append(json.load(file)["name"])
+        return names
+
+    def metadata(self, name):
+        """Metadata of a saved model, or None if it is not in the registry"""
+        try:
+            with open(self._path(name, ".json")) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, name, model, feature_names, data_hash, metrics=None, training_time=None):
+        """
+        Save a fitted model and its metadata
+
+        Returns:
+            dict: The metadata written
+        """
+        import joblib
+        import sklearn
+
+        os.makedirs(self.directory, exist_ok=True)
+        _write_atomic(self._path(name, ".joblib"), lambda tmp_path: joblib.dump(model, tmp_path))
+
+        metadata = {
+            "name": name,
+            "estimator": type(model).__name__,
+            "params": _json_params(model),
+            "feature_names": list(feature_names),
+            "dataset_hash": data_hash,
+            "metrics": metrics or {},
+            "training_time": training_time,
+            "sklearn_version": sklearn.__version__,
+            "saved_at": datetime.now(timezone.utc).isoformat()
+        }
+        _write_json(self._path(name, ".json"), metadata)
+
+        return metadata
+
+    def update_metrics(self, name, metrics):
+        """Replace the stored metrics of a saved model"""
+        metadata = self.metadata(name)
+        metadata["metrics"] = metrics
+        _write_json(self._path(name, ".json"), metadata)
+        return metadata
+
+    def load(self, name, mmap=True):
+        """Load a saved model now (arrays memory-mapped where the estimator allows)"""
+        import joblib
+
+        with stage('load'):
+            return joblib.load(self._path(name, ".joblib"), mmap_mode="r" if mmap else None)
+
+    def lazy(self, name):
+        """Return a LazyModel that loads the model on first use"""
+        if self.metadata(name) is None:
+            raise KeyError(f"Model '{name}' is not in the registry at {self.directory}")
+        return LazyModel(self, name)
+
+    def is_current(self, name, estimator, data_hash):
+        """True if a saved model was trained on this dataset with these hyperparameters"""
+        metadata = self.metadata(name)
+        return (
+            metadata is not None
+            and metadata["dataset_hash"] == data_hash
+            and metadata["estimator"] == type(estimator).__name__
+            and metadata["params"] == _json_params(estimator)
+            and os.path.exists(self._path(name, ".joblib"))
+        )
+
+    def get_or_train(self, name, estimator, X, y, feature_names):
+        """
+        Return a trained model, fitting and saving it only when needed
+
+        Args:
+            name: Registry name
+            estimator: Unfitted estimator with the wanted hyperparameters
+            X, y: Training data
+            feature_names: Names of the columns of X
+
+        Returns:
+            tuple: (model, metadata, trained) where trained is False when the
+            saved model was reused
+        """
+        data_hash = dataset_hash(X, y)
+
+        if self.is_current(name, estimator, data_hash):
+            count('registry.hit')
+            return LazyModel(self, name), self.metadata(name), False
+        count('registry.miss')
+
+        start = time.perf_counter()
+        estimator.fit(X, y)
+        training_time = time.perf_counter() - start
+
+        metadata = self.save(name, estimator, feature_names, data_hash, training_time=training_time)
+        return estimator, metadata, True
@@ -0,0 +1,293 @@
+import copy
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+import numpy as np
+from .scoring import AIRCRAFT_IDS, TARGET_IDS, WEATHER_IDS, TIME_IDS, encode_scenarios
+from .model_registry import ModelRegistry, DEFAULT_REGISTRY_DIR
+from .compiled_forest import GridModel, compile_forest
+from .instrumentation import stage, cli_entry_point
+
+# Ways of evaluating the models: sklearn itself, the compiled node arrays, or a
+# lookup into outputs precomputed over the scenario grid
+BACKENDS = ('sklearn', 'compiled', 'grid')
+
+# Code columns of predict() and the number of valid codes in each
+CODE_COLUMNS = (('aircraft', len(AIRCRAFT_IDS)), ('target', len(TARGET_IDS)),
+                ('weather', len(WEATHER_IDS)), ('time_of_day', len(TIME_IDS)))
+
+# Calls with at most this many rows count as single-row in the latency stats
+SINGLE_ROW = 1
+
+
+class LatencyStats:
+    """Rolling latency samples for single-row and batch calls"""
+
+    def __init__(self, max_samples=100000):
+        self.samples = {'single': deque(maxlen=max_samples), 'batch': deque(maxlen=max_samples)}
+        self._lock = threading.Lock()
+
+    def record(self, num_rows, seconds):
+        kind = 'single' if num_rows <= SINGLE_ROW else 'batch'
+        with self._lock:
+            self.samples[kind].append(seconds)
+
+    def summary(self):
+        """
+        Returns:
+            dict: kind -> {'count', 'p50_ms', 'p99_ms'} (percentiles None without samples)
+        """
+        with self._lock:
+            samples = {kind: np.array(values) for kind, values in self.samples.items()}
+
+        summary = {}
+        for kind, values in samples.items():
+            if len(values) == 0:
+                summary[kind] = {'count': 0, 'p50_ms': None, 'p99_ms': None}
+            else:
+                p50, p99 = np.percentile(values * 1000, [50, 99])
+                summary[kind] = {'count': len(values), 'p50_ms': float(p50), 'p99_ms': float(p99)}
+        return summary
+
+    def reset(self):
+        with self._lock:
+            for values in self.samples.values():
+                values.clear()
+
+
+class Predictor:
+    """
+    In-process inference for the trained models
+
+    The regression model (multi-output destruction probability / civilian
+    risk) and the rating classifier are loaded once. predict() takes whole
+    arrays; predict_one() takes a single scenario and, when it is called from
+    several threads, requests arriving within batch_window seconds are
+    combined into one vectorized predict call.
+    """
+
+    def __init__(self, regressor=None, classifier=None, registry_dir=DEFAULT_REGISTRY_DIR,
+                 regression_model='Random Forest_regression', rating_model='Random Forest_rating',
+                 batch_window=0.001, max_batch_size=10000, n_jobs=1, backend='sklearn'):
+        """
+        Args:
+            regressor, classifier: Fitted models; loaded from the registry when omitted
+            registry_dir: Registry to load the models from
+            regression_model, rating_model: Registry names of the models
+            batch_window: Seconds to wait for more predict_one calls before predicting
+            max_batch_size: Largest micro-batch
+            n_jobs: Threads the forests use per call (1 avoids thread start-up on small calls)
+            backend: One of BACKENDS; 'compiled' needs random forests, 'grid' works with
+            any model and uses the distilled tables when there are current ones
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Available: {BACKENDS}")
+
+        # The grid backend serves distilled tables (see distill.py) when they are current
+        if backend == 'grid' and regressor is None and classifier is None:
+            from .distill import load_distilled
+            regressor = load_distilled(regression_model, registry_dir)
+            classifier = load_distilled(rating_model, registry_dir)
+            if regressor is None or classifier is None:
+                regressor = classifier = None
+
+        if regressor is None or classifier is None:
+            registry = ModelRegistry(registry_dir)
+            for name in (regression_model, rating_model):
+                if registry.metadata(name) is None:
+                    raise KeyError(f"Model '{name}' is not in the registry at {registry_dir}; run train-models first")
+            if regressor is None:
+                regressor = registry.load(regression_model, mmap=False)
+            if classifier is None:
+                classifier = registry.load(rating_model, mmap=False)
+
+        # n_jobs is set on copies so the caller's models are left as they were
+        regressor, classifier = (_with_n_jobs(model, n_jobs) for model in (regressor, classifier))
+
+        if backend == 'compiled':
+            regressor, classifier = compile_forest(regressor), compile_forest(classifier)
+        elif backend == 'grid':
+            if not isinstance(regressor, GridModel):
+                regressor = GridModel.from_model(regressor)
+            if not isinstance(classifier, GridModel):
+                classifier = GridModel.from_model(classifier)
+
+        self.backend = backend
+        self.regressor = regressor
+        self.classifier = classifier
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.latency = LatencyStats()
+
+        self._requests = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def _predict_codes(self, aircraft_ids, target_ids, weather_ids, time_ids):
+        with stage('predict', rows=len(aircraft_ids)):
+            return self._predict_outputs(aircraft_ids, target_ids, weather_ids, time_ids)
+
+    def _predict_outputs(self, aircraft_ids, target_ids, weather_ids, time_ids):
+        if self.backend == 'grid':
+            Y = self.regressor.predict_codes(aircraft_ids, target_ids, weather_ids, time_ids)
+            ratings = self.classifier.predict_codes(aircraft_ids, target_ids, weather_ids, time_ids)
+        else:
+            from .ml_models import build_feature_matrix
+
+            X = build_feature_matrix(aircraft_ids, target_ids, weather_ids, time_ids)
+            Y = self.regressor.predict(X)
+            ratings = self.classifier.predict(X)
+
+        Y = Y.reshape(len(ratings), -1)
+        return Y[:, 0], Y[:, 1], ratings
+
+    def predict(self, aircraft, target, weather, time_of_day):
+        """
+        Predict every output for arrays of scenarios
+
+        Args:
+            aircraft, target, weather, time_of_day: Equal-length sequences of
+            names, or integer arrays of registry codes
+
+        Returns:
+            tuple: (destruction_probability, civilian_risk, mission_rating) arrays
+
+        Raises:
+            ValueError: A code is outside its registry
+        """
+        start = time.perf_counter()
+
+        columns = [np.asarray(column) for column in (aircraft, target, weather, time_of_day)]
+        if all(column.dtype.kind in 'iu' for column in columns):
+            for column, (field, size) in zip(columns, CODE_COLUMNS):
+                if column.size and (column.min() < 0 or column.max() >= size):
+                    raise ValueError(f"{field} codes must be between 0 and {size - 1}")
+            codes = columns
+        else:
+            codes = encode_scenarios(*columns)
+
+        result = self._predict_codes(*codes)
+        self.latency.record(len(codes[0]), time.perf_counter() - start)
+        return result
+
+    def predict_one(self, aircraft, target, weather, time_of_day):
+        """
+        Predict one scenario through the micro-batching queue
+
+        Returns:
+            tuple: (destruction_probability, civilian_risk, mission_rating)
+        """
+        start = time.perf_counter()
+        codes = (AIRCRAFT_IDS[aircraft], TARGET_IDS[target], WEATHER_IDS[weather], TIME_IDS[time_of_day])
+
+        future = Future()
+        self._ensure_worker()
+        self._requests.put((codes, future))
+        result = future.result()
+
+        self.latency.record(1, time.perf_counter() - start)
+        return result
+
+    def _ensure_worker(self):
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._serve, name="predictor-batcher", daemon=True)
+                self._worker.start()
+
+    def _serve(self):
+        """Collect queued requests for up to batch_window seconds and predict them together"""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            batch = [request]
+
+            deadline = time.perf_counter() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    request = self._requests.get(timeout=max(remaining, 0)) if remaining > 0 else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._requests.put(None)
+                    break
+                batch.append(request)
+
+            codes = np.array([codes for codes, _ in batch], dtype=np.intp)
+            try:
+                destruction, civilian, ratings = self._predict_codes(*codes.T)
+            except Exception as error:
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+
+            for i, (_, future) in enumerate(batch):
+                future.set_result((float(destruction[i]), float(civilian[i]), ratings[i]))
+
+    def close(self):
+        """Stop the micro-batching thread"""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._requests.put(None)
+                self._worker.join()
+                self._worker = None
+                self._requests = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _with_n_jobs(model, n_jobs):
+    """Shallow copy of a model with n_jobs set (fitted state is shared, not copied)"""
+    if getattr(model, 'n_jobs', n_jobs) == n_jobs:
+        return model
+    model = copy.copy(model)
+    model.n_jobs = n_jobs
+    return model
+
+
+def measure_latency(predictor, repeats=200, batch_rows=10000, seed=0):
+    """
+    Measure p50/p99 latency of single-row and batch predict calls
+
+    Args:
+        predictor: Predictor to measure
+        repeats: Calls per kind (batch calls use repeats // 10)
+        batch_rows: Rows per batch call
+
+    Returns:
+        dict: Latency summary as returned by LatencyStats.summary
+    """
+    rng = np.random.default_rng(seed)
+    sizes = (len(AIRCRAFT_IDS), len(TARGET_IDS), len(WEATHER_IDS), len(TIME_IDS))
+    predictor.latency.reset()
+
+    for _ in range(repeats):
+        predictor.predict(*[rng.integers(0, size, 1) for size in sizes])
+    for _ in range(max(1, repeats // 10)):
+        predictor.predict(*[rng.integers(0, size, batch_rows) for size in sizes])
+
+    return predictor.latency.summary()
+
+
+@cli_entry_point
+def main():
+    """Command line entry point: latency of every backend"""
+    for backend in BACKENDS:
+        predictor = Predictor(backend=backend)
+        print(f"\n{backend}: {predictor.predict_one('F-35A', 'bridge', 'clear', 'night')}")
+
+        print("Latency (ms):")
+        for kind, stats in measure_latency(predictor).items():
+            print(f"{kind:7} - calls: {stats['count']:4}, p50: {stats['p50_ms']:.3f}, p99: {stats['p99_ms']:.3f}")
+        predictor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Logging and progress reporting for the library modules
+
+Library functions log to loggers under 'fighter_jet' and stay silent unless
+the application configures logging (the command line entry points do, see
+configure_logging). Long loops report through Progress, which emits at most
+one update per interval of wall time however many rows go through it.
+
+Environment variables read by configure_logging:
+    FIGHTER_JET_LOG_LEVEL=DEBUG|INFO|WARNING   (default INFO)
+    FIGHTER_JET_LOG_FORMAT=text|json           (json: one object per line with the metrics)
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+
+ROOT_LOGGER = "fighter_jet"
+LOG_LEVEL_ENV = "FIGHTER_JET_LOG_LEVEL"
+LOG_FORMAT_ENV = "FIGHTER_JET_LOG_FORMAT"
+
+# Seconds between progress updates
+PROGRESS_INTERVAL = 1.0
+
+# Without configuration nothing is printed, not even through logging's last-resort handler
+logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
+
+
+def get_logger(name):
+    """Logger for a module (pass __name__; a module run with python -m is named after its file)"""
+    if name == "__main__":
+        main_file = getattr(sys.modules["__main__"], "__file__", None)
+        name = os.path.splitext(os.path.basename(main_file))[0] if main_file else name
+    if not name.startswith(f"{ROOT_LOGGER}."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message plus any metrics"""
+
+    def format(self, record):
+        event = {
+            'time': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        event.update(getattr(record, 'metrics', {}))
+        return json.dumps(event)
+
+
+def configure_logging(level=None, fmt=None, stream=None):
+    """
+    Send the library's log records to a stream (stderr by default)
+
+    Calling it again replaces the handler it installed before.
+
+    Args:
+        level: Level name or number (default: FIGHTER_JET_LOG_LEVEL or INFO)
+        fmt: 'text' or 'json' (default: FIGHTER_JET_LOG_FORMAT or text)
+        stream: Where to write (default: sys.stderr)
+    """
+    level = level or os.environ.get(LOG_LEVEL_ENV) or "INFO"
+    fmt = fmt or os.environ.get(LOG_FORMAT_ENV) or "text"
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        if getattr(handler, '_fighter_jet', False):
+            logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter("%(message)s"))
+    handler._fighter_jet = True
+    logger.addHandler(handler)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+
+class Progress:
+    """
+    Rate-limited progress for a long-running loop
+
+    update() only adds to a counter and, once the interval has passed, logs
+    one record with the rows done, rows/s and ETA (attached as record.metrics
+    for structured output). Nothing is timed when the logger would drop the
+    records anyway. close() logs the final totals.
+
+    Usage:
+        with Progress(logger, "Generating training data", total=num_rows) as progress:
+            for chunk in chunks:
+                ...
+                progress.update(len(chunk))
+    """
+
+    def __init__(self, logger, task, total=None, unit="rows", interval=PROGRESS_INTERVAL, level=logging.INFO):
+        self.logger = logger
+        self.task = task
+        self.total = total
+        self.unit = unit
+        self.interval = interval
+        self.level = level
+        self.done = 0
+        self.enabled = logger.isEnabledFor(level)
+        self.start = time.perf_counter()
+        self._next_update = self.start + interval
+
+    def update(self, n=1):
+        self.done += n
+        if self.enabled:
+            now = time.perf_counter()
+            if now >= self._next_update:
+                self._next_update = now + self.interval
+                self._log(now, finished=False)
+
+    def metrics(self, now=None):
+        """
+        Returns:
+            dict: task, done, total, elapsed_s, rows_per_s and eta_s (None when unknown)
+        """
+        elapsed = (now or time.perf_counter()) - self.start
+        rate = self.done / elapsed if elapsed > 0 else None
+        remaining = None if self.total is None else max(self.total - self.done, 0)
+        return {
+            'task': self.task,
+            'done': self.done,
+            'total': self.total,
+            'elapsed_s': round(elapsed, 3),
+            f'{self.unit}_per_s': round(rate, 1) if rate is not None else None,
+            'eta_s': round(remaining / rate, 1) if rate and remaining is not None else None
+        }
+
+    def _log(self, now, finished):
+        metrics = self.metrics(now)
+        rate = metrics[f'{self.unit}_per_s']
+        rate_text = f"{rate:,.0f} {self.unit}/s" if rate is not None else f"- {self.unit}/s"
+
+        if finished:
+            message = f"{self.task}: {self.done:,} {self.unit} in {metrics['elapsed_s']:.2f}s ({rate_text})"
+        elif self.total:
+            eta = f", ETA {metrics['eta_s']:.0f}s" if metrics['eta_s'] is not None else ""
+            message = f"{self.task}: {self.done:,}/{self.total:,} {self.unit} ({self.done / self.total:.0%}), {rate_text}{eta}"
+        else:
+            message = f"{self.task}: {self.done:,} {self.unit}, {rate_text}"
+
+        self.logger.log(self.level, message, extra={'metrics': {**metrics, 'event': 'done' if finished else 'progress'}})
+
+    def close(self):
+        if self.enabled:
+            self._log(time.perf_counter(), finished=True)
+            self.enabled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
@@ -0,0 +1,355 @@
+"""
+Bulk export of mission assessment reports
+
+Renders the rule engine's mission report (fighter_jet_rules.generate_mission_report,
+the report of the interactive ProjectV1 program) for every row of a CSV/JSONL
+request file, or for the full scenario grid, and writes them to one file as
+text, JSON or HTML:
+
+    text   the reports exactly as generate_mission_report prints them
+    json   an array of objects with the scores, rating, assessment and recommendations
+    html   a standalone page with one section per report
+
+Reports are rendered a chunk at a time and streamed through a single buffered
+writer, so memory use does not depend on the number of reports. With
+workers > 1, exports longer than one chunk are rendered in a process pool
+and written in input order. Every format takes its wording and
+recommendations from the rule engine's report functions.
+"""
+
+import argparse
+import html
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from .instrumentation import stage, cli_entry_point
+from .progress import Progress, get_logger
+from .utils import (
+    AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES,
+    RATINGS, RATING_EXPLANATIONS, POOR_RATINGS, REPORT_CACHE_SIZE,
+    get_mission_table, pack_scenario, display_name, render_mission_report, get_mission_recommendations
+)
+from .batch_assessment import (
+    BatchAssessor, REQUEST_FIELDS, INPUT_FORMATS, file_format, default_error_path,
+    read_csv_chunks, read_jsonl_chunks
+)
+
+logger = get_logger(__name__)
+
+# Reports rendered (and handed to a worker) together
+DEFAULT_CHUNK_SIZE = 8192
+
+# Bytes buffered before the output file is written to
+WRITE_BUFFER_SIZE = 1 << 20
+
+EXPORT_FORMATS = ('text', 'json', 'html')
+FORMAT_EXTENSIONS = {'.txt': 'text', '.json': 'json', '.html': 'html', '.htm': 'html'}
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Mission Assessment Reports</title>
+<style>
+body { font-family: sans-serif; margin: 2em; }
+section { border: 1px solid #ccc; margin: 1em 0; padding: 0 1em 1em; }
+th { text-align: left; padding-right: 1em; }
+.s-rank, .a-rank, .b-rank { border-left: 6px solid #2a2; }
+.c-rank { border-left: 6px solid #da2; }
+.d-rank, .f-rank { border-left: 6px solid #c22; }
+</style>
+</head>
+<body>
+<h1>Mission Assessment Reports</h1>
+"""
+HTML_TAIL = "</body>\n</html>\n"
+
+# Text before the first report, between reports and after the last one
+FRAMING = {
+    'text': ("", "", ""),
+    'json': ("[\n", ",\n", "\n]\n"),
+    'html': (HTML_HEAD, "\n", HTML_TAIL)
+}
+
+
+def report_record(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating):
+    """
+    One report as a JSON-ready dict
+
+    Returns:
+        dict: The request fields, scores and rating plus 'assessment' and
+        'recommendations' (the lines of the text report's recommendation list)
+    """
+    return {
+        'aircraft': aircraft,
+        'target': target,
+        'weather': weather,
+        'time_of_day': time_of_day,
+        'destruction_probability': destruction_prob,
+        'civilian_risk': civilian_risk,
+        'mission_rating': rating,
+        'assessment': RATING_EXPLANATIONS[rating],
+        'recommendations': [line[2:] for line in get_mission_recommendations(
+            aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating)]
+    }
+
+
+def render_html_report(aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating):
+    """Render one report as an HTML <section>"""
+    escape = html.escape
+    rows = (
+        ("Aircraft", aircraft),
+        ("Target", display_name(target)),
+        ("Weather", display_name(weather)),
+        ("Time", display_name(time_of_day)),
+        ("Target Destruction Probability", f"{destruction_prob}%"),
+        ("Civilian Risk Assessment", f"{civilian_risk}%"),
+        ("Overall Mission Rating", rating)
+    )
+    parts = [
+        f'<section class="{rating.lower()}">',
+        f"<h2>{escape(aircraft)} &ndash; {escape(display_name(target))}</h2>",
+        "<table>",
+        *(f"<tr><th>{label}</th><td>{escape(value)}</td></tr>" for label, value in rows),
+        "</table>",
+        f"<p>Assessment: {escape(RATING_EXPLANATIONS[rating])}</p>"
+    ]
+    if rating in POOR_RATINGS:
+        parts.append("<h3>Recommendations for improvement</h3>")
+        parts.append("<ul>")
+        parts.extend(f"<li>{escape(line[2:])}</li>" for line in get_mission_recommendations(
+            aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating))
+        parts.append("</ul>")
+    parts.append("</section>")
+    return "\n".join(parts)
+
+
+def render_json_report(*report):
+    """Render one report as a JSON object (see report_record)"""
+    return json.dumps(report_record(*report))
+
+
+RENDERERS = {
+    'text': render_mission_report,
+    'json': render_json_report,
+    'html': render_html_report
+}
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _render_report(spec_hash, fmt, aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating):
+    # A report depends only on its arguments and the spec registry, so repeated scenarios are rendered once
+    return RENDERERS[fmt](aircraft, target, weather, time_of_day, destruction_prob, civilian_risk, rating)
+
+
+def render_chunk(fmt, result):
+    """
+    Render a result chunk (as returned by BatchAssessor.assess) in one format
+
+    Returns:
+        str: The chunk's reports joined by the format's separator
+    """
+    with stage('render', rows=len(result['mission_rating'])):
+        spec_hash = get_mission_table().spec_hash
+        rows = zip(
+            *(result[field].tolist() for field in REQUEST_FIELDS),
+            result['destruction_probability'].tolist(),
+            result['civilian_risk'].tolist(),
+            result['mission_rating'].tolist()
+        )
+        return FRAMING[fmt][1].join(
+            _render_report(spec_hash, fmt, AIRCRAFT_NAMES[a], TARGET_NAMES[t], WEATHER_NAMES[w], TIME_NAMES[ti], d, c, RATINGS[r])
+            for a, t, w, ti, d, c, r in rows
+        )
+
+
+class ReportWriter:
+    """Writes rendered chunks to one file, adding the format's header, separators and footer"""
+
+    def __init__(self, file, fmt):
+        self.file = file
+        self.head, self.separator, self.tail = FRAMING[fmt]
+        self.empty = True
+        file.write(self.head)
+
+    def write(self, text):
+        if not text:
+            return
+        if not self.empty:
+            self.file.write(self.separator)
+        self.file.write(text)
+        self.empty = False
+
+    def close(self):
+        self.file.write(self.tail)
+
+
+def grid_results(assessor, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Result chunks for every scenario, in packed scenario index order
+
+    Yields:
+        dict: Result chunk in the layout BatchAssessor.assess returns
+    """
+    from .compiled_forest import grid_codes
+
+    codes = grid_codes()
+    for start in range(0, len(codes[0]), chunk_size):
+        chunk_codes = [field_codes[start:start + chunk_size] for field_codes in codes]
+        packed = pack_scenario(*chunk_codes)
+        result = dict(zip(REQUEST_FIELDS, chunk_codes))
+        result['destruction_probability'] = assessor.destruction[packed]
+        result['civilian_risk'] = assessor.civilian[packed]
+        result['mission_rating'] = assessor.ratings[packed]
+        yield result
+
+
+def render_chunks(fmt, results, workers=1):
+    """
+    Render result chunks in order
+
+    The first chunk is rendered in this process; once a second one arrives
+    the rest go to a pool of `workers` processes, with a bounded number of
+    chunks in flight so rendering never runs far ahead of the writer.
+
+    Yields:
+        tuple: (rendered text, rows in the chunk)
+    """
+    results = iter(results)
+    first = next(results, None)
+    if first is None:
+        return
+    yield render_chunk(fmt, first), len(first['mission_rating'])
+
+    second = next(results, None)
+    if second is None:
+        return
+    results = itertools.chain([second], results)
+    if workers <= 1:
+        for result in results:
+            yield render_chunk(fmt, result), len(result['mission_rating'])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for result in results:
+            pending.append((pool.submit(render_chunk, fmt, result), len(result['mission_rating'])))
+            if len(pending) >= 2 * workers:
+                future, rows = pending.popleft()
+                yield future.result(), rows
+        for future, rows in pending:
+            yield future.result(), rows
+
+
+def export_format(output_path, fmt=None):
+    """Format given explicitly, or from the output file's extension (text by default)"""
+    if fmt is not None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{fmt}' (expected one of {', '.join(EXPORT_FORMATS)})")
+        return fmt
+    if output_path in (None, '-'):
+        return 'text'
+    return FORMAT_EXTENSIONS.get(os.path.splitext(output_path)[1].lower(), 'text')
+
+
+def export_reports(output_path, input_path=None, fmt=None, error_path=None,
+                   workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Write the mission report for every request in a file, or for every scenario
+
+    Args:
+        output_path: Output file, or None/'-' for stdout
+        input_path: CSV or JSONL mission requests ('-' for CSV on stdin),
+            or None for the full scenario grid
+        fmt: 'text', 'json' or 'html' (default: from the output extension)
+        error_path: Where rejected request rows are written (JSON Lines,
+            default: next to the output, or the input for stdout)
+        workers: Processes rendering reports once there is more than one chunk
+        chunk_size: Reports per chunk
+
+    Returns:
+        tuple: (reports written, rows rejected)
+    """
+    fmt = export_format(output_path, fmt)
+    assessor = BatchAssessor()
+    exported = rejected = 0
+    input_file = output_file = error_file = None
+
+    def request_results():
+        nonlocal rejected, error_file
+        input_format = file_format(input_path, INPUT_FORMATS, 'csv')
+        read_chunks = read_csv_chunks if input_format == 'csv' else read_jsonl_chunks
+        for chunk in read_chunks(input_file, chunk_size):
+            result, errors = assessor.assess(chunk)
+            if errors:
+                if error_file is None:
+                    error_file = open(error_path or default_error_path(input_path, output_path), 'w')
+                error_file.writelines(json.dumps(error) + '\n' for error in errors)
+                rejected += len(errors)
+            yield result
+
+    try:
+        if input_path is None:
+            results = grid_results(assessor, chunk_size)
+            total = len(assessor.ratings)
+        else:
+            if input_path == '-':
+                input_file = sys.stdin
+            else:
+                input_file = open(input_path, newline='' if file_format(input_path, INPUT_FORMATS, 'csv') == 'csv' else None)
+            results = request_results()
+            total = None
+
+        if output_path in (None, '-'):
+            output_file = sys.stdout
+        else:
+            output_file = open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+        writer = ReportWriter(output_file, fmt)
+        with Progress(logger, f"Exporting {fmt} reports", total=total, unit="reports") as progress:
+            for text, rows in render_chunks(fmt, results, workers):
+                writer.write(text)
+                exported += rows
+                progress.update(rows)
+        writer.close()
+    finally:
+        if input_file is not None and input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not None and output_file is not sys.stdout:
+            output_file.close()
+        if error_file is not None:
+            error_file.close()
+
+    return exported, rejected
+
+
+@cli_entry_point
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Export mission assessment reports for many missions")
+    parser.add_argument("--input", metavar="FILE", help="CSV or JSONL mission requests ('-' for CSV on stdin; default: every scenario)")
+    parser.add_argument("--output", default="-", metavar="FILE", help="Output .txt, .json or .html file (default: stdout)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="Output format (default: from the output extension, else text)")
+    parser.add_argument("--errors", metavar="FILE", help="Where rejected rows are written (JSON Lines)")
+    parser.add_argument("--workers", type=int, default=1, help="Render in this many processes when the export spans several chunks")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Reports rendered together")
+    args = parser.parse_args(argv)
+
+    try:
+        exported, rejected = export_reports(args.output, args.input, args.format, args.errors, args.workers, args.chunk_size)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    summary = f"Exported {exported} reports"
+    if rejected:
+        summary += f", rejected {rejected} (see {args.errors or default_error_path(args.input, args.output)})"
+    print(summary, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
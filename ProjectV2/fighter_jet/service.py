@@ -0,0 +1,354 @@
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+from .utils import TARGET_NAMES, WEATHER_NAMES, TIME_NAMES, find_optimal_aircraft, get_mission_table
+from .mission_planner import MISSION_TABLE_CACHE, find_match, match_inputs
+from .instrumentation import cli_entry_point
+from .progress import get_logger
+
+logger = get_logger(__name__)
+
+# Largest request body accepted
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Batches of at most this many missions are scored on the event loop
+INLINE_BATCH_SIZE = 64
+
+# JSON field names of a mission
+MISSION_FIELDS = ('aircraft', 'target', 'weather', 'time')
+
+
+class RequestError(Exception):
+    """A client error, reported with an HTTP status and a JSON body"""
+
+    def __init__(self, status, errors):
+        super().__init__(errors)
+        self.status = status
+        self.errors = errors if isinstance(errors, list) else [errors]
+
+
+def mission_fields(mission):
+    """The four mission fields of a request object (raises RequestError if any are missing)"""
+    if not isinstance(mission, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Each mission must be a JSON object")
+    missing = [field for field in MISSION_FIELDS if field not in mission]
+    if missing:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Missing fields: {missing}")
+    return tuple(str(mission[field]) for field in MISSION_FIELDS)
+
+
+def resolve_mission(mission):
+    """Match a mission's names like the CLI does (raises RequestError on unknown names)"""
+    validated, errors = match_inputs(*mission_fields(mission))
+    if errors:
+        raise RequestError(HTTPStatus.BAD_REQUEST, errors)
+    return validated
+
+
+class AssessmentService:
+    """
+    Long-running JSON service over the mission table and the trained models
+
+    Endpoints:
+        GET  /health
+        POST /assess        {"aircraft", "target", "weather", "time"}
+        POST /assess/batch  {"missions": [...]}
+        POST /optimal       {"target", "weather", "time"}
+        POST /predict       a mission or {"missions": [...]}
+
+    GET requests to /assess, /optimal and /predict take the fields as query
+    parameters. Names are matched case-insensitively and by prefix like the
+    CLI. At most max_concurrency requests are processed at once; model scoring
+    and large batches run on a thread pool so the event loop stays responsive.
+    """
+
+    def __init__(self, predictor=None, max_concurrency=64, workers=4):
+        """
+        Args:
+            predictor: Predictor for /predict (the endpoint answers 503 without one)
+            max_concurrency: Requests processed at the same time
+            workers: Threads for model scoring and large batches
+        """
+        self.table = get_mission_table(MISSION_TABLE_CACHE)
+        self.predictor = predictor
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix="assessment")
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.routes = {
+            '/health': self.health,
+            '/assess': self.assess,
+            '/assess/batch': self.assess_batch,
+            '/optimal': self.optimal,
+            '/predict': self.predict
+        }
+
+    def assess_one(self, mission):
+        """Assessment of one mission as a JSON-ready dict"""
+        aircraft, target, weather, time_of_day = resolve_mission(mission)
+        dest_prob, civ_risk, rating = self.table.lookup(aircraft, target, weather, time_of_day)
+        return {
+            'aircraft': aircraft, 'target': target, 'weather': weather, 'time': time_of_day,
+            'destruction_probability': dest_prob, 'civilian_risk': civ_risk, 'mission_rating': rating
+        }
+
+    def assess_many(self, missions):
+        """Assess each mission, reporting errors per mission instead of failing the batch"""
+        results = []
+        for mission in missions:
+            try:
+                results.append(self.assess_one(mission))
+            except RequestError as error:
+                results.append({'errors': error.errors})
+        return results
+
+    def predict_missions(self, missions):
+        """ML predictions for resolved missions"""
+        destruction, civilian, ratings = self.predictor.predict(*zip(*missions))
+        return [
+            {
+                'aircraft': aircraft, 'target': target, 'weather': weather, 'time': time_of_day,
+                'destruction_probability': float(dest_prob), 'civilian_risk': float(civ_risk),
+                'mission_rating': str(rating)
+            }
+            for (aircraft, target, weather, time_of_day), dest_prob, civ_risk, rating
+            in zip(missions, destruction, civilian, ratings)
+        ]
+
+    async def run_in_executor(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def health(self, request):
+        return {'status': 'ok', 'predictor': self.predictor is not None}
+
+    async def assess(self, request):
+        return self.assess_one(request)
+
+    async def assess_batch(self, request):
+        missions = request.get('missions')
+        if not isinstance(missions, list):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Expected {\"missions\": [...]}")
+        if len(missions) <= INLINE_BATCH_SIZE:
+            return {'results': self.assess_many(missions)}
+        return {'results': await self.run_in_executor(self.assess_many, missions)}
+
+    async def optimal(self, request):
+        fields = {'target': TARGET_NAMES, 'weather': WEATHER_NAMES, 'time': TIME_NAMES}
+        matched, errors = {}, []
+        for field, names in fields.items():
+            if field not in request:
+                errors.append(f"Missing field: {field}")
+                continue
+            matched[field] = find_match(str(request[field]), names)
+            if not matched[field]:
+                errors.append(f"{field.title()} '{request[field]}' not found. Available: {list(names)}")
+        if errors:
+            raise RequestError(HTTPStatus.BAD_REQUEST, errors)
+
+        best_aircraft, best_rating, results = find_optimal_aircraft(matched['target'], matched['weather'], matched['time'])
+        return {
+            **matched,
+            'best_aircraft': best_aircraft,
+            'best_rating': best_rating,
+            'aircraft': {
+                aircraft: {'mission_rating': rating, 'destruction_probability': dest_prob, 'civilian_risk': civ_risk}
+                for aircraft, (rating, dest_prob, civ_risk) in results.items()
+            }
+        }
+
+    async def predict(self, request):
+        if self.predictor is None:
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "No trained models loaded; run train-models first")
+
+        if 'missions' in request:
+            if not isinstance(request['missions'], list):
+                raise RequestError(HTTPStatus.BAD_REQUEST, "Expected {\"missions\": [...]}")
+            missions = [resolve_mission(mission) for mission in request['missions']]
+            if not missions:
+                return {'results': []}
+            return {'results': await self.run_in_executor(self.predict_missions, missions)}
+
+        return (await self.run_in_executor(self.predict_missions, [resolve_mission(request)]))[0]
+
+    async def handle(self, method, target, body=b''):
+        """
+        Route one request
+
+        Returns:
+            tuple: (HTTPStatus, JSON-ready payload)
+        """
+        url = urlsplit(target)
+        route = self.routes.get(url.path.rstrip('/') or '/')
+        if route is None:
+            return HTTPStatus.NOT_FOUND, {'errors': [f"Unknown path {url.path}"]}
+
+        if method == 'GET':
+            request = dict(parse_qsl(url.query))
+        elif method == 'POST':
+            try:
+                request = json.loads(body or b'{}')
+            except ValueError:
+                return HTTPStatus.BAD_REQUEST, {'errors': ["Request body is not valid JSON"]}
+            if not isinstance(request, dict):
+                return HTTPStatus.BAD_REQUEST, {'errors': ["Request body must be a JSON object"]}
+        else:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'errors': [f"Method {method} not allowed"]}
+
+        async with self.semaphore:
+            try:
+                return HTTPStatus.OK, await route(request)
+            except RequestError as error:
+                return error.status, {'errors': error.errors}
+            except Exception:
+                logger.exception("Error handling %s %s", method, url.path)
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {'errors': ["Internal server error"]}
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection (keep-alive unless the client closes)"""
+        try:
+            while True:
+                try:
+                    request = await self.read_request(reader)
+                except RequestError as error:
+                    # The rest of the stream cannot be framed, so the connection is closed
+                    await self.respond(writer, error.status, {'errors': error.errors}, False)
+                    break
+                if request is None:
+                    break
+
+                method, target, version, headers, body = request
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                status, payload = await self.handle(method.upper(), target, body)
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception:
+            logger.exception("Error serving connection")
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def read_request(reader):
+        """
+        Read one request from the stream
+
+        Returns:
+            tuple: (method, target, version, headers, body), or None at end of stream
+
+        Raises:
+            RequestError: for a malformed request line, an over-long line or a
+            bad or too large Content-Length
+        """
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return None
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                raise RequestError(HTTPStatus.BAD_REQUEST, "Malformed request line") from None
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+        except (ValueError, asyncio.LimitOverrunError):
+            # readline raises ValueError when a line is longer than the stream limit
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Request line or header too long") from None
+
+        try:
+            length = int(headers.get('content-length', 0) or 0)
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+        if length < 0:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = await reader.readexactly(length) if length else b''
+        return method, target, version, headers, body
+
+    @staticmethod
+    async def respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        """Start listening; returns the asyncio server"""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+
+def load_predictor(backend):
+    """
+    Load the trained models once, or return None if none have been trained
+
+    Raises:
+        ValueError, ImportError: The backend cannot serve the trained models
+    """
+    from .predictor import Predictor
+
+    try:
+        return Predictor(backend=backend)
+    except KeyError as error:
+        logger.warning("ML predictions disabled: %s", error)
+        return None
+
+
+async def run_service(args, predictor):
+    service = AssessmentService(
+        predictor=predictor,
+        max_concurrency=args.max_concurrency,
+        workers=args.workers
+    )
+    server = await service.serve(args.host, args.port)
+    logger.info("Serving on http://%s:%d", args.host, args.port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+@cli_entry_point
+def main(argv=None):
+    """Command line entry point"""
+    from .predictor import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Mission assessment HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-concurrency", type=int, default=64, help="Requests processed at once")
+    parser.add_argument("--workers", type=int, default=4, help="Threads for model scoring and large batches")
+    parser.add_argument("--backend", default="grid", choices=BACKENDS, help="Predictor backend")
+    parser.add_argument("--no-models", action="store_true", help="Do not load the trained models")
+    args = parser.parse_args(argv)
+
+    try:
+        predictor = None if args.no_models else load_predictor(args.backend)
+    except (ValueError, ImportError) as error:
+        print(f"Error: cannot load the '{args.backend}' predictor: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        asyncio.run(run_service(args, predictor))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+
+# The rule engine is the fighter_jet_rules package from ProjectV1 (pip install ./ProjectV1;
+# in a source checkout ProjectV2/fighter_jet_rules links to it)
+# Import the functions we need from your original system
+from fighter_jet_rules import (
+    calculate_mission_score,
+    assign_mission_rating,
+    get_aircraft_data,
+    get_target_data,
+    get_weather_data,
+    get_time_data,
+    get_civilian_risk_score,
+    AIRCRAFT, TARGETS, WEATHER, TIMES,
+    AIRCRAFT_IDS, TARGET_IDS, WEATHER_IDS, TIME_IDS,
+    AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES,
+    RATINGS, RATING_CODES, RATING_THRESHOLDS,
+    pack_scenario, get_mission_table, get_spec_hash,
+    find_optimal_aircraft, get_suitability_score,
+    RATING_EXPLANATIONS, POOR_RATINGS, REPORT_CACHE_SIZE, display_name, render_mission_report, get_mission_recommendations
+)
+
+
+def user_cache_dir():
+    """Per-user cache directory ($XDG_CACHE_HOME/fighter_jet, ~/.cache/fighter_jet by default)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "fighter_jet")
+
+
+def user_data_dir():
+    """Per-user data directory ($XDG_DATA_HOME/fighter_jet, ~/.local/share/fighter_jet by default)"""
+    base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "fighter_jet")
+
+
+# Test function to verify imports work
+def test_imports():
+    """Test that all imports from original system work"""
+    print("Testing imports from original system...")
+    time_periods = get_time_data()
+    print(f"Time periods loaded: {len(time_periods)} time slots")
+    
+    # Test getting data
+    aircraft = get_aircraft_data()
+    print(f"Aircraft data loaded: {len(aircraft)} aircraft types")
+    
+    # Test a sample calculation
+    dest_prob, civ_risk = calculate_mission_score("F-35A", "military_base", "clear", "night")
+    rating = assign_mission_rating(dest_prob, civ_risk)
+    print(f"Sample mission: {dest_prob}% success, {civ_risk}% civilian risk, {rating}")
+    
+    print("All imports working correctly!")
+
+if __name__ == "__main__":
+    test_imports()
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Tests for the batch assessment mode
+Run from the ProjectV2 directory: pytest test_batch_assessment.py
+"""
+
+import csv
+import json
+import pytest
+from fighter_jet.utils import calculate_mission_score, assign_mission_rating
+from fighter_jet import batch_assessment
+from fighter_jet.batch_assessment import run_batch
+
+REQUESTS = [
+    {"aircraft": "f-35", "target": "bridge", "weather": "clear", "time": "night"},
+    {"aircraft": "X-99", "target": "bridge", "weather": "clear", "time": "night"},
+    {"aircraft": "B-2", "target": "NUC", "weather": "storm", "time": ""},
+    {"aircraft": "f35", "target": "warehouse", "weather": "windy", "time": "morning"},
+]
+
+EXPECTED = [("F-35A", "bridge", "clear", "night"), ("F-35A", "warehouse", "windy", "morning")]
+
+
+def write_csv(path, requests):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["aircraft", "target", "weather", "time"])
+        writer.writeheader()
+        writer.writerows(requests)
+
+
+def expected_row(aircraft, target, weather, time_of_day):
+    dest_prob, civ_risk = calculate_mission_score(aircraft, target, weather, time_of_day)
+    return [aircraft, target, weather, time_of_day, str(dest_prob), str(civ_risk), assign_mission_rating(dest_prob, civ_risk)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_csv_batch(tmp_path, chunk_size):
+    """Valid rows are scored like the CLI and bad rows go to the error file"""
+    write_csv(tmp_path / "missions.csv", REQUESTS)
+    assessed, rejected = run_batch(str(tmp_path / "missions.csv"), str(tmp_path / "results.csv"), chunk_size=chunk_size)
+    assert (assessed, rejected) == (2, 2)
+
+    with open(tmp_path / "results.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["aircraft", "target", "weather", "time_of_day", "destruction_probability", "civilian_risk", "mission_rating"]
+    assert rows[1:] == [expected_row(*scenario) for scenario in EXPECTED]
+
+    with open(tmp_path / "results.errors.jsonl") as file:
+        errors = [json.loads(line) for line in file]
+    assert [error["row"] for error in errors] == [2, 3]
+    assert errors[0]["errors"] == ["Aircraft 'X-99' not found"]
+    assert errors[1]["errors"] == ["Missing time_of_day"]
+
+
+def test_jsonl_batch_to_stdout(tmp_path, capsys):
+    """JSONL in, JSONL out on stdout; malformed lines are reported, not fatal"""
+    with open(tmp_path / "missions.jsonl", "w") as file:
+        for request in REQUESTS:
+            file.write(json.dumps(request) + "\n")
+        file.write("{not json\n")
+
+    assessed, rejected = run_batch(str(tmp_path / "missions.jsonl"), output_format="jsonl",
+                                   error_path=str(tmp_path / "errors.jsonl"))
+    assert (assessed, rejected) == (2, 3)
+
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [list(map(str, result.values())) for result in results] == [expected_row(*scenario) for scenario in EXPECTED]
+
+    with open(tmp_path / "errors.jsonl") as file:
+        errors = [json.loads(line) for line in file]
+    assert errors[-1]["row"] == 5 and errors[-1]["errors"][0].startswith("Invalid JSON")
+
+
+def test_no_error_file_without_errors(tmp_path):
+    write_csv(tmp_path / "missions.csv", [REQUESTS[0]])
+    assert run_batch(str(tmp_path / "missions.csv"), str(tmp_path / "results.jsonl")) == (1, 0)
+    assert not (tmp_path / "results.errors.jsonl").exists()
+
+
+def test_bad_header(tmp_path):
+    (tmp_path / "missions.csv").write_text("plane,target\nB-2,bridge\n")
+    with pytest.raises(ValueError):
+        run_batch(str(tmp_path / "missions.csv"), str(tmp_path / "results.csv"))
+
+
+def test_parquet_batch_keeps_exact_scores(tmp_path):
+    """Parquet holds the same float64 scores as the CSV output"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    write_csv(tmp_path / "missions.csv", REQUESTS)
+    run_batch(str(tmp_path / "missions.csv"), str(tmp_path / "results.parquet"))
+
+    table = pq.read_table(tmp_path / "results.parquet").to_pydict()
+    expected = [calculate_mission_score(*scenario) for scenario in EXPECTED]
+    assert list(zip(table["destruction_probability"], table["civilian_risk"])) == expected
+
+
+def test_failed_parquet_batch_leaves_no_file(tmp_path, monkeypatch):
+    """A run that raises part way removes the partial Parquet file"""
+    pytest.importorskip("pyarrow")
+    write_csv(tmp_path / "missions.csv", REQUESTS)
+
+    original = batch_assessment.BatchAssessor.assess
+    calls = []
+
+    def failing_assess(self, chunk):
+        calls.append(chunk)
+        if len(calls) > 1:
+            raise RuntimeError("scoring failed")
+        return original(self, chunk)
+
+    monkeypatch.setattr(batch_assessment.BatchAssessor, "assess", failing_assess)
+    with pytest.raises(RuntimeError):
+        run_batch(str(tmp_path / "missions.csv"), str(tmp_path / "results.parquet"), chunk_size=1)
+    assert not (tmp_path / "results.parquet").exists()
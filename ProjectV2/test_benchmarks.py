@@ -0,0 +1,48 @@
+"""
+Tests for the benchmark harness
+Run from the ProjectV2 directory: pytest test_benchmarks.py
+"""
+
+import json
+import benchmarks
+from benchmarks import compare_results, select_benchmarks, GRID_ROWS, QUERY_ROWS
+
+
+def record(median_s):
+    return {'group': 'scoring', 'rows': 1, 'runs': 3, 'min_s': median_s, 'median_s': median_s, 'mean_s': median_s, 'rows_per_s': 1 / median_s}
+
+
+def test_compare_flags_changes_beyond_threshold():
+    baseline = {'slower': record(1.0), 'faster': record(1.0), 'same': record(1.0), 'dropped': record(1.0)}
+    results = {'slower': record(1.2), 'faster': record(0.8), 'same': record(1.05), 'added': record(1.0)}
+
+    statuses = {row['name']: row['status'] for row in compare_results(results, baseline, threshold=0.10)}
+    assert statuses == {'slower': 'regression', 'faster': 'improvement', 'same': 'ok', 'added': 'new', 'dropped': 'missing'}
+
+    # A looser threshold accepts the same slowdown
+    assert compare_results({'slower': record(1.2)}, baseline, threshold=0.25)[0]['status'] == 'ok'
+
+
+def test_select_by_name_and_size():
+    names = [case.name for case in select_benchmarks(['generate_training_data'], max_rows=1000000)]
+    assert names == ['generate_training_data[1000]', 'generate_training_data[1000000]']
+    assert [case.name for case in select_benchmarks([f'score_batch[{GRID_ROWS}]'])] == [f'score_batch[{GRID_ROWS}]']
+
+
+def test_run_writes_json_and_fails_on_regression(tmp_path):
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    case = f'optimal_batch[{QUERY_ROWS}]'
+    args = ['--filter', case, '--min-runs', '1', '--min-time', '0', '--output', str(output), '--baseline', str(baseline)]
+
+    assert benchmarks.main(args + ['--save-baseline']) == 0
+    saved = json.loads(baseline.read_text())
+    assert set(saved['results']) == {case}
+    assert saved['results'][case]['rows'] == QUERY_ROWS
+    assert 'numpy' in saved['environment']
+
+    # Pretend the baseline was much faster
+    saved['results'][case]['median_s'] /= 1000
+    baseline.write_text(json.dumps(saved))
+    assert benchmarks.main(args) == 1
+    assert json.loads(output.read_text())['results'][case]['runs'] >= 1
@@ -0,0 +1,51 @@
+"""
+Tests for the compiled random forest evaluator
+Run from the ProjectV2 directory: pytest test_compiled_forest.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from fighter_jet.ml_models import build_feature_matrix, prepare_features
+from fighter_jet.compiled_forest import CompiledForest, GridModel, compile_forest, grid_codes
+
+
+@pytest.fixture(scope="module")
+def training_data():
+    X, y_dest, y_civ, y_rating = prepare_features(pd.read_csv("complete_training_data.csv"))
+    return X, np.column_stack([y_dest, y_civ]), y_rating
+
+
+def test_regressor_matches_sklearn(training_data):
+    """Multi-output and single-output forests predict like sklearn, on grid and off-grid inputs"""
+    X, Y, _ = training_data
+    off_grid = np.random.default_rng(0).uniform(X.min(axis=0), X.max(axis=0), (500, X.shape[1]))
+
+    for targets in (Y, Y[:, 0]):
+        model = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, targets)
+        compiled = compile_forest(model)
+        for features in (X, off_grid):
+            np.testing.assert_allclose(compiled.predict(features), model.predict(features), rtol=1e-12)
+
+
+def test_classifier_matches_sklearn(training_data):
+    X, _, y_rating = training_data
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y_rating)
+    compiled = compile_forest(model)
+
+    np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), rtol=1e-12)
+    assert np.array_equal(compiled.predict(X), model.predict(X))
+
+
+def test_save_load_and_grid(training_data, tmp_path):
+    """Saved node arrays and the precomputed grid give the same predictions"""
+    X, _, y_rating = training_data
+    compiled = compile_forest(RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y_rating))
+    compiled.save(tmp_path / "forest.npz")
+    loaded = CompiledForest.load(tmp_path / "forest.npz")
+
+    codes = grid_codes()
+    features = build_feature_matrix(*codes)
+    assert np.array_equal(loaded.predict(features), compiled.predict(features))
+    assert np.array_equal(GridModel.from_model(loaded).predict_codes(*codes), compiled.predict(features))
@@ -0,0 +1,89 @@
+"""
+Tests for the training data generator
+Run from the ProjectV2 directory: pytest test_data_generator.py
+"""
+
+import json
+import pandas as pd
+import pytest
+from fighter_jet import data_generator
+def test_generate_training_data_matches_committed_dataset():
+    """The in-memory dataset is the committed full-grid CSV"""
+    df = data_generator.generate_training_data()
+    expected = pd.read_csv("complete_training_data.csv")
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_chunks_independent_of_chunk_size():
+    """Chunking changes only where chunks split, never the rows"""
+    num_rows = 5000  # More than one pass over the grid
+    whole = [data_generator.chunk_to_dataframe(c) for c in data_generator.iter_training_chunks(num_rows, chunk_size=num_rows)]
+    split = [data_generator.chunk_to_dataframe(c) for c in data_generator.iter_training_chunks(num_rows, chunk_size=777)]
+
+    assert [len(c) for c in split] == [777] * 6 + [5000 - 777 * 6]
+    pd.testing.assert_frame_equal(pd.concat(whole, ignore_index=True), pd.concat(split, ignore_index=True))
+
+
+def test_stream_training_data(tmp_path):
+    """Streaming to CSV writes one header and cycles through the grid"""
+    path = tmp_path / "stream.csv"
+    assert data_generator.stream_training_data(path, num_rows=4000, chunk_size=1000) == 4000
+
+    df = pd.read_csv(path)
+    expected = pd.read_csv("complete_training_data.csv")
+    assert len(df) == 4000
+    pd.testing.assert_frame_equal(df.iloc[1890:3780].reset_index(drop=True), expected)
+
+
+def test_noise_reproducible_and_chunk_independent():
+    """Noisy rows depend only on the seed and row position"""
+    noise_model = data_generator.NoiseModel("gaussian")
+    num_rows = 3 * 1890 + 100
+
+    def dataset(chunk_size, seed):
+        chunks = data_generator.iter_training_chunks(num_rows, chunk_size, noise_model, seed)
+        return pd.concat([data_generator.chunk_to_dataframe(c) for c in chunks], ignore_index=True)
+
+    reference = dataset(num_rows, seed=7)
+    pd.testing.assert_frame_equal(dataset(1000, seed=7), reference)
+    pd.testing.assert_frame_equal(dataset(1889, seed=7), reference)
+    assert not reference.equals(dataset(num_rows, seed=8))
+
+    # Replicates get different noise, and the noise actually changes the scores
+    exact = pd.read_csv("complete_training_data.csv")
+    first, second = reference.iloc[:1890].reset_index(drop=True), reference.iloc[1890:3780].reset_index(drop=True)
+    assert not first["civilian_risk"].equals(second["civilian_risk"])
+    assert not first["destruction_probability"].equals(exact["destruction_probability"])
+    assert (reference["destruction_probability"] <= 99.9).all() and (reference["civilian_risk"] <= 95.0).all()
+
+
+def test_generate_training_data_with_noise():
+    """add_noise works through the in-memory API as well"""
+    df = data_generator.generate_training_data(add_noise=True, replicates=2, seed=3)
+    assert len(df) == 2 * 1890
+    pd.testing.assert_frame_equal(df, data_generator.generate_training_data(add_noise=data_generator.NoiseModel(), replicates=2, seed=3))
+
+
+def test_sharded_generation_matches_single_worker(tmp_path):
+    """Merged shards are byte-identical to a single-worker run"""
+    noise_model = data_generator.NoiseModel("uniform")
+    single = tmp_path / "single.csv"
+    data_generator.stream_training_data(single, num_rows=5000, chunk_size=512, noise_model=noise_model, seed=11)
+
+    manifest_file = data_generator.generate_sharded(str(tmp_path / "sharded.csv"), 5000, workers=3, chunk_size=700,
+                                                    noise_model=noise_model, seed=11)
+    with open(manifest_file) as file:
+        manifest = json.load(file)
+    assert [shard["rows"] for shard in manifest["shards"]] == [1666, 1667, 1667]
+    assert [shard["file"] for shard in manifest["shards"]] == [f"sharded.part-0000{i}.csv" for i in range(3)]
+
+    merged = data_generator.merge_shards(manifest_file, tmp_path / "merged.csv")
+    assert merged.read_bytes() == single.read_bytes()
+
+
+def test_workers_without_rows_rejected(tmp_path, capsys):
+    """--workers only applies to streamed generation, so it is refused without --rows"""
+    with pytest.raises(SystemExit):
+        data_generator.main(["--workers", "4", "--output", str(tmp_path / "data.csv")])
+    assert "--workers needs --rows" in capsys.readouterr().err
+    assert not (tmp_path / "data.csv").exists()
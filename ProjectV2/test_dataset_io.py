@@ -0,0 +1,124 @@
+"""
+Tests for the dataset file formats
+Run from the ProjectV2 directory: pytest test_dataset_io.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fighter_jet.dataset_io import DatasetWriter, dataframe_to_chunk, load_columns, load_dataset, save_dataset
+
+
+def load_csv():
+    """The committed full-grid dataset"""
+    return pd.read_csv("complete_training_data.csv")
+
+
+def test_npz_round_trip(tmp_path):
+    """NPZ keeps categories as codes and scores as float32"""
+    df = load_csv()
+    path = save_dataset(df, tmp_path / "data.npz")
+    loaded = load_dataset(path)
+
+    assert list(loaded.columns) == list(df.columns)
+    assert isinstance(loaded["aircraft"].dtype, pd.CategoricalDtype)
+    assert loaded["civilian_risk"].dtype == np.float32
+    for column in ["aircraft", "target", "weather", "time_of_day", "mission_rating"]:
+        assert loaded[column].astype(str).tolist() == df[column].tolist()
+    assert np.array_equal(loaded["destruction_probability"], df["destruction_probability"].astype(np.float32))
+
+
+def test_npz_is_memory_mapped(tmp_path):
+    """Loading an uncompressed NPZ maps the columns instead of reading them"""
+    path = save_dataset(load_csv(), tmp_path / "data.npz")
+    columns, categories = load_columns(path)
+    assert isinstance(columns["destruction_probability"], np.memmap)
+    assert categories["mission_rating"].tolist()[0] == "F-RANK"
+
+    # mmap=False reads the columns into memory
+    columns, categories = load_columns(path, mmap=False)
+    assert not isinstance(columns["aircraft"], np.memmap)
+
+
+def test_streamed_npz_matches_single_write(tmp_path):
+    """Writing in chunks gives the same file contents as one write"""
+    chunk = dataframe_to_chunk(load_csv())
+    with DatasetWriter(tmp_path / "chunked.npz", num_rows=1890) as writer:
+        for start in range(0, 1890, 500):
+            writer.write({column: values[start:start + 500] for column, values in chunk.items()})
+
+    pd.testing.assert_frame_equal(load_dataset(tmp_path / "chunked.npz"), load_dataset(save_dataset(load_csv(), tmp_path / "whole.npz")))
+
+
+def test_format_by_extension(tmp_path):
+    """CSV stays supported and unknown extensions are rejected"""
+    df = load_csv()
+    pd.testing.assert_frame_equal(load_dataset(save_dataset(df, tmp_path / "data.csv")), df)
+    with pytest.raises(ValueError):
+        save_dataset(df, tmp_path / "data.xlsx")
+
+
+def write_chunks(path, chunk, num_rows=None, chunk_size=500):
+    with DatasetWriter(path, num_rows=num_rows) as writer:
+        for start in range(0, len(chunk["aircraft"]), chunk_size):
+            writer.write({column: values[start:start + chunk_size] for column, values in chunk.items()})
+
+
+def test_npz_row_count_enforced(tmp_path):
+    """Writing past num_rows or closing short of it fails instead of padding the file"""
+    chunk = dataframe_to_chunk(load_csv())
+
+    writer = DatasetWriter(tmp_path / "over.npz", num_rows=100)
+    with pytest.raises(ValueError, match="exceeds num_rows"):
+        writer.write(chunk)
+    writer.abort()
+
+    writer = DatasetWriter(tmp_path / "short.npz", num_rows=1890)
+    writer.write({column: values[:10] for column, values in chunk.items()})
+    with pytest.raises(ValueError, match="10 rows written"):
+        writer.close()
+
+    assert not (tmp_path / "over.npz").exists() and not (tmp_path / "short.npz").exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("extension", [".npz", ".csv"])
+def test_exception_removes_partial_output(tmp_path, extension):
+    """A failure inside the with block leaves no half-written dataset behind"""
+    chunk = dataframe_to_chunk(load_csv())
+    with pytest.raises(RuntimeError):
+        with DatasetWriter(tmp_path / f"data{extension}", num_rows=1890) as writer:
+            writer.write({column: values[:500] for column, values in chunk.items()})
+            raise RuntimeError("generator failed")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("extension", [".feather", ".parquet"])
+def test_arrow_round_trip(tmp_path, extension):
+    """Feather and Parquet written in chunks load back as the full dataset"""
+    pytest.importorskip("pyarrow")
+    df = load_csv()
+    write_chunks(tmp_path / f"chunked{extension}", dataframe_to_chunk(df))
+    loaded = load_dataset(tmp_path / f"chunked{extension}")
+
+    assert len(loaded) == len(df)
+    for column in ["aircraft", "target", "weather", "time_of_day", "mission_rating"]:
+        assert loaded[column].astype(str).tolist() == df[column].tolist()
+    assert np.array_equal(loaded["civilian_risk"], df["civilian_risk"].astype(np.float32))
+
+
+def test_single_batch_feather_is_zero_copy(tmp_path):
+    """A feather file written in one batch loads as views of the mapped file"""
+    pytest.importorskip("pyarrow")
+    chunk = dataframe_to_chunk(load_csv())
+    write_chunks(tmp_path / "single.feather", chunk, chunk_size=1890)
+    columns, categories = load_columns(tmp_path / "single.feather")
+    assert not columns["destruction_probability"].flags.owndata
+    assert not columns["aircraft"].flags.owndata
+    assert np.array_equal(columns["aircraft"], chunk["aircraft"])
+    assert categories["mission_rating"].tolist()[0] == "F-RANK"
+
+    # Several batches are concatenated into new arrays with the same values
+    write_chunks(tmp_path / "chunked.feather", chunk)
+    chunked, _ = load_columns(tmp_path / "chunked.feather")
+    assert np.array_equal(chunked["civilian_risk"], columns["civilian_risk"])
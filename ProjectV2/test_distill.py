@@ -0,0 +1,69 @@
+"""
+Tests for distilling trained models into grid lookup tables
+Run from the ProjectV2 directory: pytest test_distill.py
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LinearRegression
+from fighter_jet import distill
+from fighter_jet.compiled_forest import GridModel, grid_codes
+from fighter_jet.ml_models import FEATURE_NAMES, build_feature_matrix, prepare_features
+from fighter_jet.model_registry import ModelRegistry
+
+
+def test_distilled_tables_match_models(tmp_path, monkeypatch):
+    """Every cell of a distilled table equals the model's prediction"""
+    X, y_dest, y_civ, y_rating = prepare_features(pd.read_csv("complete_training_data.csv"))
+    registry = ModelRegistry(tmp_path)
+    registry.get_or_train("linear", LinearRegression(), X, np.column_stack([y_dest, y_civ]), FEATURE_NAMES)
+    registry.get_or_train("forest", RandomForestClassifier(n_estimators=5, random_state=0), X, y_rating, FEATURE_NAMES)
+
+    reports = distill.distill_models(tmp_path)
+    assert set(reports) == {"linear", "forest"}
+    assert all(report["mismatches"] == 0 for report in reports.values())
+    assert (tmp_path / "distill_report.json").exists()
+    assert sorted(registry.names()) == ["forest", "linear"]
+
+    codes = grid_codes()
+    features = build_feature_matrix(*codes)
+    for name in ("linear", "forest"):
+        table = distill.load_distilled(name, tmp_path)
+        assert np.array_equal(table.predict_codes(*codes), registry.load(name).predict(features))
+
+    # Tables built from other specs are not served
+    monkeypatch.setattr(distill, "get_spec_hash", lambda: "changed")
+    assert distill.load_distilled("linear", tmp_path) is None
+
+
+def test_retrained_model_invalidates_table(tmp_path):
+    """A table distilled from an earlier version of a model is not served"""
+    X, y_dest, y_civ, _ = prepare_features(pd.read_csv("complete_training_data.csv"))
+    Y = np.column_stack([y_dest, y_civ])
+    registry = ModelRegistry(tmp_path)
+    registry.get_or_train("linear", LinearRegression(), X, Y, FEATURE_NAMES)
+    distill.distill_models(tmp_path)
+    assert distill.load_distilled("linear", tmp_path) is not None
+
+    # Retraining on other data gives the model a new registry fingerprint
+    registry.get_or_train("linear", LinearRegression(), X[:1000], Y[:1000], FEATURE_NAMES)
+    assert distill.load_distilled("linear", tmp_path) is None
+
+
+def test_verify_grid_detects_wrong_cells():
+    """Verification compares the table with the model itself, so a corrupted cell is reported"""
+    X, _, _, y_rating = prepare_features(pd.read_csv("complete_training_data.csv"))
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y_rating)
+    grid = GridModel.from_model(model)
+    assert distill.verify_grid(model, grid)["mismatches"] == 0
+
+    grid.outputs = grid.outputs.copy()
+    grid.outputs[7] = (grid.outputs[7] + 1) % len(grid.classes)
+    assert distill.verify_grid(model, grid)["mismatches"] == 1
+
+
+def test_distill_creates_registry_dir(tmp_path):
+    """Distilling into a registry that does not exist yet writes an empty report"""
+    assert distill.distill_models(tmp_path / "new") == {}
+    assert (tmp_path / "new" / "distill_report.json").exists()
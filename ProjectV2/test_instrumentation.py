@@ -0,0 +1,69 @@
+"""
+Tests for the timing and profiling hooks
+Run from the ProjectV2 directory: pytest test_instrumentation.py
+"""
+
+import logging
+import pstats
+import pytest
+from fighter_jet import instrumentation
+from fighter_jet import progress
+from fighter_jet.instrumentation import stage, timed, count, snapshot, cli_entry_point
+from fighter_jet.scoring import calculate_mission_scores
+
+
+@pytest.fixture
+def timings():
+    instrumentation.enable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default_records_nothing():
+    instrumentation.reset()
+    with stage('score', rows=10):
+        count('registry.hit')
+    assert snapshot()['stages'] == {} and snapshot()['counters'] == {}
+
+
+def test_stages_rows_and_counters(timings):
+    calculate_mission_scores([0, 1, 2], 0, 0, 0)
+
+    @timed('fit')
+    def fit():
+        with stage('fit'):  # nested in itself: counted once
+            return 42
+
+    assert fit() == 42
+    count('registry.miss', 2)
+
+    data = snapshot()
+    assert data['stages']['score']['calls'] == 1 and data['stages']['score']['rows'] == 3
+    assert data['stages']['fit']['calls'] == 1
+    assert data['counters'] == {'registry.miss': 2}
+    assert 'score' in instrumentation.format_report(data)
+
+
+def test_cli_entry_point_reports_and_profiles(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv(instrumentation.TIMINGS_ENV, "1")
+    monkeypatch.setenv(instrumentation.PROFILE_ENV, str(tmp_path))
+
+    @cli_entry_point
+    def main():
+        with stage('rate', rows=5):
+            return 0
+
+    try:
+        assert main() == 0
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+        logging.getLogger(progress.ROOT_LOGGER).handlers[:] = [logging.NullHandler()]
+        logging.getLogger(progress.ROOT_LOGGER).setLevel(logging.NOTSET)
+
+    err = capsys.readouterr().err
+    assert "rate" in err and "Profile written to" in err
+    (profile,) = tmp_path.glob("*.prof")
+    assert pstats.Stats(str(profile)).total_calls > 0
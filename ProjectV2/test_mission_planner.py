@@ -0,0 +1,58 @@
+"""
+Tests for the mission planner name resolution
+Run from the ProjectV2 directory: pytest test_mission_planner.py
+"""
+
+import pytest
+from fighter_jet.utils import AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES
+from fighter_jet.mission_planner import AIRCRAFT_RESOLVER, NameResolver, find_match, match_columns, match_inputs
+
+
+def linear_find_match(user_input, valid_options):
+    """The original scan: exact case-insensitive match, then first prefix match"""
+    user_lower = user_input.lower()
+    for option in valid_options:
+        if option.lower() == user_lower:
+            return option
+    for option in valid_options:
+        if option.lower().startswith(user_lower):
+            return option
+    return None
+
+
+@pytest.mark.parametrize("names", [AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES])
+def test_resolver_matches_linear_scan(names):
+    """Every prefix of every name (in several cases) and some misses resolve as before"""
+    inputs = ["", "x", "zzz", "night_", "clear sky"]
+    for name in names:
+        for length in range(len(name) + 1):
+            prefix = name[:length]
+            inputs += [prefix, prefix.upper(), prefix.title()]
+
+    for user_input in inputs:
+        assert find_match(user_input, names) == linear_find_match(user_input, names)
+    assert NameResolver(names).resolve_many(inputs) == [linear_find_match(value, names) for value in inputs]
+
+
+def test_exact_match_beats_earlier_prefix():
+    assert NameResolver(["abc", "ab"]).resolve("AB") == "ab"
+    assert NameResolver(["abc", "ab"]).resolve("a") == "abc"
+
+
+def test_aliases():
+    """Aliases resolve only inputs that match nothing else"""
+    assert AIRCRAFT_RESOLVER.resolve("f35") == "F-35A"
+    assert AIRCRAFT_RESOLVER.resolve("TYPHOON") == "Eurofighter"
+    assert AIRCRAFT_RESOLVER.resolve("f") == linear_find_match("f", AIRCRAFT_NAMES)
+    assert NameResolver(["alpha", "beta"], {"al": "beta"}).resolve("al") == "alpha"
+    with pytest.raises(ValueError):
+        NameResolver(["alpha"], {"b": "beta"})
+
+
+def test_match_inputs_and_columns():
+    assert match_inputs("f35", "bri", "CLEAR", "nig") == (("F-35A", "bridge", "clear", "night"), [])
+    validated, errors = match_inputs("X-99", "bridge", "clear", "night")
+    assert validated is None and len(errors) == 1
+
+    columns = match_columns(["b-2", "x"], ["bridge", "bridge"], ["clear", "clear"], ["night", "nope"])
+    assert columns == (["B-2", None], ["bridge", "bridge"], ["clear", "clear"], ["night", None])
@@ -0,0 +1,93 @@
+"""
+Tests for the ML data pipeline
+Run from the ProjectV2 directory: pytest test_ml_models.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fighter_jet.utils import get_aircraft_data, get_target_data, get_weather_data, get_time_data
+from fighter_jet.ml_models import FEATURE_NAMES, prepare_features, split_dataset, train_all_models
+
+
+def load_dataset():
+    """The committed full-grid dataset"""
+    return pd.read_csv("complete_training_data.csv")
+
+
+def test_prepare_features_matches_spec_lookups():
+    """Columnar features must equal the per-row spec lookups"""
+    df = load_dataset()
+    X, y_dest, y_civ, y_rating = prepare_features(df)
+    assert X.shape == (len(df), len(FEATURE_NAMES))
+    assert X.dtype == np.float64
+
+    aircraft_data, target_data = get_aircraft_data(), get_target_data()
+    weather_data, time_data = get_weather_data(), get_time_data()
+    expected = [
+        [
+            aircraft_data[row.aircraft]["precision"],
+            1 if aircraft_data[row.aircraft]["stealth"] else 0,
+            target_data[row.target]["difficulty"],
+            weather_data[row.weather]["precision_modifier"],
+            time_data[row.time_of_day]["civilian_modifier"]
+        ]
+        for row in df.itertuples()
+    ]
+    assert np.array_equal(X, np.array(expected))
+    assert np.array_equal(y_dest, df["destruction_probability"].values)
+
+
+def test_prepare_features_categorical_and_buffer():
+    """Categorical columns and a preallocated float32 buffer give the same features"""
+    df = load_dataset()
+    X, _, _, _ = prepare_features(df)
+
+    categorical = df.astype({column: "category" for column in ["aircraft", "target", "weather", "time_of_day"]})
+    buffer = np.zeros((len(df), len(FEATURE_NAMES)), dtype=np.float32)
+    X32, _, _, _ = prepare_features(categorical, out=buffer)
+    assert X32 is buffer
+    assert np.array_equal(X32, X.astype(np.float32))
+
+
+def test_prepare_features_unknown_value():
+    """Unknown names are rejected"""
+    df = load_dataset().head(3).copy()
+    df.loc[1, "weather"] = "hail"
+    with pytest.raises(KeyError):
+        prepare_features(df)
+
+
+def test_split_dataset_matches_per_target_split():
+    """The shared split gives every target the rows the per-target splits used"""
+    from sklearn.model_selection import train_test_split
+
+    X, y_dest, y_civ, y_rating = prepare_features(load_dataset())
+    X_train, X_test, Y_train, Y_test, rating_train, rating_test = split_dataset(X, y_dest, y_civ, y_rating)
+
+    _, _, dest_train, _, civ_train, _ = train_test_split(X, y_dest, y_civ, test_size=0.2, random_state=42)
+    assert np.array_equal(Y_train[:, 0], dest_train)
+    assert np.array_equal(Y_train[:, 1], civ_train)
+    _, _, expected_rating_train, _ = train_test_split(X, y_rating, test_size=0.2, random_state=42)
+    assert np.array_equal(rating_train, expected_rating_train)
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_train_all_models_results():
+    """One-pass training returns the same result layout as the per-target functions"""
+    X, y_dest, y_civ, y_rating = prepare_features(load_dataset())
+    regression_results, classification_results = train_all_models(X, y_dest, y_civ, y_rating, n_jobs=2)
+
+    assert set(regression_results) == {
+        'Linear Regression_destruction', 'Linear Regression_civilian',
+        'Random Forest_destruction', 'Random Forest_civilian'
+    }
+    assert set(classification_results) == {'Logistic Regression', 'Random Forest'}
+    assert regression_results['Random Forest_destruction']['r2_score'] > 0.95
+
+    # Each target's model predicts its own column of the shared multi-output regressor
+    destruction = regression_results['Random Forest_destruction']['model']
+    civilian = regression_results['Random Forest_civilian']['model']
+    assert civilian.estimator is destruction.estimator
+    assert destruction.predict(X[:5]).shape == (5,)
+    assert np.array_equal(civilian.predict(X[:5]), civilian.estimator.predict(X[:5])[:, 1])
@@ -0,0 +1,72 @@
+"""
+Tests for the model registry
+Run from the ProjectV2 directory: pytest test_model_registry.py
+"""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from fighter_jet.model_registry import LazyModel, ModelRegistry
+
+
+def training_data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, (200, 5))
+    y = X @ np.arange(1, 6)
+    return X, y
+
+
+def test_get_or_train_reuses_saved_model(tmp_path):
+    """A second run with the same data and hyperparameters loads instead of training"""
+    registry = ModelRegistry(tmp_path)
+    X, y = training_data()
+    names = [f"f{i}" for i in range(5)]
+
+    model, metadata, trained = registry.get_or_train("rf", RandomForestRegressor(n_estimators=5, random_state=0), X, y, names)
+    assert trained
+    assert metadata["feature_names"] == names
+    assert registry.names() == ["rf"]
+
+    reused, _, trained = registry.get_or_train("rf", RandomForestRegressor(n_estimators=5, random_state=0), X, y, names)
+    assert not trained
+    assert isinstance(reused, LazyModel) and not reused.loaded
+    assert np.array_equal(reused.predict(X), model.predict(X))
+    assert reused.loaded
+
+    # Changed hyperparameters or data retrain
+    _, _, trained = registry.get_or_train("rf", RandomForestRegressor(n_estimators=6, random_state=0), X, y, names)
+    assert trained
+    _, _, trained = registry.get_or_train("rf", RandomForestRegressor(n_estimators=6, random_state=0), X, y + 1, names)
+    assert trained
+
+
+def test_update_metrics(tmp_path):
+    """Metrics are stored alongside the model"""
+    registry = ModelRegistry(tmp_path)
+    X, y = training_data()
+    registry.get_or_train("rf", RandomForestRegressor(n_estimators=5, random_state=0), X, y, ["a", "b", "c", "d", "e"])
+    registry.update_metrics("rf", {"rmse": 1.5})
+    assert registry.lazy("rf").metadata["metrics"] == {"rmse": 1.5}
+    assert registry.metadata("missing") is None
+
+
+def test_failed_save_keeps_previous_model(tmp_path, monkeypatch):
+    """A save that dies part way leaves the saved model loadable and no temporary files"""
+    import joblib
+
+    registry = ModelRegistry(tmp_path)
+    X, y = training_data()
+    model, _, _ = registry.get_or_train("rf", RandomForestRegressor(n_estimators=5, random_state=0), X, y, list("abcde"))
+
+    def crashing_dump(value, filename):
+        with open(filename, "wb") as file:
+            file.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(joblib, "dump", crashing_dump)
+    with pytest.raises(OSError):
+        registry.save("rf", model, list("abcde"), "other-hash")
+
+    assert np.array_equal(registry.load("rf").predict(X), model.predict(X))
+    assert registry.metadata("rf")["dataset_hash"] != "other-hash"
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".joblib", ".json"]
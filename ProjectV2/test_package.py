@@ -0,0 +1,57 @@
+"""
+Tests for the package layout and public API
+Run from the ProjectV2 directory: pytest test_package.py
+"""
+
+import os
+import subprocess
+import sys
+import importlib
+import pytest
+import fighter_jet
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_public_api_names_resolve():
+    for name in fighter_jet.__all__:
+        assert getattr(fighter_jet, name) is not None
+
+
+def test_import_from_any_directory(tmp_path):
+    """The engine imports with the source checkout on the path, from an unrelated working directory"""
+    code = "import fighter_jet; print(fighter_jet.calculate_mission_score('F-35A', 'bridge', 'clear', 'night'))"
+    env = {**os.environ, "PYTHONPATH": HERE}
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == str(fighter_jet.calculate_mission_score("F-35A", "bridge", "clear", "night"))
+
+
+def test_entry_points_and_modules_exist():
+    """Everything installed lives in the fighter_jet package and every console script resolves"""
+    tomllib = pytest.importorskip("tomllib")
+    with open(os.path.join(HERE, "pyproject.toml"), "rb") as file:
+        config = tomllib.load(file)
+
+    assert config["tool"]["setuptools"]["packages"] == ["fighter_jet"]
+    assert "py-modules" not in config["tool"]["setuptools"]
+
+    for target in config["project"]["scripts"].values():
+        module, function = target.split(":")
+        assert module.startswith("fighter_jet.")
+        assert callable(getattr(importlib.import_module(module), function))
+
+
+def test_default_paths_are_per_user(tmp_path):
+    """The mission table cache and model registry default to the XDG directories, not the package"""
+    code = (
+        "from fighter_jet import mission_planner, model_registry\n"
+        "mission_planner.main(['F-35A', 'bridge', 'clear', 'night'])\n"
+        "print(model_registry.DEFAULT_REGISTRY_DIR)"
+    )
+    env = {key: value for key, value in os.environ.items() if key not in ("MISSION_TABLE_CACHE", "MODEL_REGISTRY_DIR")}
+    env.update(PYTHONPATH=HERE,
+               XDG_CACHE_HOME=str(tmp_path / "cache"), XDG_DATA_HOME=str(tmp_path / "data"))
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+
+    assert (tmp_path / "cache" / "fighter_jet" / "mission_table.bin").exists()
+    assert result.stdout.splitlines()[-1] == str(tmp_path / "data" / "fighter_jet" / "models")
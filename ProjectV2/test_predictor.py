@@ -0,0 +1,89 @@
+"""
+Tests for the in-process inference API
+Run from the ProjectV2 directory: pytest test_predictor.py
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from fighter_jet.ml_models import prepare_features
+from fighter_jet.predictor import Predictor
+
+
+def predictor_codes():
+    """Registry codes of the two scenarios used below"""
+    from fighter_jet.scoring import encode_scenarios
+    return encode_scenarios(["F-35A", "B-2"], ["bridge", "warehouse"], ["clear", "storm"], ["night", "morning"])
+
+
+@pytest.fixture(scope="module")
+def predictor():
+    df = pd.read_csv("complete_training_data.csv")
+    X, y_dest, y_civ, y_rating = prepare_features(df)
+    regressor = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, np.column_stack([y_dest, y_civ]))
+    classifier = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y_rating)
+    with Predictor(regressor, classifier, batch_window=0.01) as predictor:
+        yield predictor
+
+
+def test_predict_names_and_codes(predictor):
+    """Names and registry codes give the same predictions"""
+    by_name = predictor.predict(["F-35A", "B-2"], ["bridge", "warehouse"], ["clear", "storm"], ["night", "morning"])
+    by_code = predictor.predict(*predictor_codes())
+    for names_output, codes_output in zip(by_name, by_code):
+        assert np.array_equal(names_output, codes_output)
+    assert by_name[2].shape == (2,)
+
+
+def test_micro_batched_calls_match_predict(predictor):
+    """Concurrent predict_one calls return the same values as one vectorized call"""
+    scenarios = [("F-35A", "bridge", "clear", "night"), ("B-2", "warehouse", "storm", "morning")] * 20
+    destruction, civilian, ratings = predictor.predict(*zip(*scenarios))
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda scenario: predictor.predict_one(*scenario), scenarios))
+
+    assert results == list(zip(destruction.tolist(), civilian.tolist(), ratings.tolist()))
+    stats = predictor.latency.summary()
+    assert stats['single']['count'] >= len(scenarios)
+    assert stats['single']['p99_ms'] >= stats['single']['p50_ms']
+
+
+def test_unknown_name(predictor):
+    with pytest.raises(KeyError):
+        predictor.predict_one("X-99", "bridge", "clear", "night")
+
+
+def test_backends_agree(predictor):
+    """Compiled and grid backends give the sklearn predictions"""
+    codes = predictor_codes()
+    destruction, civilian, ratings = predictor.predict(*codes)
+    for backend in ("compiled", "grid"):
+        with Predictor(predictor.regressor, predictor.classifier, backend=backend) as other:
+            other_destruction, other_civilian, other_ratings = other.predict(*codes)
+            np.testing.assert_allclose(other_destruction, destruction, rtol=1e-12)
+            np.testing.assert_allclose(other_civilian, civilian, rtol=1e-12)
+            assert np.array_equal(other_ratings, ratings)
+
+
+def test_caller_models_are_not_changed():
+    """n_jobs is applied to the predictor's copies, not to the models passed in"""
+    X, y_dest, y_civ, y_rating = prepare_features(pd.read_csv("complete_training_data.csv"))
+    regressor = RandomForestRegressor(n_estimators=2, n_jobs=3, random_state=0).fit(X, np.column_stack([y_dest, y_civ]))
+    classifier = RandomForestClassifier(n_estimators=2, n_jobs=3, random_state=0).fit(X, y_rating)
+    predictor = Predictor(regressor, classifier, n_jobs=1)
+    assert (regressor.n_jobs, classifier.n_jobs) == (3, 3)
+    assert (predictor.regressor.n_jobs, predictor.classifier.n_jobs) == (1, 1)
+
+
+@pytest.mark.parametrize("backend", ["sklearn", "compiled", "grid"])
+def test_out_of_range_codes(predictor, backend):
+    """Negative or too-large codes raise instead of indexing the wrong scenario"""
+    checked = predictor if backend == "sklearn" else Predictor(predictor.regressor, predictor.classifier, backend=backend)
+    aircraft, target, weather, time_of_day = predictor_codes()
+    with pytest.raises(ValueError):
+        checked.predict(aircraft, target, weather, np.array([0, -1]))
+    with pytest.raises(ValueError):
+        checked.predict(aircraft + 100, target, weather, time_of_day)
@@ -0,0 +1,55 @@
+"""
+Tests for the logging and progress channel
+Run from the ProjectV2 directory: pytest test_progress.py
+"""
+
+import io
+import json
+import logging
+from fighter_jet import progress
+from fighter_jet.progress import Progress, configure_logging, get_logger
+from fighter_jet.data_generator import generate_training_data
+from fighter_jet.evaluation import analyze_model_performance, evaluate_on_fresh_data, load_trained_models
+
+
+def test_library_is_silent_by_default(capsys, tmp_path):
+    df = generate_training_data(num_samples=100)
+    analyze_model_performance(df)
+    load_trained_models(tmp_path)
+    evaluate_on_fresh_data(num_test=5)
+    captured = capsys.readouterr()
+    assert captured.out == "" and captured.err == ""
+
+
+def test_progress_is_rate_limited():
+    logger = get_logger("test_progress")
+    stream = io.StringIO()
+    configure_logging("INFO", "json", stream)
+    try:
+        # A long interval allows no intermediate updates, only the final totals
+        with Progress(logger, "Counting", total=1000, interval=3600) as counter:
+            for _ in range(1000):
+                counter.update(1)
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [event['event'] for event in events] == ['done']
+        assert events[0]['done'] == 1000 and events[0]['rows_per_s'] > 0
+
+        # Without an interval every update is reported, with an ETA
+        stream.truncate(0)
+        stream.seek(0)
+        with Progress(logger, "Counting", total=10, interval=0) as counter:
+            counter.update(4)
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [event['event'] for event in events] == ['progress', 'done']
+        assert events[0]['done'] == 4 and events[0]['total'] == 10 and events[0]['eta_s'] is not None
+    finally:
+        logging.getLogger(progress.ROOT_LOGGER).handlers[:] = [logging.NullHandler()]
+        logging.getLogger(progress.ROOT_LOGGER).setLevel(logging.NOTSET)
+
+
+def test_disabled_progress_does_not_time():
+    counter = Progress(get_logger("test_progress"), "Counting")
+    assert not counter.enabled
+    counter.update(5)
+    counter.close()
+    assert counter.done == 5
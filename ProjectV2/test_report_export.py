@@ -0,0 +1,144 @@
+"""
+Tests for the bulk report export
+Run from the ProjectV2 directory: pytest test_report_export.py
+"""
+
+import contextlib
+import io
+import itertools
+import json
+from html.parser import HTMLParser
+import numpy as np
+import pytest
+from fighter_jet.utils import (
+    AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES,
+    AIRCRAFT_IDS, TARGET_IDS, WEATHER_IDS, TIME_IDS, RATING_CODES,
+    calculate_mission_score, assign_mission_rating
+)
+import fighter_jet_rules
+from fighter_jet_rules import AircraftSpec, generate_mission_report
+from fighter_jet.report_export import export_reports, render_chunk, main
+
+REQUESTS = (
+    "aircraft,target,weather,time\n"
+    "f-35,bridge,clear,night\n"
+    "X-99,bridge,clear,night\n"
+    "F-15E,concrete_bunker,heavy_rain,afternoon\n"
+    "f35,bridge,clear,night\n"
+)
+
+EXPECTED = [("F-35A", "bridge", "clear", "night"), ("F-15E", "concrete_bunker", "heavy_rain", "afternoon"),
+            ("F-35A", "bridge", "clear", "night")]
+
+
+def printed_reports(scenarios):
+    out = io.StringIO()
+    for scenario in scenarios:
+        dest_prob, civ_risk = calculate_mission_score(*scenario)
+        generate_mission_report(*scenario, dest_prob, civ_risk, assign_mission_rating(dest_prob, civ_risk), file=out)
+    return out.getvalue()
+
+
+class TagChecker(HTMLParser):
+    """Checks that every element is closed in order and counts the sections"""
+
+    def __init__(self):
+        super().__init__()
+        self.open = []
+        self.sections = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "meta":
+            self.open.append(tag)
+        self.sections += tag == "section"
+
+    def handle_endtag(self, tag):
+        assert self.open.pop() == tag
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_text_export_matches_printed_reports(tmp_path, chunk_size):
+    """Test text reports are the bytes the interactive report prints, bad rows go to the error file"""
+    (tmp_path / "missions.csv").write_text(REQUESTS)
+    exported, rejected = export_reports(str(tmp_path / "reports.txt"), str(tmp_path / "missions.csv"), chunk_size=chunk_size)
+    assert (exported, rejected) == (3, 1)
+    assert (tmp_path / "reports.txt").read_text() == printed_reports(EXPECTED)
+
+    errors = [json.loads(line) for line in (tmp_path / "reports.errors.jsonl").read_text().splitlines()]
+    assert [error["row"] for error in errors] == [2]
+
+
+def test_grid_export_in_worker_processes(tmp_path):
+    """Test the full grid rendered by a process pool is in order and identical to a serial export"""
+    exported, rejected = export_reports(str(tmp_path / "grid.txt"), workers=2, chunk_size=500)
+    assert (exported, rejected) == (len(AIRCRAFT_NAMES) * len(TARGET_NAMES) * len(WEATHER_NAMES) * len(TIME_NAMES), 0)
+    grid = itertools.product(AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES)
+    assert (tmp_path / "grid.txt").read_text() == printed_reports(grid)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_json_export(tmp_path, chunk_size):
+    """Test JSON records carry the scores and the text report's recommendations"""
+    (tmp_path / "missions.csv").write_text(REQUESTS)
+    export_reports(str(tmp_path / "reports.json"), str(tmp_path / "missions.csv"), chunk_size=chunk_size)
+    records = json.loads((tmp_path / "reports.json").read_text())
+
+    assert [(r["aircraft"], r["target"], r["weather"], r["time_of_day"]) for r in records] == EXPECTED
+    for record in records:
+        text = printed_reports([(record["aircraft"], record["target"], record["weather"], record["time_of_day"])])
+        assert f"Target Destruction Probability: {record['destruction_probability']}%" in text
+        assert f"OVERALL MISSION RATING: {record['mission_rating']}" in text
+        assert f"Assessment: {record['assessment']}" in text
+        assert record["recommendations"] == [line[2:] for line in text.splitlines() if line.startswith("- ")]
+    assert records[1]["recommendations"]
+
+
+def test_html_export(tmp_path):
+    """Test the HTML page is well formed with one section per report"""
+    (tmp_path / "missions.csv").write_text(REQUESTS)
+    export_reports(str(tmp_path / "reports.html"), str(tmp_path / "missions.csv"))
+    page = (tmp_path / "reports.html").read_text()
+
+    checker = TagChecker()
+    checker.feed(page)
+    assert checker.open == [] and checker.sections == 3
+    assert "<li>Consider using higher-precision aircraft</li>" in page
+
+
+def test_empty_export_is_valid(tmp_path):
+    """Test an input without valid rows still gives a valid document"""
+    (tmp_path / "missions.csv").write_text("aircraft,target,weather,time\nX-99,bridge,clear,night\n")
+    assert export_reports(str(tmp_path / "reports.json"), str(tmp_path / "missions.csv")) == (0, 1)
+    assert json.loads((tmp_path / "reports.json").read_text()) == []
+
+
+def test_command_line(tmp_path, capsys):
+    """Test the command writes to stdout and reports unknown formats"""
+    (tmp_path / "missions.csv").write_text(REQUESTS)
+    main(["--input", str(tmp_path / "missions.csv"), "--errors", str(tmp_path / "errors.jsonl")])
+    captured = capsys.readouterr()
+    assert captured.out == printed_reports(EXPECTED)
+    assert "Exported 3 reports, rejected 1" in captured.err
+
+    with pytest.raises(SystemExit):
+        with contextlib.redirect_stderr(io.StringIO()):
+            main(["--format", "pdf"])
+
+
+def test_cached_reports_follow_spec_changes(monkeypatch):
+    """Test a spec change in the same process is not answered from the report cache"""
+    result = {
+        'aircraft': np.array([AIRCRAFT_IDS["A-10"]]), 'target': np.array([TARGET_IDS["bridge"]]),
+        'weather': np.array([WEATHER_IDS["clear"]]), 'time_of_day': np.array([TIME_IDS["night"]]),
+        'destruction_probability': np.array([51.0]), 'civilian_risk': np.array([6.0]),
+        'mission_rating': np.array([RATING_CODES["D-RANK"]])
+    }
+    assert "Consider using higher-precision aircraft" in json.loads(render_chunk("json", result))["recommendations"]
+
+    upgraded = tuple(
+        AircraftSpec(id=spec.id, name=spec.name, precision=99 if spec.name == "A-10" else spec.precision,
+                     payload=spec.payload, stealth=spec.stealth, stealth_modifier=spec.stealth_modifier)
+        for spec in fighter_jet_rules.AIRCRAFT
+    )
+    monkeypatch.setattr(fighter_jet_rules, "AIRCRAFT", upgraded)
+    assert "Consider using higher-precision aircraft" not in json.loads(render_chunk("json", result))["recommendations"]
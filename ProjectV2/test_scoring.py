@@ -0,0 +1,91 @@
+"""
+Tests for the vectorized scoring engine
+Run from the ProjectV2 directory: pytest test_scoring.py
+"""
+
+import itertools
+import numpy as np
+import pytest
+from fighter_jet.utils import calculate_mission_score, assign_mission_rating, find_optimal_aircraft, RATINGS, RATING_CODES
+from fighter_jet.scoring import (
+    AIRCRAFT_NAMES,
+    TARGET_NAMES,
+    WEATHER_NAMES,
+    TIME_NAMES,
+    assign_mission_ratings,
+    calculate_mission_scores,
+    encode_scenarios,
+    find_optimal_aircraft_batch,
+    round_like_python
+)
+
+
+def all_scenarios():
+    """Every (aircraft, target, weather, time) combination"""
+    return list(itertools.product(AIRCRAFT_NAMES, TARGET_NAMES, WEATHER_NAMES, TIME_NAMES))
+
+
+def test_batch_matches_scalar_on_full_grid():
+    """Batch scores must be bit-identical to the scalar function everywhere"""
+    scenarios = all_scenarios()
+    dest, civ = calculate_mission_scores(*encode_scenarios(*zip(*scenarios)))
+
+    for i, scenario in enumerate(scenarios):
+        assert (dest[i], civ[i]) == calculate_mission_score(*scenario)
+
+
+def test_batch_ratings_match_scalar():
+    """Vectorized ratings agree with assign_mission_rating on every grid score"""
+    scenarios = all_scenarios()
+    dest, civ = calculate_mission_scores(*encode_scenarios(*zip(*scenarios)))
+    codes = assign_mission_ratings(dest, civ)
+    assert codes.dtype == np.uint8
+    assert [RATINGS[code] for code in codes] == [assign_mission_rating(d, c) for d, c in zip(dest, civ)]
+
+
+def test_batch_ratings_match_scalar_on_threshold_grid():
+    """Every (destruction, civilian) pair at 0.1 resolution, including each threshold, rates the same"""
+    values = np.arange(1001) / 10
+    dest, civ = (grid.ravel() for grid in np.meshgrid(values, values, indexing='ij'))
+    codes = assign_mission_ratings(dest, civ)
+
+    expected = [RATING_CODES[assign_mission_rating(d, c)] for d, c in zip(dest.tolist(), civ.tolist())]
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == expected
+
+
+def test_round_like_python():
+    """Ties that np.round gets wrong must round the same way as round()"""
+    values = [22.95, 19.95, 58.650000000000006, 48.45, 33.15, 0.25, 0.35, 99.9, 0.0]
+    expected = [round(value, 1) for value in values]
+    assert round_like_python(values, 1).tolist() == expected
+
+    values = np.random.default_rng(0).uniform(0, 100, 10000)
+    expected = [round(value, 1) for value in values.tolist()]
+    assert round_like_python(values, 1).tolist() == expected
+
+
+def test_batch_broadcasting():
+    """Scalar codes broadcast against arrays of codes"""
+    dest, civ = calculate_mission_scores(np.arange(len(AIRCRAFT_NAMES)), 0, 0, 0)
+    assert dest.shape == civ.shape == (len(AIRCRAFT_NAMES),)
+
+
+def test_encode_unknown_name():
+    """Unknown names are rejected like the scalar lookups"""
+    with pytest.raises(KeyError):
+        encode_scenarios(["X-99"], ["bridge"], ["clear"], ["night"])
+
+
+def test_batch_optimizer_matches_scalar():
+    """Batched optimizer must pick the same aircraft as find_optimal_aircraft in every cell"""
+    queries = list(itertools.product(range(len(TARGET_NAMES)), range(len(WEATHER_NAMES)), range(len(TIME_NAMES))))
+    best, best_rating, dest, civ, ratings = find_optimal_aircraft_batch(*map(np.array, zip(*queries)))
+    assert dest.shape == civ.shape == ratings.shape == (len(queries), len(AIRCRAFT_NAMES))
+
+    for i, (target, weather, time_of_day) in enumerate(queries):
+        best_aircraft, rating, results = find_optimal_aircraft(TARGET_NAMES[target], WEATHER_NAMES[weather], TIME_NAMES[time_of_day])
+        assert AIRCRAFT_NAMES[best[i]] == best_aircraft
+        assert RATINGS[best_rating[i]] == rating
+        for a, aircraft in enumerate(AIRCRAFT_NAMES):
+            assert results[aircraft] == (RATINGS[ratings[i, a]], dest[i, a], civ[i, a])
@@ -0,0 +1,160 @@
+"""
+Tests for the assessment HTTP service
+Run from the ProjectV2 directory: pytest test_service.py
+"""
+
+import asyncio
+import json
+from http import HTTPStatus
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from fighter_jet.utils import calculate_mission_score, assign_mission_rating
+from fighter_jet.ml_models import prepare_features
+from fighter_jet.predictor import Predictor
+from fighter_jet import service as service_module
+from fighter_jet.service import AssessmentService
+
+MISSION = {"aircraft": "f-35", "target": "BRIDGE", "weather": "clear", "time": "nig"}
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_assess_matches_rule_engine():
+    """Names are matched like the CLI and scores come from the rule engine"""
+    service = AssessmentService()
+    status, payload = run(service.handle("POST", "/assess", json.dumps(MISSION).encode()))
+    assert status == HTTPStatus.OK
+
+    dest_prob, civ_risk = calculate_mission_score("F-35A", "bridge", "clear", "night")
+    assert payload == {
+        "aircraft": "F-35A", "target": "bridge", "weather": "clear", "time": "night",
+        "destruction_probability": dest_prob, "civilian_risk": civ_risk,
+        "mission_rating": assign_mission_rating(dest_prob, civ_risk)
+    }
+
+    status, same = run(service.handle("GET", "/assess?aircraft=f-35&target=BRIDGE&weather=clear&time=nig"))
+    assert (status, same) == (HTTPStatus.OK, payload)
+
+
+def test_errors():
+    service = AssessmentService()
+    status, payload = run(service.handle("POST", "/assess", json.dumps({**MISSION, "aircraft": "X-99"}).encode()))
+    assert status == HTTPStatus.BAD_REQUEST and "X-99" in payload["errors"][0]
+
+    assert run(service.handle("POST", "/assess", b"{not json"))[0] == HTTPStatus.BAD_REQUEST
+    assert run(service.handle("GET", "/missing"))[0] == HTTPStatus.NOT_FOUND
+    assert run(service.handle("DELETE", "/assess"))[0] == HTTPStatus.METHOD_NOT_ALLOWED
+    assert run(service.handle("POST", "/predict", json.dumps(MISSION).encode()))[0] == HTTPStatus.SERVICE_UNAVAILABLE
+
+    # Batches report errors per mission
+    body = json.dumps({"missions": [MISSION, {"aircraft": "B-2"}]}).encode()
+    status, payload = run(service.handle("POST", "/assess/batch", body))
+    assert status == HTTPStatus.OK
+    assert payload["results"][0]["aircraft"] == "F-35A" and "errors" in payload["results"][1]
+
+
+def test_optimal_and_predict():
+    df = pd.read_csv("complete_training_data.csv")
+    X, y_dest, y_civ, y_rating = prepare_features(df)
+    predictor = Predictor(
+        RandomForestRegressor(n_estimators=5, random_state=0).fit(X, np.column_stack([y_dest, y_civ])),
+        RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y_rating)
+    )
+    service = AssessmentService(predictor)
+
+    status, payload = run(service.handle("POST", "/optimal", json.dumps({"target": "bridge", "weather": "storm", "time": "night"}).encode()))
+    assert status == HTTPStatus.OK and payload["best_aircraft"] in payload["aircraft"]
+
+    status, payload = run(service.handle("POST", "/predict", json.dumps({"missions": [MISSION] * 3}).encode()))
+    assert status == HTTPStatus.OK and len(payload["results"]) == 3
+    expected = predictor.predict(["F-35A"], ["bridge"], ["clear"], ["night"])
+    assert payload["results"][0]["destruction_probability"] == expected[0][0]
+
+
+def test_http_keep_alive():
+    """Two requests over one HTTP/1.1 connection"""
+    async def exchange():
+        service = AssessmentService()
+        server = await service.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        responses = []
+        for _ in range(2):
+            body = json.dumps(MISSION).encode()
+            writer.write(b"POST /assess HTTP/1.1\r\nHost: test\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+            await writer.drain()
+            status_line = await reader.readline()
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            responses.append((status_line, json.loads(await reader.readexactly(int(headers["content-length"])))))
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        service.close()
+        return responses
+
+    responses = run(exchange())
+    assert [status for status, _ in responses] == [b"HTTP/1.1 200 OK\r\n"] * 2
+    assert responses[0][1]["aircraft"] == "F-35A"
+
+
+class FailingPredictor:
+    def predict(self, *columns):
+        raise RuntimeError("model file is corrupt")
+
+
+def test_route_failure_is_500(caplog):
+    """An unexpected error in a route is logged and answered with 500"""
+    service = AssessmentService(FailingPredictor())
+    status, payload = run(service.handle("POST", "/predict", json.dumps(MISSION).encode()))
+    service.close()
+    assert status == HTTPStatus.INTERNAL_SERVER_ERROR and payload == {"errors": ["Internal server error"]}
+    assert "model file is corrupt" in caplog.text
+
+
+@pytest.mark.parametrize("request_head", [
+    b"POST /assess HTTP/1.1\r\nContent-Length: ten\r\n\r\n",
+    b"POST /assess HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+    b"GET /assess?" + b"a" * 100000 + b" HTTP/1.1\r\n\r\n",
+])
+def test_malformed_request_is_400(request_head):
+    """Bad Content-Length values and over-long lines get a 400 response instead of a dropped connection"""
+    async def exchange():
+        service = AssessmentService()
+        server = await service.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request_head)
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        service.close()
+        return status_line
+
+    assert run(exchange()) == b"HTTP/1.1 400 Bad Request\r\n"
+
+
+def test_backend_errors_exit_cleanly(monkeypatch, capsys):
+    """Unknown backends are rejected by the parser and load failures exit with a message"""
+    with pytest.raises(SystemExit) as exit_info:
+        service_module.main(["--backend", "gird"])
+    assert exit_info.value.code == 2
+
+    def broken_predictor(backend):
+        raise ValueError("compiled backend needs random forests")
+
+    monkeypatch.setattr(service_module, "load_predictor", broken_predictor)
+    with pytest.raises(SystemExit) as exit_info:
+        service_module.main(["--backend", "compiled"])
+    assert exit_info.value.code == 1
+    assert "compiled backend needs random forests" in capsys.readouterr().err
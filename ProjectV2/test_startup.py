@@ -0,0 +1,39 @@
+"""
+Modules loaded by the CLI entry points (the startup time itself is tracked
+by the rule_based_startup case in benchmarks.py)
+Run from the ProjectV2 directory: pytest test_startup.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("numpy", "pandas", "sklearn", "matplotlib", "joblib")
+
+RULE_BASED_PATH = """
+import contextlib, io, json, sys
+from fighter_jet import mission_planner
+with contextlib.redirect_stdout(io.StringIO()):
+    mission_planner.assess_mission(*mission_planner.validate_inputs("F-35A", "military_base", "clear", "night"))
+print(json.dumps([name for name in %r if name in sys.modules]))
+""" % (HEAVY_MODULES,)
+
+
+def run_python(code):
+    directory = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, "PYTHONPATH": directory}
+    result = subprocess.run([sys.executable, "-c", code], cwd=directory, env=env, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def test_rule_based_assessment_startup():
+    """The rule-based CLI path loads no third-party packages"""
+    assert json.loads(run_python(RULE_BASED_PATH)) == []
+
+
+def test_ml_modules_import_lazily():
+    """Importing the ML modules does not pull in pandas, sklearn or matplotlib"""
+    code = ("import sys; from fighter_jet import ml_models, evaluation, dataset_io, predictor, service, batch_assessment; "
+            "print(sorted(name for name in ('pandas', 'sklearn', 'matplotlib', 'joblib') if name in sys.modules))")
+    assert run_python(code).strip() == "[]"